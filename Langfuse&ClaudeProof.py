@@ -10,10 +10,20 @@
 #   LANGFUSE_SECRET_KEY=sk-lf-...
 #   LANGFUSE_BASE_URL=https://cloud.langfuse.com  (or https://us.cloud.langfuse.com)
 #   ANTHROPIC_API_KEY=sk-ant-...
+#   ENABLE_OTEL_ANTHROPIC=1        (opt-in: instrument the Anthropic SDK)
+#   SCRAPE_SAMPLE_RATE=0.1         (optional: head-sampling ratio, default 1.0)
+#   LANGFUSE_MAX_IO_SIZE=100000    (optional: max chars of traced input/output)
+#
+# Standalone script only — linkedin_api.py / main_api.py must never import
+# it. Instrumentation wraps every Anthropic call with span creation, so it
+# is opt-in and bound to a private TracerProvider rather than the global one.
 # -------------------------------------
 
+import atexit
 import os
 import sys
+
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,21 +31,64 @@ load_dotenv()
 # ── Step 1: Check env vars ──────────────────────────────────────────────
 
 requiredVars = ["LANGFUSE_PUBLIC_KEY", "LANGFUSE_SECRET_KEY", "LANGFUSE_BASE_URL"]
-missingVars = [v for v in requiredVars if not os.getenv(v)]
+env = {
+    k: os.environ.get(k)
+    for k in requiredVars + [
+        "ANTHROPIC_API_KEY", "ENABLE_OTEL_ANTHROPIC", "SCRAPE_SAMPLE_RATE", "LANGFUSE_MAX_IO_SIZE",
+    ]
+}
+missingVars = [v for v in requiredVars if not env[v]]
 
 if missingVars:
     print(f"ERROR: Missing env vars: {', '.join(missingVars)}")
     print("Add them to your .env file.")
     sys.exit(1)
 
-print(f"Langfuse URL: {os.getenv('LANGFUSE_BASE_URL')}")
+print(f"Langfuse URL: {env['LANGFUSE_BASE_URL']}")
 print()
 
+# ── Trace payload guard ─────────────────────────────────────────────────
+
+maxIoSize = int(env["LANGFUSE_MAX_IO_SIZE"] or "100000")
+
+
+def truncate(text):
+    """Cap a string at LANGFUSE_MAX_IO_SIZE chars so one trace can't balloon to MBs."""
+    return text if len(text) <= maxIoSize else text[:maxIoSize] + "...<truncated>"
+
+
+def truncateIo(*, data, **kwargs):
+    """Langfuse mask hook: bound traced input/output size before export."""
+    if isinstance(data, str):
+        return truncate(data)
+    try:
+        raw = orjson.dumps(data)
+    except TypeError:
+        return data
+    if len(raw) <= maxIoSize:
+        return data
+    return truncate(raw.decode())
+
+
 # ── Step 2: Test Langfuse auth ──────────────────────────────────────────
 
-from langfuse import get_client
+# Batch span export by size/interval instead of one POST per span
+os.environ.setdefault("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "50")
+os.environ.setdefault("OTEL_BSP_SCHEDULE_DELAY", "5000")
 
-langfuse = get_client()
+from langfuse import Langfuse
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+# Private provider: Langfuse exports from it, the global provider stays no-op.
+# Head sampling drops whole traces up front — long-running servers should set
+# SCRAPE_SAMPLE_RATE well below 1.0; this one-shot proof keeps every trace.
+sampleRate = float(env["SCRAPE_SAMPLE_RATE"] or "1.0")
+privateTp = TracerProvider(sampler=ParentBased(TraceIdRatioBased(sampleRate)))
+langfuse = Langfuse(tracer_provider=privateTp, flush_at=50, flush_interval=5.0, mask=truncateIo)
+# Drain whatever is still buffered exactly once, on any exit path. Flush the
+# private provider itself: Langfuse.flush() only reaches the global one.
+atexit.register(privateTp.force_flush)
 
 if langfuse.auth_check():
     print("[OK] Langfuse client authenticated successfully!")
@@ -46,19 +99,21 @@ print()
 
 # ── Step 3: Instrument Anthropic SDK with OpenTelemetry ─────────────────
 
-from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
+if env["ENABLE_OTEL_ANTHROPIC"] == "1":
+    from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
 
-AnthropicInstrumentor().instrument()
-print("[OK] Anthropic SDK instrumented with OpenTelemetry (Langfuse tracing active)")
+    AnthropicInstrumentor().instrument(tracer_provider=privateTp)
+    print("[OK] Anthropic SDK instrumented with OpenTelemetry (Langfuse tracing active)")
+else:
+    print("[SKIP] ENABLE_OTEL_ANTHROPIC != 1 -- Anthropic SDK not instrumented.")
 print()
 
 # ── Step 4: Make a traced Anthropic call ────────────────────────────────
 
-anthropicKey = os.getenv("ANTHROPIC_API_KEY", "")
+anthropicKey = env["ANTHROPIC_API_KEY"] or ""
 if not anthropicKey:
     print("[SKIP] ANTHROPIC_API_KEY not set -- skipping live API call.")
     print("       Langfuse auth works though! Add the key to test a traced call.")
-    langfuse.flush()
     sys.exit(0)
 
 import anthropic
@@ -83,12 +138,11 @@ responseText = message.content[0].text
 inputTokens = message.usage.input_tokens
 outputTokens = message.usage.output_tokens
 
-print(f"[OK] Claude response: {responseText}")
+print(f"[OK] Claude response: {truncate(responseText)}")
 print(f"     Input tokens:  {inputTokens}")
 print(f"     Output tokens: {outputTokens}")
 print()
 
-# Flush traces to Langfuse before exiting
-langfuse.flush()
-print("[OK] Traces flushed to Langfuse -- check your dashboard!")
-print(f"     Dashboard: {os.getenv('LANGFUSE_BASE_URL')}")
+# Remaining traces are flushed by the atexit hook registered above
+print("[OK] Traces queued for Langfuse -- check your dashboard!")
+print(f"     Dashboard: {env['LANGFUSE_BASE_URL']}")
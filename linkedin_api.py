@@ -1,11 +1,28 @@
 """
 ProspectKeeper — Unified FastAPI Service
 =========================================
-Serves both the LinkedIn scraper and outbound email endpoints.
+Serves both the LinkedIn scraper and outbound email endpoints, plus the
+Zapier inbound-email webhook (POST /webhooks/inbound-email, mounted from
+prospectkeeper.adapters.webhook_adapter; send X-API-Key from the Zap).
 The React frontend proxies all /api/* requests here.
 
 Start:
-    uvicorn linkedin_api:app --reload --port 8001
+    uvicorn linkedin_api:app --reload --port 8001     # development
+    python linkedin_api.py                            # production
+
+    The production entry point runs uvicorn with the uvloop event loop and the
+    httptools parser, and LINKEDIN_WORKERS (default 2) worker processes. Each
+    worker holds its own NoDriverAdapter singleton and scrape semaphore —
+    intentional, so browser sessions stay isolated per process.
+
+    Each worker starts a pool of BROWSER_POOL_SIZE warm Chromes at startup
+    (default: LINKEDIN_MAX_CONCURRENCY) and checks one out per scrape,
+    replacing each after BROWSER_POOL_RECYCLE_AFTER (default 100) scrapes.
+    Set LINKEDIN_WARM_BROWSER=0 to launch a browser per scrape instead.
+
+    Successful scrapes are cached per worker for LINKEDIN_SCRAPE_CACHE_TTL
+    seconds (default 3600; 0 disables), keyed by (linkedin_url, organization,
+    contact_name), so retries and re-renders skip the browser entirely.
 
 Interactive docs:
     http://localhost:8001/docs   (Swagger UI)
@@ -15,24 +32,34 @@ Authentication:
     Pass the API key in the X-API-Key header.
     Set the key via the LINKEDIN_API_KEY environment variable (defaults to
     "dev-key" when unset so local testing works without configuration).
+
+Tracing:
+    Langfuse exports spans from its own background thread (flush_at /
+    flush_interval). Never flush from a request handler — a synchronous
+    flush blocks the response on a network round-trip. The only flush (of the
+    private tracer provider) lives in the lifespan shutdown path.
 """
 
 import asyncio
-import base64
 import hashlib
+import hmac
 import json
 import logging
 import os
 import sys
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 import httpx
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, Header, HTTPException, status
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field, HttpUrl
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field
 
 # ── Bootstrap ──────────────────────────────────────────────────────────────
 load_dotenv()
@@ -40,11 +67,20 @@ load_dotenv()
 # Ensure the project root is on sys.path when the file is run directly
 sys.path.insert(0, os.path.dirname(__file__))
 
-from prospectkeeper.adapters.nodriver_adapter import NoDriverAdapter
+from prospectkeeper.adapters.webhook_adapter import configure as configure_webhook
+from prospectkeeper.adapters.webhook_adapter import router as webhook_router
 from prospectkeeper.infrastructure.config import Config
-from prospectkeeper.infrastructure.container import Container
-from prospectkeeper.adapters.supabase_adapter import SupabaseAdapter
-from prospectkeeper.use_cases.verify_contact_agent import VerifyContactAgentUseCase
+
+# Heavy modules (browser adapter, Supabase client, Anthropic SDK, full DI
+# graph) are not imported at module level: the lifespan builds them before the
+# first request, or they load on first use, so importing this module stays cheap.
+if TYPE_CHECKING:
+    import anthropic
+
+    from prospectkeeper.adapters.nodriver_adapter import NoDriverAdapter
+    from prospectkeeper.adapters.supabase_adapter import SupabaseAdapter
+    from prospectkeeper.domain.interfaces.i_linkedin_gateway import LinkedInResult
+    from prospectkeeper.infrastructure.container import Container
 
 logging.basicConfig(
     level=logging.INFO,
@@ -60,19 +96,217 @@ _API_KEY = os.environ.get("LINKEDIN_API_KEY", "dev-key")
 _LANGFUSE_PUBLIC_KEY = os.environ.get("LANGFUSE_PUBLIC_KEY", "")
 _LANGFUSE_SECRET_KEY = os.environ.get("LANGFUSE_SECRET_KEY", "")
 _LANGFUSE_BASE_URL = os.environ.get("LANGFUSE_BASE_URL", "https://cloud.langfuse.com")
+_LANGFUSE_PROJECTS_URL = f"{_LANGFUSE_BASE_URL}/api/public/projects"
+# The v2 endpoint returns only the requested field groups (no input/output
+# payloads or metadata), and up to 1000 rows per page, so the whole history
+# usually arrives in a single small response. Pages follow meta.cursor.
+_LANGFUSE_OBSERVATIONS_URL = f"{_LANGFUSE_BASE_URL}/api/public/v2/observations"
+_LANGFUSE_OBSERVATIONS_PARAMS = {"type": "GENERATION", "fields": "core,basic,model,usage", "limit": 1000}
+
+# ── Claude tracing (opt-in; only the agent's Anthropic client is traced) ───
+_ENABLE_OTEL_ANTHROPIC = os.environ.get("ENABLE_OTEL_ANTHROPIC") == "1"
+_SCRAPE_SAMPLE_RATE = float(os.environ.get("SCRAPE_SAMPLE_RATE", "0.1"))
+
+# ── LinkedIn scraper ───────────────────────────────────────────────────────
+_WARM_BROWSER = os.environ.get("LINKEDIN_WARM_BROWSER", "1") == "1"
+_MAX_CONCURRENCY = int(os.environ.get("LINKEDIN_MAX_CONCURRENCY", "2"))
+_BROWSER_POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", str(_MAX_CONCURRENCY)))
+_BROWSER_POOL_RECYCLE_AFTER = int(os.environ.get("BROWSER_POOL_RECYCLE_AFTER", "100"))
+_SCRAPE_CACHE_TTL_SECONDS = float(os.environ.get("LINKEDIN_SCRAPE_CACHE_TTL", "3600"))
+_SCRAPE_CACHE_MAXSIZE = 1024
+
+# ── Config snapshot (env is static after load_dotenv, so read it once) ─────
+_CONFIG_STATUS = {
+    "anthropic_configured": bool(os.environ.get("ANTHROPIC_API_KEY")),
+    "supabase_configured": bool(os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_SERVICE_KEY")),
+    "langfuse_configured": bool(_LANGFUSE_SECRET_KEY and _LANGFUSE_PUBLIC_KEY),
+    "zerobounce_configured": bool(os.environ.get("ZEROBOUNCE_API_KEY")),
+    "resend_configured": bool(os.environ.get("RESEND_API_KEY")),
+    "batch_limit": int(os.environ.get("BATCH_LIMIT", 50)),
+    "batch_concurrency": int(os.environ.get("BATCH_CONCURRENCY", 5)),
+}
 
 # Sonnet 4.6 pricing (per token)
 _SONNET_INPUT_COST_PER_TOKEN = 3.0 / 1_000_000
 _SONNET_OUTPUT_COST_PER_TOKEN = 15.0 / 1_000_000
 
 
-def _require_api_key(x_api_key: str = Header(..., description="Service API key")) -> None:
-    """Dependency: reject requests with an invalid X-API-Key header."""
-    if x_api_key != _API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or missing API key.",
-        )
+# Paths reachable without an API key (health probes and the interactive docs).
+_PUBLIC_PATHS = frozenset({"/health", "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"})
+_API_KEY_BYTES = _API_KEY.encode()
+_UNAUTHORIZED_BODY = b'{"detail":"Invalid or missing API key."}'
+
+
+class APIKeyASGIMiddleware:
+    """
+    Pure ASGI guard: reject requests with an invalid X-API-Key header.
+
+    Reads the header straight from the raw ``scope`` and answers 401 before
+    routing, so the check costs no Request object or dependency resolution.
+    CORS preflights (OPTIONS) are let through for CORSMiddleware to answer.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in _PUBLIC_PATHS
+            or scope["method"] == "OPTIONS"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                if hmac.compare_digest(value, _API_KEY_BYTES):
+                    await self.app(scope, receive, send)
+                    return
+                break
+
+        await send({
+            "type": "http.response.start",
+            "status": status.HTTP_401_UNAUTHORIZED,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(_UNAUTHORIZED_BODY)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": _UNAUTHORIZED_BODY})
+
+
+# Shared Anthropic client for the agent endpoint (created on first use).
+_anthropic: Optional["anthropic.AsyncAnthropic"] = None
+_tracer_provider = None
+
+
+def _instrument_anthropic() -> None:
+    """
+    Trace Anthropic SDK calls to Langfuse on a private, sampled TracerProvider.
+
+    Runs only when the agent's client is first built, and never installs a
+    global provider — /health and every other route keep the no-op tracer.
+    """
+    global _tracer_provider
+    from langfuse import Langfuse
+    from opentelemetry.instrumentation.anthropic import AnthropicInstrumentor
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    _tracer_provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(_SCRAPE_SAMPLE_RATE)))
+    Langfuse(tracer_provider=_tracer_provider, flush_at=50, flush_interval=5.0)
+    AnthropicInstrumentor().instrument(tracer_provider=_tracer_provider)
+
+
+def _get_anthropic() -> "anthropic.AsyncAnthropic":
+    global _anthropic
+    if _anthropic is None:
+        import anthropic
+
+        if _ENABLE_OTEL_ANTHROPIC:
+            _instrument_anthropic()
+        _anthropic = anthropic.AsyncAnthropic()
+    return _anthropic
+
+
+# ── Langfuse auth status (checked in the background, never on a request) ───
+_LANGFUSE_AUTH_TTL_SECONDS = 300
+_langfuse_auth: dict = {"ok": None, "checked_at": None}
+
+
+async def _check_langfuse(http: httpx.AsyncClient) -> None:
+    """Refresh the cached Langfuse credential check every 5 minutes."""
+    while True:
+        try:
+            resp = await http.get(_LANGFUSE_PROJECTS_URL, timeout=10.0)
+            ok = resp.status_code == 200
+        except httpx.HTTPError as e:
+            logger.warning(f"[Langfuse] Auth check failed: {e}")
+            ok = False
+        _langfuse_auth["ok"] = ok
+        _langfuse_auth["checked_at"] = time.time()
+        await asyncio.sleep(_LANGFUSE_AUTH_TTL_SECONDS)
+
+
+# Credentials are static, so the Basic auth header is encoded once here and
+# attached to the shared client rather than rebuilt on every request.
+_LANGFUSE_AUTH: Optional[httpx.BasicAuth] = (
+    httpx.BasicAuth(_LANGFUSE_PUBLIC_KEY, _LANGFUSE_SECRET_KEY)
+    if _LANGFUSE_PUBLIC_KEY and _LANGFUSE_SECRET_KEY
+    else None
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Own the process-wide resources for the app's lifetime.
+
+    One pooled HTTP/2 client (``app.state.http``) carries every Langfuse call,
+    so keep-alive connections and TLS sessions are reused instead of
+    re-handshaking per request. The DI container (``app.state.container``) is
+    built once here, before any request can race to create it; it stays None
+    when the environment is incomplete, and the routes that need it answer 503.
+    """
+    try:
+        from prospectkeeper.infrastructure.container import Container
+
+        app.state.container = Container(Config.from_env())
+        configure_webhook(app.state.container.process_inbound_email_use_case)
+    except EnvironmentError as e:
+        logger.warning(f"DI container not initialised — email and agent routes disabled: {e}")
+        app.state.container = None
+
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        auth=_LANGFUSE_AUTH,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+        timeout=httpx.Timeout(15.0),
+    )
+    auth_task = (
+        asyncio.create_task(_check_langfuse(app.state.http)) if _LANGFUSE_AUTH is not None else None
+    )
+
+    # Pydantic builds model validators at class definition, but FastAPI renders
+    # the JSON schemas lazily on the first /openapi.json (or /docs) hit — ~70 ms
+    # on that request. Render them now; app.openapi() caches the result.
+    app.openapi()
+
+    # Build the snapshot store now rather than on the first scrape that saves one.
+    try:
+        _get_supabase()
+    except Exception as e:
+        logger.warning(f"Supabase adapter init failed — snapshots will not be saved: {e}")
+
+    # Launch the browser pool once so scrapes skip the browser start-up; if
+    # that fails, each scrape falls back to launching its own browser.
+    if _WARM_BROWSER:
+        try:
+            await _get_adapter().start_pool(_BROWSER_POOL_SIZE)
+        except Exception as e:
+            logger.warning(f"[Tier2] Browser pool warm-up failed — scrapes will launch their own: {e}")
+
+    try:
+        yield
+    finally:
+        if auth_task is not None:
+            auth_task.cancel()
+        # Stop in-flight batches before the container they use is closed
+        batches = list(_running_batches)
+        for task in batches:
+            task.cancel()
+        await asyncio.gather(*batches, return_exceptions=True)
+        if _adapter is not None:
+            await _adapter.stop_pool()
+        await app.state.http.aclose()
+        if app.state.container is not None:
+            await app.state.container.aclose()
+        if _anthropic is not None:
+            await _anthropic.close()
+        # Langfuse.flush() only reaches the global provider, not this one
+        if _tracer_provider is not None:
+            _tracer_provider.force_flush()
 
 
 # ── App ────────────────────────────────────────────────────────────────────
@@ -86,8 +320,16 @@ app = FastAPI(
     version="2.0.0",
     contact={"name": "ProspectKeeper"},
     license_info={"name": "Private"},
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# Registered before CORS so CORSMiddleware stays outermost and 401s still
+# carry the CORS headers the browser needs to read them.
+app.add_middleware(APIKeyASGIMiddleware)
+# ScrapeResponse bodies are 5–40 KB of JSON; SSE streams are excluded by
+# Starlette and NDJSON chunks are sync-flushed, so streaming is unaffected.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000"],
@@ -95,17 +337,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# ── Dependency-Injected Container (lazy init) ─────────────────────────────
-_container: Optional[Container] = None
+# Inbound-email webhook runs on this app's event loop with the lifespan-built
+# container, instead of a second uvicorn server in a side thread.
+app.include_router(webhook_router, tags=["Webhooks"])
 
+# ── Dependency-Injected Container (built in lifespan) ─────────────────────
 
-def _get_container() -> Container:
-    """Lazily initialise the DI container on first use."""
-    global _container
-    if _container is None:
-        config = Config.from_env()
-        _container = Container(config)
-    return _container
+def get_container(request: Request) -> "Container":
+    """FastAPI dependency returning the container built at startup."""
+    container = request.app.state.container
+    if container is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service not configured — required environment variables are missing.",
+        )
+    return container
 
 
 # ── Request / Response schemas ─────────────────────────────────────────────
@@ -113,8 +359,11 @@ def _get_container() -> Container:
 class ScrapeRequest(BaseModel):
     """Parameters for a LinkedIn profile scrape."""
 
-    linkedin_url: HttpUrl = Field(
+    linkedin_url: str = Field(
         ...,
+        # Checked by pydantic-core's compiled regex; the value stays a plain str
+        # so it is handed to the adapter without any URL parse or re-serialise.
+        pattern=r"(?i)^https?://([a-z0-9-]+\.)?linkedin\.com/in/[^/?#\s]+/?$",
         description="Full LinkedIn profile URL, e.g. `https://www.linkedin.com/in/username/`.",
         examples=["https://www.linkedin.com/in/keanuczirjak/"],
     )
@@ -136,6 +385,15 @@ class ScrapeRequest(BaseModel):
         default=None,
         description="UUID of the contact record in Supabase. When provided, the scrape result is saved as a LinkedIn snapshot for freshness tracking.",
     )
+    full_profile: bool = Field(
+        default=False,
+        description=(
+            "Fetch the complete education and skills lists even when the main profile already "
+            "confirms employment at `organization`. When false and employment is confirmed, "
+            "`education` and `skills` are null. Implied when `contact_id` is set, since "
+            "snapshots need the full profile."
+        ),
+    )
 
 
 class ExperienceEntry(BaseModel):
@@ -145,7 +403,7 @@ class ExperienceEntry(BaseModel):
     is_current: Optional[bool] = Field(None, alias="isCurrent", description="True if the date range includes 'Present'.")
     description: Optional[str] = Field(None, description="Role description / bullet points (may be empty).")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class EducationEntry(BaseModel):
@@ -153,7 +411,7 @@ class EducationEntry(BaseModel):
     degree: Optional[str] = Field(None, description="Degree / qualification string.")
     date_range: Optional[str] = Field(None, alias="dateRange", description="Attendance date range.")
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "extra": "ignore"}
 
 
 class ScrapeResponse(BaseModel):
@@ -164,6 +422,8 @@ class ScrapeResponse(BaseModel):
     `blocked=True` means LinkedIn returned an auth-wall or checkpoint page.
     """
 
+    model_config = {"populate_by_name": True, "extra": "ignore"}
+
     success: bool = Field(..., description="True if the profile was scraped without error.")
     blocked: bool = Field(False, description="True if LinkedIn returned an auth-wall — cookies may be expired.")
     error: Optional[str] = Field(None, description="Error message when `success=False`.")
@@ -192,7 +452,44 @@ class ScrapeResponse(BaseModel):
     skills: Optional[list[str]] = Field(None, description="All skills (fetched from the `/details/skills` sub-page when available).")
 
     # Metadata
-    scrape_duration_seconds: Optional[float] = Field(None, description="Wall-clock time taken for the scrape.")
+    scrape_duration_ms: Optional[int] = Field(None, description="Wall-clock time taken for the scrape, in milliseconds.")
+    scrape_duration_seconds: Optional[float] = Field(None, description="Deprecated: `scrape_duration_ms / 1000`, kept for existing clients.")
+
+
+class ScrapeResponseSoA(BaseModel):
+    """
+    Column-oriented (struct-of-arrays) variant of `ScrapeResponse`.
+
+    Experience and education are returned as parallel lists — index `i` of
+    every `experience_*` column describes the same entry — so analytics
+    consumers can load them straight into NumPy/pandas columns.
+    """
+
+    success: bool
+    blocked: bool = False
+    error: Optional[str] = None
+    still_at_organization: Optional[bool] = None
+    employment_confidence: float = 0.0
+    current_title: Optional[str] = None
+    current_organization: Optional[str] = None
+    profile_url: Optional[str] = None
+    name: Optional[str] = None
+    headline: Optional[str] = None
+    location: Optional[str] = None
+
+    titles: list[Optional[str]] = Field(default_factory=list, description="Experience job titles.")
+    companies: list[Optional[str]] = Field(default_factory=list, description="Experience employer names.")
+    date_ranges: list[Optional[str]] = Field(default_factory=list, description="Experience date ranges.")
+    is_current: list[Optional[bool]] = Field(default_factory=list, description="Experience 'Present' flags.")
+    descriptions: list[Optional[str]] = Field(default_factory=list, description="Experience descriptions.")
+
+    institutions: list[Optional[str]] = Field(default_factory=list, description="Education institutions.")
+    degrees: list[Optional[str]] = Field(default_factory=list, description="Education degrees.")
+    education_date_ranges: list[Optional[str]] = Field(default_factory=list, description="Education date ranges.")
+
+    skills: list[str] = Field(default_factory=list)
+    scrape_duration_ms: Optional[int] = None
+    scrape_duration_seconds: Optional[float] = None
 
 
 # ── Langfuse stats schema ──────────────────────────────────────────────────
@@ -218,46 +515,134 @@ class LangfuseStatsResponse(BaseModel):
 
 
 # ── Singleton adapters ─────────────────────────────────────────────────────
-_adapter = NoDriverAdapter()
+_adapter: Optional["NoDriverAdapter"] = None
+
+
+def _get_adapter() -> "NoDriverAdapter":
+    """Create the LinkedIn adapter on the first scrape."""
+    global _adapter
+    if _adapter is None:
+        from prospectkeeper.adapters.nodriver_adapter import NoDriverAdapter
+
+        _adapter = NoDriverAdapter(recycle_after=_BROWSER_POOL_RECYCLE_AFTER)
+    return _adapter
+
+
+# Bounds concurrent browser sessions — each scrape drives a full Chromium instance.
+_scrape_sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+# Scrapes currently running, by the same key as `_scrape_cache` — a duplicate
+# request awaits the running scrape instead of driving a second browser.
+_scrape_inflight: "dict[tuple, asyncio.Task[LinkedInResult]]" = {}
+
+# (linkedin_url, organization, contact_name, full_profile) -> (stored_at, result), LRU order.
+_scrape_cache: "OrderedDict[tuple, tuple[float, LinkedInResult]]" = OrderedDict()
+
+
+def _cached_scrape(key: tuple) -> Optional["LinkedInResult"]:
+    """Return a still-fresh cached result for `key`, or None."""
+    hit = _scrape_cache.get(key)
+    if hit is None:
+        return None
+    stored_at, result = hit
+    if time.monotonic() - stored_at > _SCRAPE_CACHE_TTL_SECONDS:
+        del _scrape_cache[key]
+        return None
+    _scrape_cache.move_to_end(key)
+    return result
+
+
+def _cache_scrape(key: tuple, result: "LinkedInResult") -> None:
+    _scrape_cache[key] = (time.monotonic(), result)
+    _scrape_cache.move_to_end(key)
+    if len(_scrape_cache) > _SCRAPE_CACHE_MAXSIZE:
+        _scrape_cache.popitem(last=False)
 
-_supabase: Optional[SupabaseAdapter] = None
+_supabase: Optional["SupabaseAdapter"] = None
 _supabase_url = os.environ.get("SUPABASE_URL", "")
 _supabase_key = os.environ.get("SUPABASE_SERVICE_KEY", "")
-if _supabase_url and _supabase_key:
-    _supabase = SupabaseAdapter(_supabase_url, _supabase_key)
-    logger.info("Supabase adapter initialised — LinkedIn snapshots will be saved.")
-else:
+if not (_supabase_url and _supabase_key):
     logger.warning("SUPABASE_URL or SUPABASE_SERVICE_KEY not set — snapshots will not be saved.")
 
 
+def _get_supabase() -> Optional["SupabaseAdapter"]:
+    """Return the snapshot store, created at startup or on first use (None when unconfigured)."""
+    global _supabase
+    if _supabase is None and _supabase_url and _supabase_key:
+        from prospectkeeper.adapters.supabase_adapter import SupabaseAdapter
+
+        _supabase = SupabaseAdapter(_supabase_url, _supabase_key)
+        logger.info("Supabase adapter initialised — LinkedIn snapshots will be saved.")
+    return _supabase
+
+
 # ── Snapshot helpers ────────────────────────────────────────────────────────
 
-def _profile_hash(title: Optional[str], org: Optional[str], headline: Optional[str], skills: Optional[list]) -> str:
-    """SHA-256 of normalised key fields. Stable across scrapes when nothing changed."""
-    data = {
-        "title": (title or "").lower().strip(),
-        "org": (org or "").lower().strip(),
-        "headline": (headline or "").lower().strip(),
-        "skills": sorted((s or "").lower().strip() for s in (skills or [])),
-    }
-    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+def _normalise(value: Optional[str]) -> str:
+    """Lower-cased, stripped form of a profile field ('' for None)."""
+    return (value or "").strip().lower()
+
+
+def _profile_hash(title: str, org: str, headline: str, skills: Optional[list]) -> str:
+    """SHA-256 of key fields. Stable across scrapes when nothing changed.
+
+    `title`, `org` and `headline` must already be `_normalise`d; skills are
+    normalised here. Fields are fed to the hash directly, each behind a
+    control-byte tag, so no value can spill into a neighbouring field and no
+    JSON text is built.
+    """
+    h = hashlib.sha256()
+    h.update(b"t\x00")
+    h.update(title.encode())
+    h.update(b"\x01o\x00")
+    h.update(org.encode())
+    h.update(b"\x01h\x00")
+    h.update(headline.encode())
+    h.update(b"\x01s\x00")
+    normalised = [_normalise(s) for s in (skills or [])]
+    normalised.sort()
+    for s in normalised:
+        h.update(b"\x02")
+        h.update(s.encode())
+    return h.hexdigest()
 
 
 def _has_meaningful_data(
-    title: Optional[str],
-    headline: Optional[str],
+    title: str,
+    headline: str,
     experience: Optional[list],
     education: Optional[list],
 ) -> bool:
-    """Return False if all key profile fields are empty — avoids storing a hash of a blank page."""
+    """Return False if all key profile fields are empty — avoids storing a hash of a blank page.
+
+    `title` and `headline` must already be `_normalise`d.
+    """
     return bool(
-        (title or "").strip()
-        or (headline or "").strip()
+        title
+        or headline
         or (experience and len(experience) > 0)
         or (education and len(education) > 0)
     )
 
 
+def _snapshot_changed(prev: Optional[dict], new_hash: str, title: str, org: str, headline: str) -> bool:
+    """True if the profile differs from `prev` (or there is none).
+
+    Equal hashes short-circuit. Unequal ones are confirmed against the stored
+    fields, since rows hashed under another scheme (earlier releases, or
+    main_api's) never match by hash alone. `title`, `org` and `headline`
+    must already be `_normalise`d.
+    """
+    if prev is None:
+        return True
+    if prev.get("profile_hash") == new_hash:
+        return False
+    return (
+        (_normalise(prev.get("current_title")), _normalise(prev.get("current_org")), _normalise(prev.get("headline")))
+        != (title, org, headline)
+    )
+
+
 def _build_change_summary(prev: dict, current_title: Optional[str], current_org: Optional[str], headline: Optional[str]) -> dict:
     """Return only the fields that differ between previous and current scrape."""
     summary = {}
@@ -277,66 +662,96 @@ def _build_change_summary(prev: dict, current_title: Optional[str], current_org:
 
 # ── Routes ─────────────────────────────────────────────────────────────────
 
+# /health is probed constantly and has only three possible bodies, so they are
+# serialised once and returned as-is (no dict, no JSON encoder per probe).
+_HEALTH_RESPONSES = {
+    ok: Response(content=orjson.dumps({"status": "ok", "langfuse_auth": ok}), media_type="application/json")
+    for ok in (None, True, False)
+}
+
+
 @app.get(
     "/health",
     summary="Health check",
-    description="Returns `{\"status\": \"ok\"}`. Use this to verify the service is up before sending scrape requests.",
+    description=(
+        "Returns `{\"status\": \"ok\"}` plus the cached Langfuse credential check "
+        "(`null` until the first background check completes). Use this to verify the "
+        "service is up before sending scrape requests."
+    ),
     tags=["Utility"],
 )
-async def health() -> dict:
-    return {"status": "ok"}
+async def health() -> Response:
+    return _HEALTH_RESPONSES[_langfuse_auth["ok"]]
 
 
 @app.get(
-    "/langfuse-stats",
-    response_model=LangfuseStatsResponse,
-    summary="Claude API usage from Langfuse",
-    description="Queries the Langfuse REST API and returns aggregated token/cost stats for all Claude generations.",
+    "/metrics",
+    summary="Browser pool metrics",
+    description=(
+        "Reports this worker's LinkedIn browser pool: `size` (browsers started), "
+        "`available` (idle in the pool right now), `recycled` (browsers replaced "
+        "so far) and `recycle_after` (scrapes served before a browser is replaced). "
+        "`size` is 0 when the pool is disabled or failed to start."
+    ),
     tags=["Observability"],
 )
-async def langfuse_stats() -> LangfuseStatsResponse:
-    if not _LANGFUSE_PUBLIC_KEY or not _LANGFUSE_SECRET_KEY:
-        raise HTTPException(
-            status_code=503,
-            detail="Langfuse credentials not configured (LANGFUSE_PUBLIC_KEY / LANGFUSE_SECRET_KEY).",
-        )
-
-    auth_bytes = f"{_LANGFUSE_PUBLIC_KEY}:{_LANGFUSE_SECRET_KEY}".encode()
-    auth_header = "Basic " + base64.b64encode(auth_bytes).decode()
+async def metrics() -> dict:
+    return {"browser_pool": _get_adapter().pool_stats()}
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        resp = await client.get(
-            f"{_LANGFUSE_BASE_URL}/api/public/observations",
-            params={"type": "GENERATION", "limit": 50},
-            headers={"Authorization": auth_header},
-        )
 
+def _langfuse_page(resp: httpx.Response) -> dict:
+    """Decode one observations page, mapping a Langfuse error to a 502."""
     if resp.status_code != 200:
         logger.error(f"[Langfuse] API error {resp.status_code}: {resp.text[:300]}")
         raise HTTPException(
             status_code=502,
             detail=f"Langfuse API returned {resp.status_code}.",
         )
+    return orjson.loads(resp.content)
 
-    data = resp.json()
+
+@app.get(
+    "/langfuse-stats",
+    response_model=LangfuseStatsResponse,
+    summary="Claude API usage from Langfuse",
+    description="Queries the Langfuse REST API and returns aggregated token/cost stats for all Claude generations.",
+    tags=["Observability"],
+)
+async def langfuse_stats(request: Request) -> LangfuseStatsResponse:
+    if _LANGFUSE_AUTH is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Langfuse credentials not configured (LANGFUSE_PUBLIC_KEY / LANGFUSE_SECRET_KEY).",
+        )
+
+    http = request.app.state.http
+    data = _langfuse_page(await http.get(_LANGFUSE_OBSERVATIONS_URL, params=_LANGFUSE_OBSERVATIONS_PARAMS))
     observations = data.get("data", [])
-    meta = data.get("meta", {})
-    total_pages_items = meta.get("totalItems", len(observations))
+    cursor = (data.get("meta") or {}).get("cursor")
+    while cursor:
+        data = _langfuse_page(await http.get(
+            _LANGFUSE_OBSERVATIONS_URL, params={**_LANGFUSE_OBSERVATIONS_PARAMS, "cursor": cursor}
+        ))
+        observations.extend(data.get("data", []))
+        cursor = (data.get("meta") or {}).get("cursor")
 
     total_input = 0
     total_output = 0
     total_cost = 0.0
     recent: List[GenerationSummary] = []
+    # Local rebinds keep module-global lookups out of the per-observation loop
+    input_rate = _SONNET_INPUT_COST_PER_TOKEN
+    output_rate = _SONNET_OUTPUT_COST_PER_TOKEN
 
     for obs in observations:
-        usage = obs.get("usage") or {}
+        usage = obs.get("usageDetails") or {}
         inp = usage.get("input") or 0
         out = usage.get("output") or 0
 
         # Prefer Langfuse-calculated cost; fall back to manual pricing
-        cost = obs.get("calculatedTotalCost")
+        cost = obs.get("totalCost")
         if cost is None:
-            cost = inp * _SONNET_INPUT_COST_PER_TOKEN + out * _SONNET_OUTPUT_COST_PER_TOKEN
+            cost = inp * input_rate + out * output_rate
 
         total_input += inp
         total_output += out
@@ -354,138 +769,240 @@ async def langfuse_stats() -> LangfuseStatsResponse:
 
     n = len(observations)
     return LangfuseStatsResponse(
-        total_calls=total_pages_items,
+        total_calls=n,
         total_input_tokens=total_input,
         total_output_tokens=total_output,
         total_tokens=total_input + total_output,
         total_cost_usd=round(total_cost, 6),
         avg_cost_per_call=round(total_cost / n, 6) if n > 0 else 0.0,
         recent=recent,
-        langfuse_dashboard_url=f"{_LANGFUSE_BASE_URL}",
+        langfuse_dashboard_url=_LANGFUSE_BASE_URL,
     )
 
 
+def _employment_confidence(result: "LinkedInResult") -> float:
+    if not result.success or result.blocked:
+        return 0.15
+    if result.still_at_organization is not None:
+        return 0.92
+    return 0.40
+
+
+async def _persist_snapshot(
+    supabase: "SupabaseAdapter", contact_id: str, organization: str, result: "LinkedInResult"
+) -> None:
+    """Save a LinkedIn snapshot for freshness tracking (runs after the response is sent)."""
+    # Normalised once, shared by the emptiness check and the hash
+    title_n = _normalise(result.current_title)
+    headline_n = _normalise(result.headline)
+    if not _has_meaningful_data(title_n, headline_n, result.experience, result.education):
+        logger.warning(
+            f"[Snapshot] Skipped for contact {contact_id} — "
+            f"no meaningful profile data returned (blank page or auth wall)"
+        )
+        return
+
+    try:
+        org_n = _normalise(result.current_organization or organization)
+        new_hash = _profile_hash(title_n, org_n, headline_n, result.skills)
+        prev = await supabase.get_latest_linkedin_snapshot(contact_id)
+        data_changed = _snapshot_changed(prev, new_hash, title_n, org_n, headline_n)
+        change_summary = _build_change_summary(
+            prev or {},
+            result.current_title,
+            result.current_organization or organization,
+            result.headline,
+        ) if data_changed and prev else {}
+
+        # Adapter dicts are trusted and already alias-shaped (dateRange,
+        # isCurrent), so they are stored as-is with no model round-trip.
+        snapshot = {
+            "contact_id":    contact_id,
+            "profile_hash":  new_hash,
+            "data_changed":  data_changed,
+            "headline":      result.headline,
+            "current_title": result.current_title,
+            "current_org":   result.current_organization or organization or None,
+            "location":      result.location,
+            "experience":    result.experience or None,
+            "education":     result.education or None,
+            "skills":        result.skills,
+            "change_summary": change_summary or None,
+        }
+        await supabase.save_linkedin_snapshot(snapshot)
+        logger.info(
+            f"[Snapshot] Saved for contact {contact_id} — "
+            f"changed={data_changed}"
+        )
+    except Exception as snap_err:
+        logger.warning(f"[Snapshot] Failed to save snapshot: {snap_err}")
+
+
+async def _run_scrape(request: ScrapeRequest, full_profile: bool, key: tuple) -> "LinkedInResult":
+    async with _scrape_sem:
+        result = await _get_adapter().verify_employment(
+            contact_name=request.contact_name,
+            organization=request.organization,
+            linkedin_url=request.linkedin_url,
+            full_profile=full_profile,
+        )
+    if result.success and _SCRAPE_CACHE_TTL_SECONDS > 0:
+        _cache_scrape(key, result)
+    return result
+
+
+async def _scrape(request: ScrapeRequest, background_tasks: BackgroundTasks) -> tuple["LinkedInResult", int]:
+    """Run the scrape (shared by both /scrape variants).
+
+    Successful results are served from `_scrape_cache` while fresh; failures
+    (auth wall, timeout, ...) are never cached so the next call retries.
+    Concurrent identical requests share one in-flight scrape.
+    When a `contact_id` is given, the snapshot save is queued on
+    `background_tasks` so its Supabase round-trips happen after the response.
+    Returns `(result, elapsed_ms)`.
+    """
+    t0 = time.perf_counter_ns()
+    logger.info("[API] Scrape request: %s — %s", request.contact_name, request.linkedin_url)
+
+    full_profile = request.full_profile or request.contact_id is not None
+    key = (request.linkedin_url, request.organization, request.contact_name, full_profile)
+    result = _cached_scrape(key) if _SCRAPE_CACHE_TTL_SECONDS > 0 else None
+    if result is not None:
+        logger.info("[API] Scrape cache hit: %s", request.linkedin_url)
+    else:
+        task = _scrape_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(_run_scrape(request, full_profile, key))
+            _scrape_inflight[key] = task
+            task.add_done_callback(lambda _: _scrape_inflight.pop(key, None))
+        else:
+            logger.info("[API] Joining in-flight scrape: %s", request.linkedin_url)
+        # Shielded so one caller going away doesn't cancel the scrape for the rest.
+        result = await asyncio.shield(task)
+
+    elapsed_ms = (time.perf_counter_ns() - t0) // 1_000_000
+    logger.info(
+        "[API] Scrape complete in %d ms — success=%s blocked=%s still_at=%s",
+        elapsed_ms, result.success, result.blocked, result.still_at_organization,
+    )
+
+    supabase = _get_supabase() if result.success and request.contact_id else None
+    if supabase:
+        background_tasks.add_task(
+            _persist_snapshot, supabase, request.contact_id, request.organization, result
+        )
+
+    return result, elapsed_ms
+
+
 @app.post(
     "/scrape",
-    response_model=ScrapeResponse,
     summary="Scrape a LinkedIn profile",
     description=(
-        "Launches a headless Chromium browser via **nodriver**, injects the stored "
-        "LinkedIn session cookies, navigates to the requested profile URL, captures "
-        "the full page HTML, and parses it with BeautifulSoup.\n\n"
+        "Checks out a warm Chromium browser from the worker's pool (driven via **nodriver**, "
+        "with the stored LinkedIn session cookies injected at startup), navigates to "
+        "the requested profile URL, captures "
+        "the full page HTML, and parses it with selectolax.\n\n"
         "Detail sub-pages (`/details/education`, `/details/skills`) are fetched "
         "automatically when linked from the main profile — giving the complete lists "
-        "rather than the truncated 2–3 item previews.\n\n"
-        "**Typical latency:** 15–30 s per request (browser startup + page loads).\n\n"
+        "rather than the truncated 2–3 item previews. When `organization` is set and "
+        "the main page already confirms employment, they are skipped (and `education`/"
+        "`skills` are null) unless `full_profile` or `contact_id` is given.\n\n"
+        "**Typical latency:** 10–25 s per request (page loads; add browser startup "
+        "when `LINKEDIN_WARM_BROWSER=0`). Repeat requests for the same "
+        "`(linkedin_url, organization, contact_name)` within `LINKEDIN_SCRAPE_CACHE_TTL` "
+        "seconds (default 1 h) are answered from the worker's cache in ~0 ms.\n\n"
         "**Auth requirement:** A valid `li_at` session cookie must be present in "
         "`linkedincookie.json` or `LINKEDIN_COOKIES_FILE`. Without it, LinkedIn will "
         "redirect to its auth-wall and `blocked=True` will be returned."
     ),
     tags=["Scraping"],
-    dependencies=[],  # auth injected via parameter below for Swagger visibility
     responses={
-        200: {"description": "Profile scraped (check `success` field — even failures return 200 with details)."},
+        200: {
+            "model": ScrapeResponse,
+            "description": "Profile scraped (check `success` field — even failures return 200 with details).",
+        },
         401: {"description": "Missing or invalid X-API-Key header."},
         422: {"description": "Request body validation error."},
     },
 )
-async def scrape_profile(
-    request: ScrapeRequest,
-    x_api_key: str = Header(..., description="Service API key (set LINKEDIN_API_KEY env var)."),
-) -> ScrapeResponse:
-    _require_api_key(x_api_key)
-
-    t0 = time.perf_counter()
-    logger.info(f"[API] Scrape request: {request.contact_name} — {request.linkedin_url}")
-
-    result = await _adapter.verify_employment(
-        contact_name=request.contact_name,
-        organization=request.organization,
-        linkedin_url=str(request.linkedin_url),
+async def scrape_profile(request: ScrapeRequest, background_tasks: BackgroundTasks) -> Response:
+    result, elapsed_ms = await _scrape(request, background_tasks)
+
+    # Adapter dicts go straight into one orjson pass — no per-entry model objects.
+    # ScrapeResponse only documents the shape.
+    payload = {
+        "success": result.success,
+        "blocked": result.blocked,
+        "error": result.error,
+        "still_at_organization": result.still_at_organization,
+        "employment_confidence": _employment_confidence(result),
+        "current_title": result.current_title,
+        "current_organization": result.current_organization,
+        "profile_url": result.profile_url,
+        "name": result.name,
+        "headline": result.headline,
+        "location": result.location,
+        "experience": result.experience or None,
+        "education": result.education or None,
+        "skills": result.skills,
+        "scrape_duration_ms": elapsed_ms,
+        "scrape_duration_seconds": elapsed_ms / 1000,
+    }
+    return Response(
+        orjson.dumps(payload),
+        media_type="application/json",
     )
 
-    elapsed = round(time.perf_counter() - t0, 2)
-    logger.info(
-        f"[API] Scrape complete in {elapsed}s — success={result.success} "
-        f"blocked={result.blocked} still_at={result.still_at_organization}"
-    )
 
-    # Convert raw dicts from the adapter into typed Pydantic models
-    experience = (
-        [ExperienceEntry(**e) for e in result.experience] if result.experience else None
-    )
-    education = (
-        [EducationEntry(**e) for e in result.education] if result.education else None
-    )
-
-    if not result.success or result.blocked:
-        employment_confidence = 0.15
-    elif result.still_at_organization is not None:
-        employment_confidence = 0.92
-    else:
-        employment_confidence = 0.40
-    # ── Save LinkedIn snapshot for freshness tracking ───────────────────────
-    if result.success and request.contact_id and _supabase and _has_meaningful_data(
-        result.current_title, result.headline, result.experience, result.education
-    ):
-        try:
-            new_hash = _profile_hash(
-                result.current_title,
-                result.current_organization or request.organization,
-                result.headline,
-                result.skills,
-            )
-            prev = await _supabase.get_latest_linkedin_snapshot(request.contact_id)
-            data_changed = (prev is None) or (prev["profile_hash"] != new_hash)
-            change_summary = _build_change_summary(
-                prev or {},
-                result.current_title,
-                result.current_organization or request.organization,
-                result.headline,
-            ) if data_changed and prev else {}
-
-            snapshot = {
-                "contact_id":    request.contact_id,
-                "profile_hash":  new_hash,
-                "data_changed":  data_changed,
-                "headline":      result.headline,
-                "current_title": result.current_title,
-                "current_org":   result.current_organization or request.organization or None,
-                "location":      result.location,
-                "experience":    [e.model_dump(by_alias=True) for e in experience] if experience else None,
-                "education":     [e.model_dump(by_alias=True) for e in education] if education else None,
-                "skills":        result.skills,
-                "change_summary": change_summary or None,
-            }
-            await _supabase.save_linkedin_snapshot(snapshot)
-            logger.info(
-                f"[Snapshot] Saved for contact {request.contact_id} — "
-                f"changed={data_changed}"
-            )
-        except Exception as snap_err:
-            logger.warning(f"[Snapshot] Failed to save snapshot: {snap_err}")
-    elif result.success and request.contact_id and _supabase:
-        logger.warning(
-            f"[Snapshot] Skipped for contact {request.contact_id} — "
-            f"no meaningful profile data returned (blank page or auth wall)"
-        )
-
-    return ScrapeResponse(
-        success=result.success,
-        blocked=result.blocked,
-        error=result.error,
-        still_at_organization=result.still_at_organization,
-        employment_confidence=employment_confidence,
-        current_title=result.current_title,
-        current_organization=result.current_organization,
-        profile_url=result.profile_url,
-        name=result.name,
-        headline=result.headline,
-        location=result.location,
-        experience=experience,
-        education=education,
-        skills=result.skills,
-        scrape_duration_seconds=elapsed,
+@app.post(
+    "/scrape.soa",
+    summary="Scrape a LinkedIn profile (column-oriented response)",
+    description=(
+        "Same scrape as `POST /scrape`, but experience and education are transposed "
+        "into parallel columns (`titles`, `companies`, `date_ranges`, ...). "
+        "Consumers that fan profiles out to analytics should prefer this endpoint — "
+        "columns load directly into vectorised NumPy/pandas operations."
+    ),
+    tags=["Scraping"],
+    responses={
+        200: {"model": ScrapeResponseSoA},
+        401: {"description": "Missing or invalid X-API-Key header."},
+        422: {"description": "Request body validation error."},
+    },
+)
+async def scrape_profile_soa(request: ScrapeRequest, background_tasks: BackgroundTasks) -> Response:
+    result, elapsed_ms = await _scrape(request, background_tasks)
+
+    experience = result.experience or []
+    education = result.education or []
+    payload = {
+        "success": result.success,
+        "blocked": result.blocked,
+        "error": result.error,
+        "still_at_organization": result.still_at_organization,
+        "employment_confidence": _employment_confidence(result),
+        "current_title": result.current_title,
+        "current_organization": result.current_organization,
+        "profile_url": result.profile_url,
+        "name": result.name,
+        "headline": result.headline,
+        "location": result.location,
+        "titles": [e.get("title") for e in experience],
+        "companies": [e.get("company") for e in experience],
+        "date_ranges": [e.get("dateRange") for e in experience],
+        "is_current": [e.get("isCurrent") for e in experience],
+        "descriptions": [e.get("description") for e in experience],
+        "institutions": [e.get("institution") for e in education],
+        "degrees": [e.get("degree") for e in education],
+        "education_date_ranges": [e.get("dateRange") for e in education],
+        "skills": result.skills or [],
+        "scrape_duration_ms": elapsed_ms,
+        "scrape_duration_seconds": elapsed_ms / 1000,
+    }
+    return Response(
+        orjson.dumps(payload),
+        media_type="application/json",
     )
 
 
@@ -556,12 +1073,8 @@ class SendAllEmailsResponse(BaseModel):
     tags=["Email"],
 )
 async def send_one_email(
-    request: SendOneEmailRequest,
-    x_api_key: str = Header(..., description="Service API key"),
+    request: SendOneEmailRequest, container=Depends(get_container)
 ) -> SendOneEmailResponse:
-    _require_api_key(x_api_key)
-    container = _get_container()
-
     contact = await container.repository.get_contact_by_id(request.contact_id)
     if not contact:
         raise HTTPException(
@@ -587,9 +1100,63 @@ async def send_one_email(
     )
 
 
+async def _email_batch(container, request: SendAllEmailsRequest) -> list:
+    # Status filter and limit run in the database — only the batch is fetched
+    batch = await container.repository.get_contacts(
+        status=request.status_filter, limit=request.limit
+    )
+    logger.info(
+        f"[Email] send-all: {len(batch)} contacts "
+        f"(filter={request.status_filter}, limit={request.limit})"
+    )
+    return batch
+
+
+async def _send_emails(container, batch: list, concurrency: int) -> AsyncIterator[tuple[int, dict]]:
+    """
+    Send to every contact in `batch`, yielding `(index, result)` as each finishes.
+
+    Exactly `concurrency` worker tasks drain a queue of contacts, rather than
+    one task per contact parked on a semaphore. Results are plain dicts in the
+    EmailResultItem shape, ready for orjson — no per-item model objects.
+    """
+    todo: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(batch):
+        todo.put_nowait(item)
+    done: asyncio.Queue = asyncio.Queue()
+
+    async def _worker():
+        while not todo.empty():
+            i, contact = todo.get_nowait()
+            try:
+                res = await container.email_sender.send_confirmation(contact)
+                result = {
+                    "contact_id": contact.id,
+                    "email": res.email,
+                    "success": res.success,
+                    "error": res.error,
+                }
+            except Exception as e:
+                result = {
+                    "contact_id": contact.id,
+                    "email": contact.email or "",
+                    "success": False,
+                    "error": str(e),
+                }
+            done.put_nowait((i, result))
+
+    workers = [asyncio.create_task(_worker()) for _ in range(min(concurrency, len(batch)))]
+    try:
+        for _ in range(len(batch)):
+            yield await done.get()
+    finally:
+        # Only does anything if the consumer stopped early (e.g. client went away)
+        for w in workers:
+            w.cancel()
+
+
 @app.post(
     "/api/email/send-all",
-    response_model=SendAllEmailsResponse,
     summary="Send info-review emails to ALL eligible contacts",
     description=(
         "Fetches contacts from the database (optionally filtered by status), "
@@ -598,64 +1165,54 @@ async def send_one_email(
         "Returns a per-contact success/failure breakdown."
     ),
     tags=["Email"],
+    responses={200: {"model": SendAllEmailsResponse}},
 )
-async def send_all_emails(
-    request: SendAllEmailsRequest,
-    x_api_key: str = Header(..., description="Service API key"),
-) -> SendAllEmailsResponse:
-    _require_api_key(x_api_key)
-    container = _get_container()
+async def send_all_emails(request: SendAllEmailsRequest, container=Depends(get_container)) -> Response:
+    batch = await _email_batch(container, request)
 
-    all_contacts = await container.repository.get_all_contacts()
+    # Each result lands in its contact's slot, so results come back in batch order
+    results: List[Optional[dict]] = [None] * len(batch)
+    async for i, result in _send_emails(container, batch, request.concurrency):
+        results[i] = result
 
-    # Apply optional status filter
-    if request.status_filter:
-        all_contacts = [
-            c for c in all_contacts
-            if c.status.value == request.status_filter
-        ]
+    total_ok = sum(1 for r in results if r["success"])
+    total_fail = len(results) - total_ok
 
-    # Respect limit
-    batch = all_contacts[: request.limit]
+    logger.info(f"[Email] send-all done: {total_ok} ok, {total_fail} failed")
 
-    logger.info(
-        f"[Email] send-all: {len(batch)} contacts "
-        f"(filter={request.status_filter}, limit={request.limit})"
+    return Response(
+        orjson.dumps({"total_sent": total_ok, "total_failed": total_fail, "results": results}),
+        media_type="application/json",
     )
 
-    results: List[EmailResultItem] = []
-    semaphore = asyncio.Semaphore(request.concurrency)
 
-    async def _send(contact):
-        async with semaphore:
-            try:
-                res = await container.email_sender.send_confirmation(contact)
-                results.append(EmailResultItem(
-                    contact_id=contact.id,
-                    email=res.email,
-                    success=res.success,
-                    error=res.error,
-                ))
-            except Exception as e:
-                results.append(EmailResultItem(
-                    contact_id=contact.id,
-                    email=contact.email or "",
-                    success=False,
-                    error=str(e),
-                ))
+@app.post(
+    "/api/email/send-all.ndjson",
+    summary="Send info-review emails to ALL eligible contacts (streamed)",
+    description=(
+        "Same batch as `POST /api/email/send-all`, but streamed as NDJSON: one "
+        "`EmailResultItem` line per contact in completion order, then a final "
+        "`{\"total_sent\": ..., \"total_failed\": ...}` line. Clients can show "
+        "progress live, and the server holds no per-batch result list."
+    ),
+    tags=["Email"],
+    responses={200: {"description": "NDJSON stream (application/x-ndjson)"}},
+)
+async def send_all_emails_ndjson(
+    request: SendAllEmailsRequest, container=Depends(get_container)
+) -> StreamingResponse:
+    batch = await _email_batch(container, request)
 
-    await asyncio.gather(*[_send(c) for c in batch])
+    async def ndjson():
+        total_ok = 0
+        async for _, result in _send_emails(container, batch, request.concurrency):
+            total_ok += result["success"]
+            yield orjson.dumps(result) + b"\n"
+        total_fail = len(batch) - total_ok
+        logger.info(f"[Email] send-all done: {total_ok} ok, {total_fail} failed")
+        yield orjson.dumps({"total_sent": total_ok, "total_failed": total_fail}) + b"\n"
 
-    total_ok = sum(1 for r in results if r.success)
-    total_fail = len(results) - total_ok
-
-    logger.info(f"[Email] send-all done: {total_ok} ok, {total_fail} failed")
-
-    return SendAllEmailsResponse(
-        total_sent=total_ok,
-        total_failed=total_fail,
-        results=results,
-    )
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 # ── Agentic verification — streaming SSE endpoint ─────────────────────────────
@@ -674,18 +1231,15 @@ async def send_all_emails(
         404: {"description": "Contact not found."},
     },
 )
-async def run_verification_agent(
-    contact_id: str,
-    x_api_key: str = Header(..., description="Service API key"),
-) -> StreamingResponse:
-    _require_api_key(x_api_key)
+async def run_verification_agent(contact_id: str, container=Depends(get_container)) -> StreamingResponse:
+    from prospectkeeper.use_cases.verify_contact_agent import VerifyContactAgentUseCase
 
-    container = _get_container()
     agent = VerifyContactAgentUseCase(
         repository=container.repository,
         scraper=container.scraper,
         linkedin=container.linkedin,
         email_sender=container.email_sender,
+        client=_get_anthropic(),
     )
 
     async def event_stream():
@@ -710,21 +1264,17 @@ async def run_verification_agent(
     summary="Return which API keys are configured and current batch settings",
     tags=["Config"],
 )
-async def config_status(x_api_key: str = Header(...)) -> dict:
-    _require_api_key(x_api_key)
-    return {
-        "anthropic_configured": bool(os.environ.get("ANTHROPIC_API_KEY")),
-        "supabase_configured": bool(os.environ.get("SUPABASE_URL") and os.environ.get("SUPABASE_SERVICE_KEY")),
-        "langfuse_configured": bool(os.environ.get("LANGFUSE_SECRET_KEY") and os.environ.get("LANGFUSE_PUBLIC_KEY")),
-        "zerobounce_configured": bool(os.environ.get("ZEROBOUNCE_API_KEY")),
-        "resend_configured": bool(os.environ.get("RESEND_API_KEY")),
-        "batch_limit": int(os.environ.get("BATCH_LIMIT", 50)),
-        "batch_concurrency": int(os.environ.get("BATCH_CONCURRENCY", 5)),
-    }
+async def config_status() -> dict:
+    return _CONFIG_STATUS
 
 
 # ── Batch run trigger ─────────────────────────────────────────────────────────
 
+# Background batch tasks. Holding the reference keeps a run from being garbage
+# collected mid-flight; tasks remove themselves when they end.
+_running_batches: "set[asyncio.Task]" = set()
+
+
 @app.post(
     "/batch/run",
     summary="Trigger a background batch verification run",
@@ -734,17 +1284,12 @@ async def trigger_batch(
     tier: str = "free",
     limit: int = 50,
     concurrency: int = 5,
-    x_api_key: str = Header(...),
+    container=Depends(get_container),
 ) -> dict:
-    _require_api_key(x_api_key)
-
     async def _run_batch():
         try:
-            from prospectkeeper.infrastructure.config import Config
-            from prospectkeeper.infrastructure.container import Container
             from prospectkeeper.use_cases.process_batch import ProcessBatchRequest
-            config = Config.from_env()
-            container = Container(config)
+
             await container.process_batch_use_case.execute(
                 ProcessBatchRequest(tier=tier, limit=limit, concurrency=concurrency)
             )
@@ -752,5 +1297,20 @@ async def trigger_batch(
         except Exception as e:
             logger.error(f"[Batch] Background run failed: {e}")
 
-    asyncio.create_task(_run_batch())
+    task = asyncio.create_task(_run_batch())
+    _running_batches.add(task)
+    task.add_done_callback(_running_batches.discard)
     return {"status": "started", "tier": tier, "limit": limit, "concurrency": concurrency}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "linkedin_api:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("LINKEDIN_WORKERS", "2")),
+    )
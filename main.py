@@ -5,7 +5,7 @@ Usage:
   # Run a batch verification job
   python main.py run --limit 50
 
-  # Launch the Streamlit dashboard
+  # Launch the Streamlit dashboard (in-process; --subprocess for `streamlit run`)
   python main.py dashboard
 
   # Import contacts from a CSV
@@ -19,9 +19,6 @@ import argparse
 import logging
 from dotenv import load_dotenv
 load_dotenv()
-import threading
-from prospectkeeper.adapters.webhook_adapter import start as start_webhook, configure as configure_webhook
-
 
 
 logging.basicConfig(
@@ -31,8 +28,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger("prospectkeeper")
 
-from langfuse import get_client as get_langfuse_client
-
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -53,7 +48,11 @@ def parse_args():
     )
 
     # dashboard command
-    subparsers.add_parser("dashboard", help="Launch the Streamlit dashboard")
+    dashboard_parser = subparsers.add_parser("dashboard", help="Launch the Streamlit dashboard")
+    dashboard_parser.add_argument(
+        "--subprocess", action="store_true",
+        help="Launch via `python -m streamlit run` in a child process instead of in-process",
+    )
 
     # import command
     import_parser = subparsers.add_parser(
@@ -65,6 +64,7 @@ def parse_args():
 
 
 async def run_batch(limit: int, concurrency: int, tier: str):
+    from langfuse import get_client as get_langfuse_client
     from prospectkeeper.infrastructure.config import Config
     from prospectkeeper.infrastructure.container import Container
     from prospectkeeper.use_cases.process_batch import ProcessBatchRequest
@@ -73,9 +73,12 @@ async def run_batch(limit: int, concurrency: int, tier: str):
     container = Container(config)
 
     logger.info(f"Starting batch run: tier={tier}, limit={limit}, concurrency={concurrency}")
-    response = await container.process_batch_use_case.execute(
-        ProcessBatchRequest(tier=tier, limit=limit, concurrency=concurrency)
-    )
+    try:
+        response = await container.process_batch_use_case.execute(
+            ProcessBatchRequest(tier=tier, limit=limit, concurrency=concurrency)
+        )
+    finally:
+        await container.aclose()
 
     print("\n" + "=" * 70)
     print("VALUE-PROOF RECEIPT")
@@ -100,54 +103,60 @@ async def import_csv(filepath: str):
     config = Config.from_env()
     container = Container(config)
 
+    # Rows go to the database in chunks — one multi-row insert per chunk
+    # instead of one round-trip per contact.
+    chunk_size = 1000
+    buffer = []
+    count = 0
     with open(filepath, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
-        count = 0
         for row in reader:
-            contact = Contact.create(
+            buffer.append(Contact.create(
                 name=row.get("name", ""),
                 email=row.get("email", ""),
                 title=row.get("title", ""),
                 organization=row.get("organization", ""),
                 district_website=row.get("website") or row.get("district_website"),
                 linkedin_url=row.get("linkedin_url"),
-            )
-            await container.repository.insert_contact(contact)
-            count += 1
-            logger.info(f"Imported: {contact.name} @ {contact.organization}")
+            ))
+            if len(buffer) == chunk_size:
+                await container.repository.bulk_insert_contacts(buffer)
+                count += len(buffer)
+                logger.info(f"Imported {count} contacts so far")
+                buffer = []
+    if buffer:
+        await container.repository.bulk_insert_contacts(buffer)
+        count += len(buffer)
 
     logger.info(f"Import complete: {count} contacts added.")
 
 
-def launch_dashboard():
-    import subprocess
+def launch_dashboard(use_subprocess: bool = False):
     dashboard_path = "prospectkeeper/frontend/app.py"
     logger.info(f"Launching Streamlit dashboard at {dashboard_path}")
-    subprocess.run(
-        [sys.executable, "-m", "streamlit", "run", dashboard_path],
-        check=True,
-    )
-
+    if use_subprocess:
+        import subprocess
+        subprocess.run(
+            [sys.executable, "-m", "streamlit", "run", dashboard_path],
+            check=True,
+        )
+        return
 
-def main():
-    args = parse_args()
+    # Same steps as `streamlit run`, minus a second interpreter start-up
+    from streamlit.web import bootstrap
 
-    # Wire the inbound-email use case into the webhook before starting it
-    from prospectkeeper.infrastructure.config import Config
-    from prospectkeeper.infrastructure.container import Container
+    bootstrap.load_config_options(flag_options={})
+    bootstrap.run(dashboard_path, False, [], {})
 
-    config = Config.from_env()
-    container = Container(config)
-    configure_webhook(container.process_inbound_email_use_case)
 
-    webhook_thread = threading.Thread(target=start_webhook, daemon=True)
-    webhook_thread.start()
+def main():
+    args = parse_args()
 
     if args.command == "run":
         asyncio.run(run_batch(args.limit, args.concurrency, args.tier))
 
     elif args.command == "dashboard":
-        launch_dashboard()
+        launch_dashboard(args.subprocess)
 
     elif args.command == "import":
         asyncio.run(import_csv(args.file))
@@ -8,31 +8,37 @@ Merges all adapters into a single server:
   - Inbound email webhook (ProcessInboundEmailUseCase)
 
 Start:
-    uvicorn main_api:app --reload --port 8000
+    uvicorn main_api:app --reload --port 8000     # development
+    python main_api.py                            # production
+
+    The production entry point runs uvicorn on the uvloop event loop with the
+    httptools parser, and MAIN_API_WORKERS (default 1) worker processes.
 
 Interactive docs:
     http://localhost:8000/docs
 """
 
 import asyncio
-import base64
 import hashlib
+import hmac
 import json
 import logging
 import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
-import httpx
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from fastapi import Depends, FastAPI, Header, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s  %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -46,8 +52,11 @@ _SONNET_OUTPUT_COST_PER_TOKEN = 15.0 / 1_000_000
 
 # ── App ───────────────────────────────────────────────────────────────────────
 
-app = FastAPI(title="ProspectKeeper API", version="1.0.0")
+app = FastAPI(title="ProspectKeeper API", version="1.0.0", default_response_class=ORJSONResponse)
 
+# Scrape and send-all bodies are 5–40 KB of JSON; SSE streams are excluded by
+# Starlette and NDJSON chunks are sync-flushed, so streaming is unaffected.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
@@ -76,6 +85,19 @@ async def startup():
         logger.error(f"Container startup failed: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    # Stop in-flight batches before the container they use is closed
+    batches = list(_running_batches.values())
+    for task in batches:
+        task.cancel()
+    await asyncio.gather(*batches, return_exceptions=True)
+    if _container is not None:
+        await _container.aclose()
+    if _langfuse_http is not None:
+        await _langfuse_http.aclose()
+
+
 def get_container():
     if _startup_error:
         raise HTTPException(status_code=503, detail=f"Service misconfigured: {_startup_error}")
@@ -87,17 +109,27 @@ def get_container():
 # ── Auth ──────────────────────────────────────────────────────────────────────
 
 _API_KEY = os.getenv("API_KEY", "dev-key")
+_API_KEY_BYTES = _API_KEY.encode()
 
 
-def _auth(x_api_key: str = Header(...)) -> None:
-    if x_api_key != _API_KEY:
+async def _auth(x_api_key: str = Header(...)) -> None:
+    # async so FastAPI runs it inline rather than hopping to the threadpool
+    # Constant-time compare — no early exit on the first mismatching byte
+    if not hmac.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
 
 
 # ── Request / Response models ─────────────────────────────────────────────────
 
 
-class ContactIn(BaseModel):
+class _Body(BaseModel):
+    """Request-body base: unknown keys are dropped, strings trimmed, and the
+    validated model is read-only — handlers never write back to it."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
+
+
+class ContactIn(_Body):
     id: Optional[str] = None
     name: str
     email: Optional[str] = ""
@@ -110,29 +142,29 @@ class ContactIn(BaseModel):
     review_reason: Optional[str] = None
 
 
-class ScrapeRequest(BaseModel):
+class ScrapeRequest(_Body):
     linkedin_url: str
     contact_name: str
     organization: Optional[str] = None
     contact_id: Optional[str] = None  # If provided, snapshot is saved to DB
 
 
-class SendOneRequest(BaseModel):
+class SendOneRequest(_Body):
     contact_id: str
 
 
-class SendAllRequest(BaseModel):
+class SendAllRequest(_Body):
     limit: Optional[int] = 500
     concurrency: Optional[int] = 5
 
 
-class InboundEmailRequest(BaseModel):
+class InboundEmailRequest(_Body):
     sender_email: str
     body: str
     subject: Optional[str] = ""
 
 
-class BatchRunRequest(BaseModel):
+class BatchRunRequest(_Body):
     tier: str = "free"
     limit: int = 50
     concurrency: int = 5
@@ -146,21 +178,104 @@ async def health():
     return {"status": "ok", "error": _startup_error}
 
 
+# ── Contacts list cache ───────────────────────────────────────────────────────
+
+# /contacts and /contacts/review read the whole table on every call, so their
+# serialised bodies are kept for CONTACTS_CACHE_TTL seconds (0 disables). Every
+# handler here that writes contacts bumps `_contacts_version`, so this process
+# never serves its own stale writes; writes from elsewhere (CLI batch runs,
+# linkedin_api, the standalone webhook) show up within the TTL.
+_CONTACTS_CACHE_TTL_SECONDS = float(os.getenv("CONTACTS_CACHE_TTL", "30"))
+_contacts_version = 0
+# endpoint -> (version, stored_at, body, etag)
+_contacts_cache: "dict[str, tuple[int, float, bytes, str]]" = {}
+
+
+def _invalidate_contacts() -> None:
+    global _contacts_version
+    _contacts_version += 1
+
+
+def _cached_contacts(request: Request, endpoint: str) -> Optional[Response]:
+    """Return the cached body for `endpoint` if it is current and fresh, else None."""
+    hit = _contacts_cache.get(endpoint)
+    if (
+        hit is None
+        or hit[0] != _contacts_version
+        or time.monotonic() - hit[1] > _CONTACTS_CACHE_TTL_SECONDS
+    ):
+        return None
+    return _conditional(request, hit[2], hit[3])
+
+
+def _cache_contacts(request: Request, endpoint: str, version: int, payload: list) -> Response:
+    """Serialise `payload`, cache it under the version read *before* the query, and return it."""
+    body = orjson.dumps(payload)
+    etag = _etag(body)
+    if _CONTACTS_CACHE_TTL_SECONDS > 0:
+        _contacts_cache[endpoint] = (version, time.monotonic(), body, etag)
+    return _conditional(request, body, etag)
+
+
+# ── Conditional GETs ──────────────────────────────────────────────────────────
+
+
+def _etag(body: bytes) -> str:
+    """Weak validator over the serialised body (gzip may re-encode it in transit)."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of `etag` against an If-None-Match header (RFC 9110 §13.1.2).
+
+    The header is a comma-separated list of entity tags, or `*` for any;
+    W/ prefixes are ignored, so only the opaque quoted tags are compared.
+    """
+    opaque = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _conditional(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """JSON `body` with an ETag, or a bodiless 304 if the client already holds it.
+
+    The default Cache-Control lets the browser keep the body but makes it
+    revalidate on every use, so an unchanged list costs a header round-trip.
+    """
+    etag = etag or _etag(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 # ── Contacts CRUD ─────────────────────────────────────────────────────────────
 
 
 @app.get("/contacts", tags=["contacts"])
-async def list_contacts(_: None = Depends(_auth)):
+async def list_contacts(request: Request, _: None = Depends(_auth)):
     """Return all non-opted-out contacts, enriched with LinkedIn freshness data."""
+    cached = _cached_contacts(request, "contacts")
+    if cached is not None:
+        return cached
+
     c = get_container()
-    contacts = await c.repository.get_all_contacts()
-    freshness = await c.repository.get_all_linkedin_freshness()
-
-    result = []
-    for contact in contacts:
-        if contact.status.value == "opted_out":
-            continue
-        row = {
+    version = _contacts_version
+    # One query: the contacts_with_freshness view joins freshness in the database
+    rows = await c.repository.get_all_contacts_with_freshness()
+
+    # Rows are built in one comprehension and handed to orjson as-is — no
+    # jsonable_encoder walk; freshness timestamps are already ISO strings.
+    return _cache_contacts(request, "contacts", version, [
+        {
             "id": contact.id,
             "name": contact.name,
             "email": contact.email,
@@ -171,16 +286,11 @@ async def list_contacts(_: None = Depends(_auth)):
             "review_reason": contact.review_reason,
             "linkedin_url": contact.linkedin_url,
             "district_website": contact.district_website,
-            "last_scraped_at": None,
-            "last_changed_at": None,
+            "last_scraped_at": freshness.get("last_scraped_at"),
+            "last_changed_at": freshness.get("last_changed_at"),
         }
-        if contact.id in freshness:
-            f = freshness[contact.id]
-            row["last_scraped_at"] = f.get("last_scraped_at")
-            row["last_changed_at"] = f.get("last_changed_at")
-        result.append(row)
-
-    return result
+        for contact, freshness in rows
+    ])
 
 
 @app.post("/contacts", status_code=status.HTTP_201_CREATED, tags=["contacts"])
@@ -201,6 +311,7 @@ async def create_contact(body: ContactIn, _: None = Depends(_auth)):
         linkedin_url=body.linkedin_url,
     )
     saved = await c.repository.insert_contact(contact)
+    _invalidate_contacts()
     return {"id": saved.id, "name": saved.name}
 
 
@@ -235,6 +346,7 @@ async def update_contact(body: ContactIn, _: None = Depends(_auth)):
         contact.review_reason = body.review_reason
 
     saved = await c.repository.save_contact(contact)
+    _invalidate_contacts()
     return {
         "id": saved.id,
         "name": saved.name,
@@ -254,6 +366,7 @@ async def delete_contact(contact_id: str, _: None = Depends(_auth)):
     """Permanently delete a contact."""
     c = get_container()
     deleted = await c.repository.delete_contact(contact_id)
+    _invalidate_contacts()
     if not deleted:
         raise HTTPException(status_code=404, detail="Contact not found")
 
@@ -276,8 +389,52 @@ async def get_linkedin_change(contact_id: str, _: None = Depends(_auth)):
 
 
 def _profile_hash(title: Optional[str], org: Optional[str], headline: Optional[str]) -> str:
-    key = json.dumps({"title": title, "org": org, "headline": headline}, sort_keys=True)
-    return hashlib.md5(key.encode()).hexdigest()
+    """BLAKE2b-128 of the change-detection fields — not a security hash.
+
+    Fields are joined into one byte string, each behind a control-byte tag, so
+    no JSON text is built and no value can spill into a neighbouring field.
+    The hasher is fed once, in a single C call.
+    """
+    data = b"".join((
+        b"t\x00", (title or "").encode(),
+        b"\x01o\x00", (org or "").encode(),
+        b"\x01h\x00", (headline or "").encode(),
+    ))
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _snapshot_changed(old_snap: Optional[dict], new_hash: str, title, org, headline) -> bool:
+    """True if the profile differs from `old_snap` (or there is none).
+
+    Equal hashes short-circuit. Unequal ones are confirmed against the stored
+    fields, since rows hashed under another scheme (earlier releases, or
+    linkedin_api's) never match by hash alone.
+    """
+    if old_snap is None:
+        return True
+    if old_snap.get("profile_hash") == new_hash:
+        return False
+    return (
+        (old_snap.get("current_title") or "", old_snap.get("current_org") or "", old_snap.get("headline") or "")
+        != (title or "", org or "", headline or "")
+    )
+
+
+_now_iso = (0, "")
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as ISO-8601 at second resolution, formatted once per second."""
+    global _now_iso
+    sec = int(time.time())
+    if sec != _now_iso[0]:
+        _now_iso = (sec, datetime.fromtimestamp(sec, tz=timezone.utc).isoformat())
+    return _now_iso[1]
+
+
+def _json(payload: dict) -> Response:
+    """Serialise `payload` in one orjson pass, skipping FastAPI's jsonable_encoder walk."""
+    return Response(orjson.dumps(payload), media_type="application/json")
 
 
 @app.post("/scrape", tags=["linkedin"])
@@ -318,14 +475,22 @@ async def scrape_linkedin(req: ScrapeRequest, _: None = Depends(_auth)):
     }
 
     if not result.success or not req.contact_id:
-        return resp
+        return _json(resp)
 
     # ── Persist snapshot and update contact ───────────────────────────────
-    now = datetime.utcnow().isoformat()
+    now = _utcnow_iso()
     new_hash = _profile_hash(result.current_title, result.current_organization, result.headline)
 
-    old_snap = await c.repository.get_latest_linkedin_snapshot(req.contact_id)
-    data_changed = (old_snap is None) or (old_snap.get("profile_hash") != new_hash)
+    # The previous snapshot and the contact row are independent reads
+    reads = [c.repository.get_latest_linkedin_snapshot(req.contact_id)]
+    if result.still_at_organization is not None:
+        reads.append(c.repository.get_contact_by_id(req.contact_id))
+    old_snap, *rest = await asyncio.gather(*reads)
+    contact = rest[0] if rest else None
+
+    data_changed = _snapshot_changed(
+        old_snap, new_hash, result.current_title, result.current_organization, result.headline
+    )
 
     change_summary = {}
     if data_changed and old_snap:
@@ -338,7 +503,7 @@ async def scrape_linkedin(req: ScrapeRequest, _: None = Depends(_auth)):
             "headline_to": result.headline,
         }
 
-    await c.repository.save_linkedin_snapshot({
+    writes = [c.repository.save_linkedin_snapshot({
         "contact_id": req.contact_id,
         "profile_hash": new_hash,
         "current_title": result.current_title,
@@ -347,24 +512,27 @@ async def scrape_linkedin(req: ScrapeRequest, _: None = Depends(_auth)):
         "scraped_at": now,
         "data_changed": data_changed,
         "change_summary": change_summary,
-    })
+    })]
 
     # Update contact status based on scrape result
-    if result.still_at_organization is not None:
-        contact = await c.repository.get_contact_by_id(req.contact_id)
-        if contact:
-            if result.still_at_organization:
-                contact.mark_active()
-                if result.current_title:
-                    contact.title = result.current_title
-            else:
-                contact.flag_for_review("LinkedIn: no longer at organisation")
-            await c.repository.save_contact(contact)
+    if contact:
+        if result.still_at_organization:
+            contact.mark_active()
+            if result.current_title:
+                contact.title = result.current_title
+        else:
+            contact.flag_for_review("LinkedIn: no longer at organisation")
+        writes.append(c.repository.save_contact(contact))
+
+    try:
+        await asyncio.gather(*writes)
+    finally:
+        _invalidate_contacts()  # freshness columns, and possibly status/title
 
     resp["data_changed"] = data_changed
     resp["last_scraped_at"] = now
     resp["last_changed_at"] = now if data_changed else (old_snap or {}).get("scraped_at")
-    return resp
+    return _json(resp)
 
 
 # ── Email ─────────────────────────────────────────────────────────────────────
@@ -389,30 +557,46 @@ async def send_one_email(req: SendOneRequest, _: None = Depends(_auth)):
 async def send_all_emails(req: SendAllRequest, _: None = Depends(_auth)):
     """
     Send info-review emails to all eligible contacts (not opted-out, has email).
-    Respects the concurrency limit to avoid rate-limiting Resend.
+    Respects the concurrency limit; EmailSenderAdapter paces the sends
+    themselves to Resend's per-second quota.
     """
     c = get_container()
-
-    contacts = await c.repository.get_all_contacts()
-    eligible = [ct for ct in contacts if not ct.is_opted_out() and ct.email][: req.limit]
-    logger.info(f"[email/send-all] Sending to {len(eligible)} contacts")
+    n_workers = max(1, req.concurrency or 1)
 
     total_sent = 0
     total_failed = 0
-    semaphore = asyncio.Semaphore(req.concurrency)
+    # A fixed set of `concurrency` workers drains a small bounded queue that is
+    # fed page by page from the database, so neither the eligible contacts nor
+    # their send coroutines are ever all in memory at once.
+    todo: asyncio.Queue = asyncio.Queue(maxsize=2 * n_workers)
 
-    async def _send(contact):
+    async def _worker():
         nonlocal total_sent, total_failed
-        async with semaphore:
-            res = await c.email_sender.send_confirmation(contact)
-            if res.success:
+        while (contact := await todo.get()) is not None:
+            try:
+                res = await c.email_sender.send_confirmation(contact)
+                ok, error = res.success, res.error
+            except Exception as e:
+                ok, error = False, str(e)
+            if ok:
                 total_sent += 1
             else:
                 total_failed += 1
-                logger.warning(f"[email/send-all] Failed: {contact.email} — {res.error}")
-            await asyncio.sleep(0.6)
+                logger.warning(f"[email/send-all] Failed: {contact.email} — {error}")
 
-    await asyncio.gather(*[_send(ct) for ct in eligible])
+    workers = [asyncio.create_task(_worker()) for _ in range(n_workers)]
+    try:
+        # Opt-out, has-email and limit all run in the database
+        async for contact in c.repository.iter_contacts(with_email=True, limit=req.limit):
+            await todo.put(contact)
+        for _ in workers:
+            await todo.put(None)  # one sentinel per worker
+        await asyncio.gather(*workers)
+    finally:
+        for w in workers:
+            w.cancel()  # no-op unless the feed failed part-way
+
+    logger.info(f"[email/send-all] Sent {total_sent}, failed {total_failed}")
     return {"total_sent": total_sent, "total_failed": total_failed}
 
 
@@ -432,6 +616,8 @@ async def inbound_email(req: InboundEmailRequest, _: None = Depends(_auth)):
         email_body=req.body,
         subject=req.subject,
     )
+    if result.success:
+        _invalidate_contacts()
     return {
         "success": result.success,
         "contact_id": result.contact_id,
@@ -442,6 +628,23 @@ async def inbound_email(req: InboundEmailRequest, _: None = Depends(_auth)):
 
 # ── Langfuse Stats (stub — returns not_configured until Langfuse is wired) ────
 
+# One keep-alive client reused across /langfuse-stats calls, built on first use
+# (only this handler talks HTTP from here) and closed on shutdown.
+_langfuse_http = None
+
+
+def _langfuse_client():
+    global _langfuse_http
+    if _langfuse_http is None:
+        import httpx
+
+        _langfuse_http = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            auth=httpx.BasicAuth(_LANGFUSE_PUBLIC_KEY, _LANGFUSE_SECRET_KEY),
+        )
+    return _langfuse_http
+
 
 @app.get("/langfuse-stats", tags=["observability"])
 async def langfuse_stats(_: None = Depends(_auth)):
@@ -450,6 +653,7 @@ async def langfuse_stats(_: None = Depends(_auth)):
         return {
             "not_configured": True,
             "total_calls": 0,
+            "total_calls_all_time": 0,
             "total_input_tokens": 0,
             "total_output_tokens": 0,
             "total_tokens": 0,
@@ -459,17 +663,11 @@ async def langfuse_stats(_: None = Depends(_auth)):
             "langfuse_dashboard_url": "",
         }
 
-    auth_header = "Basic " + base64.b64encode(
-        f"{_LANGFUSE_PUBLIC_KEY}:{_LANGFUSE_SECRET_KEY}".encode()
-    ).decode()
-
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.get(
-                f"{_LANGFUSE_BASE_URL}/api/public/observations",
-                params={"type": "GENERATION", "limit": 50},
-                headers={"Authorization": auth_header},
-            )
+        resp = await _langfuse_client().get(
+            f"{_LANGFUSE_BASE_URL}/api/public/observations",
+            params={"type": "GENERATION", "limit": 50},
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Could not reach Langfuse: {e}")
 
@@ -478,35 +676,39 @@ async def langfuse_stats(_: None = Depends(_auth)):
 
     data = resp.json()
     observations = data.get("data", [])
-    total_pages_items = data.get("meta", {}).get("totalItems", len(observations))
-
-    total_input = total_output = 0
-    total_cost = 0.0
-    recent = []
+    total_calls_all_time = data.get("meta", {}).get("totalItems", len(observations))
 
+    # Read each observation's usage once; totals are then plain column sums
+    ic, oc = _SONNET_INPUT_COST_PER_TOKEN, _SONNET_OUTPUT_COST_PER_TOKEN
+    rows = []
     for obs in observations:
         usage = obs.get("usage") or {}
         inp = usage.get("input") or 0
         out = usage.get("output") or 0
         cost = obs.get("calculatedTotalCost")
-        if cost is None:
-            cost = inp * _SONNET_INPUT_COST_PER_TOKEN + out * _SONNET_OUTPUT_COST_PER_TOKEN
-        total_input += inp
-        total_output += out
-        total_cost += cost
-        if len(recent) < 10:
-            recent.append({
-                "name": obs.get("name"),
-                "model": obs.get("model"),
-                "input_tokens": inp,
-                "output_tokens": out,
-                "cost_usd": round(cost, 6),
-                "start_time": obs.get("startTime"),
-            })
-
-    n = len(observations)
+        rows.append((obs, inp, out, inp * ic + out * oc if cost is None else cost))
+
+    total_input = sum(r[1] for r in rows)
+    total_output = sum(r[2] for r in rows)
+    total_cost = sum(r[3] for r in rows)
+    recent = [
+        {
+            "name": obs.get("name"),
+            "model": obs.get("model"),
+            "input_tokens": inp,
+            "output_tokens": out,
+            "cost_usd": round(cost, 6),
+            "start_time": obs.get("startTime"),
+        }
+        for obs, inp, out, cost in rows[:10]
+    ]
+
+    # Every total and the average cover the fetched page, so they agree with
+    # each other; Langfuse's count across all pages is reported separately
+    n = len(rows)
     return {
-        "total_calls": total_pages_items,
+        "total_calls": n,
+        "total_calls_all_time": total_calls_all_time,
         "total_input_tokens": total_input,
         "total_output_tokens": total_output,
         "total_tokens": total_input + total_output,
@@ -537,8 +739,11 @@ async def agent_verify(contact_id: str, _: None = Depends(_auth)):
     )
 
     async def event_stream():
-        async for event in agent.execute(contact_id):
-            yield f"data: {json.dumps(event)}\n\n"
+        try:
+            async for event in agent.execute(contact_id):
+                yield f"data: {json.dumps(event)}\n\n"
+        finally:
+            _invalidate_contacts()  # the agent may have updated the contact
 
     return StreamingResponse(
         event_stream(),
@@ -555,9 +760,9 @@ async def agent_verify(contact_id: str, _: None = Depends(_auth)):
 
 
 @app.get("/config-status", tags=["meta"])
-async def config_status(_: None = Depends(_auth)):
+async def config_status(request: Request, _: None = Depends(_auth)):
     """Return which API keys are configured and current batch settings."""
-    return {
+    payload = {
         "anthropic_configured": bool(os.getenv("ANTHROPIC_API_KEY")),
         "supabase_configured": bool(os.getenv("SUPABASE_URL") and os.getenv("SUPABASE_SERVICE_KEY")),
         "langfuse_configured": bool(os.getenv("LANGFUSE_SECRET_KEY") and os.getenv("LANGFUSE_PUBLIC_KEY")),
@@ -566,35 +771,35 @@ async def config_status(_: None = Depends(_auth)):
         "batch_limit": int(os.getenv("BATCH_LIMIT", 50)),
         "batch_concurrency": int(os.getenv("BATCH_CONCURRENCY", 5)),
     }
+    # Keys only change on redeploy — let the browser reuse this for 30s
+    return _conditional(request, orjson.dumps(payload), cache_control="private, max-age=30")
 
 
 # ── Batch receipts ────────────────────────────────────────────────────────────
 
 
 @app.get("/batch-receipts", tags=["batch"])
-async def get_batch_receipts(limit: int = 10, _: None = Depends(_auth)):
+async def get_batch_receipts(request: Request, limit: int = 10, _: None = Depends(_auth)):
     """Return the most recent batch run receipts (skips empty runs with 0 contacts)."""
     c = get_container()
-    response = (
-        c.repository.client.table("batch_receipts")
-        .select("*")
-        .gt("contacts_processed", 0)
-        .order("run_at", desc=True)
-        .limit(limit)
-        .execute()
-    )
-    return response.data
+    receipts = await c.repository.get_batch_receipts(limit, non_empty_only=True)
+    return _conditional(request, orjson.dumps(receipts))
 
 
 # ── Contacts — review queue ───────────────────────────────────────────────────
 
 
 @app.get("/contacts/review", tags=["contacts"])
-async def contacts_for_review(_: None = Depends(_auth)):
+async def contacts_for_review(request: Request, _: None = Depends(_auth)):
     """Return contacts flagged for human review."""
+    cached = _cached_contacts(request, "review")
+    if cached is not None:
+        return cached
+
     c = get_container()
-    contacts = await c.repository.get_all_contacts()
-    return [
+    version = _contacts_version
+    # Flag filter runs in the database; rows arrive a page at a time
+    return _cache_contacts(request, "review", version, [
         {
             "id": ct.id,
             "name": ct.name,
@@ -607,13 +812,18 @@ async def contacts_for_review(_: None = Depends(_auth)):
             "linkedin_url": ct.linkedin_url,
             "district_website": ct.district_website,
         }
-        for ct in contacts
-        if ct.needs_human_review
-    ]
+        async for ct in c.repository.iter_contacts(needs_review=True)
+    ])
 
 
 # ── Batch run trigger — streams SSE progress ─────────────────────────────────
 
+_SSE_QUEUE_SIZE = 1024
+_SSE_KEEPALIVE_SECONDS = 15.0
+# batch_id -> its background task. Holding the reference keeps a batch alive
+# after its SSE client leaves; entries remove themselves when the run ends.
+_running_batches: "dict[str, asyncio.Task]" = {}
+
 
 @app.post("/batch/run", tags=["batch"])
 async def trigger_batch(req: BatchRunRequest, _: None = Depends(_auth)):
@@ -624,7 +834,14 @@ async def trigger_batch(req: BatchRunRequest, _: None = Depends(_auth)):
     from prospectkeeper.use_cases.process_batch import ProcessBatchRequest
 
     batch_id = str(uuid.uuid4())
-    queue: asyncio.Queue = asyncio.Queue()
+    # Bounded, so a slow SSE reader pushes back on the batch instead of
+    # letting events pile up; once the reader leaves, events are dropped
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_SSE_QUEUE_SIZE)
+    listening = True
+
+    async def _emit(event) -> None:
+        if listening:
+            await queue.put(event)
 
     logger.info(
         f"[API] /batch/run SSE stream opened | batch_id={batch_id} "
@@ -641,22 +858,36 @@ async def trigger_batch(req: BatchRunRequest, _: None = Depends(_auth)):
                     concurrency=req.concurrency,
                     batch_id=batch_id,
                 ),
-                event_callback=queue.put,
+                event_callback=_emit,
             )
         except Exception as e:
             logger.error(f"[API] Batch run FAILED | batch_id={batch_id} | error={e!r}", exc_info=True)
-            await queue.put({"type": "error", "message": str(e)})
+            await _emit({"type": "error", "message": str(e)})
         finally:
-            await queue.put(None)  # sentinel — closes the stream
+            _invalidate_contacts()
+            await _emit(None)  # sentinel — closes the stream
 
-    asyncio.create_task(_run())
+    task = asyncio.create_task(_run(), name=f"batch-{batch_id}")
+    _running_batches[batch_id] = task
+    task.add_done_callback(lambda _: _running_batches.pop(batch_id, None))
 
     async def event_stream():
-        while True:
-            event = await queue.get()
-            if event is None:
-                break
-            yield f"data: {json.dumps(event)}\n\n"
+        nonlocal listening
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), _SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"  # SSE comment — stops proxies idling us out
+                    continue
+                if event is None:
+                    break
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+        finally:
+            # Client gone (or done): stop queueing and free any blocked put()
+            listening = False
+            while not queue.empty():
+                queue.get_nowait()
 
     return StreamingResponse(
         event_stream(),
@@ -667,3 +898,16 @@ async def trigger_batch(req: BatchRunRequest, _: None = Depends(_auth)):
             "X-Accel-Buffering": "no",
         },
     )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("MAIN_API_WORKERS", "1")),
+    )
@@ -9,13 +9,15 @@ import asyncio
 import logging
 import os
 import re
-from typing import Optional
+from typing import List, Optional, Sequence
 
+from ..domain.entities.contact import Contact
 from ..domain.interfaces.i_linkedin_gateway import ILinkedInGateway, LinkedInResult
 
 logger = logging.getLogger(__name__)
 
 LINKEDIN_TIMEOUT_SECONDS = 15
+MAX_CONCURRENT_CONTEXTS = 5
 
 
 class CamoUFoxAdapter(ILinkedInGateway):
@@ -26,13 +28,90 @@ class CamoUFoxAdapter(ILinkedInGateway):
     And Playwright: playwright install firefox
 
     Falls back gracefully if CamoUFox is unavailable.
+
+    Browser lifecycle: one browser is launched on first use and shared by
+    every verification, each of which gets its own fresh BrowserContext (so
+    cookies and storage never leak between contacts) that is closed when it
+    finishes. A disconnected browser is relaunched on the next call. Call
+    `aclose()` once on shutdown to stop it.
+
+    `verify_employment_batch` fans a list of contacts out over that browser,
+    at most `max_contexts` open at once.
     """
 
+    def __init__(self, max_contexts: int = MAX_CONCURRENT_CONTEXTS) -> None:
+        self._contexts = asyncio.Semaphore(max_contexts)
+        self._browser_lock = asyncio.Lock()
+        self._camoufox = None  # the AsyncCamoufox manager owning the browser
+        self._browser = None
+        self._cookies: Optional[list] = None  # parsed once, added per context
+
+    async def _get_browser(self):
+        """Return the shared browser, launching (or relaunching) it if needed."""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                from camoufox.async_api import AsyncCamoufox
+
+                await self._close_browser()
+                camoufox = AsyncCamoufox(headless=True)
+                self._browser = await camoufox.__aenter__()
+                self._camoufox = camoufox
+                logger.info("[Tier2] CamoUFox browser launched")
+            return self._browser
+
+    async def _close_browser(self) -> None:
+        camoufox, self._camoufox, self._browser = self._camoufox, None, None
+        if camoufox is not None:
+            try:
+                await camoufox.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"[Tier2] Error stopping CamoUFox browser: {e}")
+
+    async def aclose(self) -> None:
+        """Stop the shared browser. Call once on shutdown."""
+        async with self._browser_lock:
+            await self._close_browser()
+
+    def _linkedin_cookies(self) -> list:
+        """LinkedIn auth cookies from the environment, parsed on first use."""
+        if self._cookies is not None:
+            return self._cookies
+
+        li_at_cookie = os.environ.get("LINKEDIN_LI_AT")
+        cookies_string = os.environ.get("LINKEDIN_COOKIES_STRING")
+
+        cookies_to_add = []
+
+        if cookies_string:
+            cookie_parts = cookies_string.split(";")
+            for part in cookie_parts:
+                if "=" in part:
+                    name, value = part.strip().split("=", 1)
+                    cookies_to_add.append({
+                        "name": name.strip(),
+                        "value": value.strip(' "'),
+                        "domain": ".linkedin.com",
+                        "path": "/",
+                        "secure": True,
+                    })
+        elif li_at_cookie:
+            cookies_to_add.append({
+                "name": "li_at",
+                "value": li_at_cookie,
+                "domain": ".linkedin.com",
+                "path": "/",
+                "secure": True,
+            })
+
+        self._cookies = cookies_to_add
+        return cookies_to_add
+
     async def verify_employment(
         self,
         contact_name: str,
         organization: str,
         linkedin_url: Optional[str] = None,
+        full_profile: bool = True,
     ) -> LinkedInResult:
         try:
             return await asyncio.wait_for(
@@ -53,6 +132,21 @@ class CamoUFoxAdapter(ILinkedInGateway):
             logger.warning(f"[Tier2] LinkedIn error for {contact_name}: {e}")
             return LinkedInResult(success=False, error=str(e))
 
+    async def verify_employment_batch(
+        self, contacts: Sequence[Contact], full_profile: bool = True
+    ) -> List[LinkedInResult]:
+        """Verify every contact concurrently; results are in `contacts` order."""
+        async def verify_one(contact: Contact) -> LinkedInResult:
+            async with self._contexts:
+                return await self.verify_employment(
+                    contact.name,
+                    contact.organization,
+                    linkedin_url=contact.linkedin_url,
+                    full_profile=full_profile,
+                )
+
+        return list(await asyncio.gather(*(verify_one(c) for c in contacts)))
+
     async def _scrape_linkedin(
         self,
         contact_name: str,
@@ -61,42 +155,18 @@ class CamoUFoxAdapter(ILinkedInGateway):
     ) -> LinkedInResult:
         """
         Actual CamoUFox scraping logic.
-        Uses async_playwright context managed by CamoUFox for fingerprint evasion.
+        Runs in a fresh context on the shared browser; CamoUFox still handles
+        fingerprint evasion.
         """
-        from camoufox.async_api import AsyncCamoufox
-
-        async with AsyncCamoufox(headless=False) as browser:
-            page = await browser.new_page()
-
+        browser = await self._get_browser()
+        context = await browser.new_context()
+        try:
             # Inject LinkedIn auth cookies if available
-            li_at_cookie = os.environ.get("LINKEDIN_LI_AT")
-            cookies_string = os.environ.get("LINKEDIN_COOKIES_STRING")
-            
-            cookies_to_add = []
-            
-            if cookies_string:
-                cookie_parts = cookies_string.split(";")
-                for part in cookie_parts:
-                    if "=" in part:
-                        name, value = part.strip().split("=", 1)
-                        cookies_to_add.append({
-                            "name": name.strip(),
-                            "value": value.strip(' "'),
-                            "domain": ".linkedin.com",
-                            "path": "/",
-                            "secure": True,
-                        })
-            elif li_at_cookie:
-                cookies_to_add.append({
-                    "name": "li_at",
-                    "value": li_at_cookie,
-                    "domain": ".linkedin.com",
-                    "path": "/",
-                    "secure": True,
-                })
-                
+            cookies_to_add = self._linkedin_cookies()
             if cookies_to_add:
-                await page.context.add_cookies(cookies_to_add)
+                await context.add_cookies(cookies_to_add)
+
+            page = await context.new_page()
 
             # Determine URL to visit
             target_url = linkedin_url
@@ -127,6 +197,8 @@ class CamoUFoxAdapter(ILinkedInGateway):
             return self._parse_linkedin_page(
                 page_text, contact_name, organization, page.url
             )
+        finally:
+            await context.close()
 
     def _parse_linkedin_page(
         self,
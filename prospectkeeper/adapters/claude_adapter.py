@@ -9,16 +9,34 @@ All requests routed through Langfuse for:
 - Latency monitoring
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 import anthropic
 
+from ..domain.entities.contact import Contact
 from ..domain.interfaces.i_ai_gateway import IAIGateway, AIResearchResult
 
 logger = logging.getLogger(__name__)
 
 MODEL = "claude-sonnet-4-6"
+CLAUDE_MAX_CONCURRENT = 5
+CLAUDE_MAX_ATTEMPTS = 6  # first try + 5 backoff retries on 429 / 5xx / transport errors
+# Contacts packed into one research_contacts_batch message, and the output
+# budget each one gets (a filled-in schema object is ~150-250 tokens)
+RESEARCH_BATCH_SIZE = 10
+BATCH_MAX_TOKENS_PER_CONTACT = 400
+
+# Sonnet pricing, USD per million tokens. Cache writes cost 1.25x base input,
+# cache reads 0.1x.
+INPUT_COST_PER_M = 3.0
+OUTPUT_COST_PER_M = 15.0
+CACHE_WRITE_COST_PER_M = 3.75
+CACHE_READ_COST_PER_M = 0.30
+# Message Batches bill every token kind at half the synchronous rate
+BATCH_API_COST_FACTOR = 0.5
+RESEARCH_BATCH_POLL_SECONDS = 60.0
 
 RESEARCH_SYSTEM_PROMPT = """You are a B2B contact research specialist.
 Your job is to determine if a person is still in their current role at their organization,
@@ -40,7 +58,40 @@ Rules:
 - Set contact_still_active to null if you cannot determine with confidence.
 - Only provide a replacement if you are confident the original contact has left.
 - Do NOT fabricate emails — only include if publicly listed.
-- Include evidence_urls for any sources you reference."""
+- Include evidence_urls for any sources you reference.
+- When asked about a numbered list of contacts, respond ONLY with a JSON array
+  holding one object in the schema above per contact, in the order given."""
+
+# The system prompt is a fixed prefix on every call, so it carries a cache
+# breakpoint: repeat calls within the cache window read it at 0.1x input price
+RESEARCH_SYSTEM = [
+    {"type": "text", "text": RESEARCH_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+]
+
+
+def _usage(response) -> tuple:
+    """(input, output, cache_read, cache_write, cost_usd) for a Claude response.
+
+    `input` counts every prompt token — uncached, read from cache, and written
+    to it — while the cost prices each kind at its own rate.
+    """
+    usage = response.usage
+    uncached = usage.input_tokens
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    output = usage.output_tokens
+    cost_usd = (
+        uncached * INPUT_COST_PER_M
+        + cache_write * CACHE_WRITE_COST_PER_M
+        + cache_read * CACHE_READ_COST_PER_M
+        + output * OUTPUT_COST_PER_M
+    ) / 1_000_000
+    return uncached + cache_read + cache_write, output, cache_read, cache_write, cost_usd
+
+
+def _split(total: int, n: int) -> List[int]:
+    """`total` in `n` even shares; the remainder goes to the first few."""
+    return [total // n + (i < total % n) for i in range(n)]
 
 
 class ClaudeAdapter(IAIGateway):
@@ -48,12 +99,24 @@ class ClaudeAdapter(IAIGateway):
     Tier 3 AI research adapter.
     Routes all Claude API calls through Langfuse proxy for observability.
     Uses structured output to ensure parseable responses.
+
+    At most `max_concurrent` calls are in flight per adapter, however many
+    contacts a batch fans out. Rate-limit (429), overloaded/5xx responses and
+    connection errors or timeouts are retried with exponential backoff (honouring Retry-After) while the
+    slot is held, so a throttled batch slows down instead of failing.
     """
 
-    def __init__(self, anthropic_api_key: str):
-        self.client = anthropic.Anthropic(
+    def __init__(self, anthropic_api_key: str, max_concurrent: int = CLAUDE_MAX_CONCURRENT):
+        # Async client, so awaiting a 5-30s research call yields the event loop
+        # to other contacts instead of blocking it. Retries are ours, not the SDK's.
+        self.client = anthropic.AsyncAnthropic(
             api_key=anthropic_api_key,
+            max_retries=0,
         )
+        self._slots = asyncio.Semaphore(max_concurrent)
+
+    async def aclose(self) -> None:
+        await self.client.close()
 
     async def research_contact(
         self,
@@ -65,20 +128,21 @@ class ClaudeAdapter(IAIGateway):
         prompt = self._build_prompt(contact_name, organization, title, context_text)
 
         try:
-            response = self.client.messages.create(
+            response = await self._create_message(
                 model=MODEL,
                 max_tokens=1024,
-                system=RESEARCH_SYSTEM_PROMPT,
+                system=RESEARCH_SYSTEM,
                 messages=[{"role": "user", "content": prompt}],
             )
 
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            cost_usd = (input_tokens * 3.0 + output_tokens * 15.0) / 1_000_000
+            input_tokens, output_tokens, cache_read, cache_write, cost_usd = _usage(response)
             content = response.content[0].text
-            return self._parse_response(
+            result = self._parse_response(
                 content, input_tokens, output_tokens, cost_usd
             )
+            result.cache_read_tokens = cache_read
+            result.cache_write_tokens = cache_write
+            return result
 
         except Exception as e:
             logger.error(f"[Tier3] Claude API error for {contact_name}: {e}")
@@ -87,6 +151,132 @@ class ClaudeAdapter(IAIGateway):
                 error=str(e),
             )
 
+    async def research_contacts_batch(
+        self, contacts: Sequence[Contact]
+    ) -> List[AIResearchResult]:
+        """
+        Research many contacts with one Claude message per RESEARCH_BATCH_SIZE
+        of them, so the system prompt is paid once per group rather than once
+        per contact. Results are in `contacts` order; each group's tokens and
+        cost are split evenly across its contacts.
+        """
+        groups = [
+            contacts[i : i + RESEARCH_BATCH_SIZE]
+            for i in range(0, len(contacts), RESEARCH_BATCH_SIZE)
+        ]
+        researched = await asyncio.gather(*(self._research_group(g) for g in groups))
+        return [result for group in researched for result in group]
+
+    async def _research_group(self, contacts: Sequence[Contact]) -> List[AIResearchResult]:
+        n = len(contacts)
+        try:
+            response = await self._create_message(
+                model=MODEL,
+                max_tokens=BATCH_MAX_TOKENS_PER_CONTACT * n,
+                system=RESEARCH_SYSTEM,
+                messages=[{"role": "user", "content": self._build_batch_prompt(contacts)}],
+            )
+        except Exception as e:
+            logger.error(f"[Tier3] Claude API error for a batch of {n}: {e}")
+            return [AIResearchResult(success=False, error=str(e)) for _ in contacts]
+
+        input_tokens, output_tokens, cache_read, cache_write, cost_usd = _usage(response)
+        results = self._parse_batch_response(
+            response.content[0].text, n, input_tokens, output_tokens, cost_usd
+        )
+        for result, read, write in zip(results, _split(cache_read, n), _split(cache_write, n)):
+            result.cache_read_tokens = read
+            result.cache_write_tokens = write
+        return results
+
+    async def submit_research_batch(self, contacts: Sequence[Contact]) -> str:
+        """
+        Queue offline research for `contacts` with the Message Batches API and
+        return the batch id. Each contact is its own request, keyed by contact
+        id; results arrive within 24h at half the synchronous price, and the
+        queued requests add no pressure on the realtime rate limits.
+        """
+        batch = await self._with_retry(
+            self.client.messages.batches.create,
+            requests=[
+                {
+                    "custom_id": c.id,
+                    "params": {
+                        "model": MODEL,
+                        "max_tokens": 1024,
+                        "system": RESEARCH_SYSTEM,
+                        "messages": [{
+                            "role": "user",
+                            "content": self._build_prompt(c.name, c.organization, c.title, None),
+                        }],
+                    },
+                }
+                for c in contacts
+            ]
+        )
+        logger.info(f"[Tier3] Submitted research batch {batch.id} ({len(contacts)} contacts)")
+        return batch.id
+
+    async def poll_research_batch(
+        self, batch_id: str, poll_seconds: float = RESEARCH_BATCH_POLL_SECONDS
+    ) -> Dict[str, AIResearchResult]:
+        """Wait for a submitted batch to end and return its results by contact id."""
+        while True:
+            batch = await self._with_retry(self.client.messages.batches.retrieve, batch_id)
+            if batch.processing_status == "ended":
+                break
+            await asyncio.sleep(poll_seconds)
+
+        results: Dict[str, AIResearchResult] = {}
+        async for entry in await self._with_retry(self.client.messages.batches.results, batch_id):
+            outcome = entry.result
+            if outcome.type != "succeeded":
+                results[entry.custom_id] = AIResearchResult(
+                    success=False, error=f"Batch request {outcome.type}"
+                )
+                continue
+            message = outcome.message
+            input_tokens, output_tokens, cache_read, cache_write, cost_usd = _usage(message)
+            result = self._parse_response(
+                message.content[0].text,
+                input_tokens,
+                output_tokens,
+                cost_usd * BATCH_API_COST_FACTOR,
+            )
+            result.cache_read_tokens = cache_read
+            result.cache_write_tokens = cache_write
+            results[entry.custom_id] = result
+        return results
+
+    async def _create_message(self, **kwargs):
+        """messages.create in a concurrency slot, retried via `_with_retry`."""
+        async with self._slots:
+            return await self._with_retry(self.client.messages.create, **kwargs)
+
+    async def _with_retry(self, call, *args, **kwargs):
+        """
+        Await `call`, backing off 1s, 2s, 4s... (or Retry-After) on 429, any
+        5xx including 529 Overloaded, and connection errors or timeouts.
+        """
+        for attempt in range(CLAUDE_MAX_ATTEMPTS):
+            try:
+                return await call(*args, **kwargs)
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                status = getattr(e, "status_code", None)
+                retryable = status is None or status == 429 or status >= 500
+                if not retryable or attempt == CLAUDE_MAX_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt
+                if status is not None:
+                    try:
+                        delay = float(e.response.headers.get("retry-after", delay))
+                    except ValueError:
+                        pass
+                logger.warning(
+                    f"[Tier3] Claude {status or type(e).__name__} — retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
     def _build_prompt(
         self,
         name: str,
@@ -109,6 +299,83 @@ class ClaudeAdapter(IAIGateway):
         )
         return prompt
 
+    def _build_batch_prompt(self, contacts: Sequence[Contact]) -> str:
+        lines = [
+            f"{i}. Name: {c.name} | Title: {c.title} | Organization: {c.organization}"
+            for i, c in enumerate(contacts, 1)
+        ]
+        return (
+            f"Research these {len(contacts)} B2B contacts:\n"
+            + "\n".join(lines)
+            + "\n\nFor each, determine if they are still in their role at that organization "
+            "and, if they have left, identify their replacement. "
+            "Use publicly available information only. "
+            f"Return a JSON array of exactly {len(contacts)} objects, in the order listed."
+        )
+
+    def _parse_batch_response(
+        self,
+        content: str,
+        n: int,
+        input_tokens: int,
+        output_tokens: int,
+        cost_usd: float,
+    ) -> List[AIResearchResult]:
+        # Each contact carries an even share of the message's usage
+        tokens_in = _split(input_tokens, n)
+        tokens_out = _split(output_tokens, n)
+        cost_share = cost_usd / n
+
+        try:
+            start = content.find("[")
+            end = content.rfind("]") + 1
+            if start == -1 or end == 0:
+                raise ValueError("No JSON array found in response")
+            items = json.loads(content[start:end])
+            if not isinstance(items, list):
+                raise ValueError("Response is not a JSON array")
+        except Exception as e:
+            logger.error(f"[Tier3] Failed to parse Claude batch response: {e}\n{content}")
+            items = []
+            error = f"Parse error: {e}"
+        else:
+            error = f"Missing from batch response ({len(items)} of {n} returned)"
+
+        results = []
+        for i in range(n):
+            data = items[i] if i < len(items) else None
+            if isinstance(data, dict):
+                results.append(
+                    self._result_from(data, tokens_in[i], tokens_out[i], cost_share)
+                )
+            else:
+                results.append(AIResearchResult(
+                    success=False,
+                    tokens_input=tokens_in[i],
+                    tokens_output=tokens_out[i],
+                    cost_usd=cost_share,
+                    error=error,
+                ))
+        return results
+
+    @staticmethod
+    def _result_from(
+        data: dict, input_tokens: int, output_tokens: int, cost_usd: float
+    ) -> AIResearchResult:
+        return AIResearchResult(
+            success=True,
+            contact_still_active=data.get("contact_still_active"),
+            current_title=data.get("current_title"),
+            current_organization=data.get("current_organization"),
+            replacement_name=data.get("replacement_name"),
+            replacement_title=data.get("replacement_title"),
+            replacement_email=data.get("replacement_email"),
+            tokens_input=input_tokens,
+            tokens_output=output_tokens,
+            cost_usd=cost_usd,
+            evidence_urls=data.get("evidence_urls", []),
+        )
+
     def _parse_response(
         self, content: str, input_tokens: int, output_tokens: int, cost_usd: float
     ) -> AIResearchResult:
@@ -120,20 +387,7 @@ class ClaudeAdapter(IAIGateway):
                 raise ValueError("No JSON found in response")
 
             data = json.loads(content[start:end])
-
-            return AIResearchResult(
-                success=True,
-                contact_still_active=data.get("contact_still_active"),
-                current_title=data.get("current_title"),
-                current_organization=data.get("current_organization"),
-                replacement_name=data.get("replacement_name"),
-                replacement_title=data.get("replacement_title"),
-                replacement_email=data.get("replacement_email"),
-                tokens_input=input_tokens,
-                tokens_output=output_tokens,
-                cost_usd=cost_usd,
-                evidence_urls=data.get("evidence_urls", []),
-            )
+            return self._result_from(data, input_tokens, output_tokens, cost_usd)
         except Exception as e:
             logger.error(f"[Tier3] Failed to parse Claude response: {e}\n{content}")
             return AIResearchResult(
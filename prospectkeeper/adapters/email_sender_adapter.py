@@ -8,7 +8,7 @@ import logging
 import os
 from typing import TYPE_CHECKING, Optional
 
-import resend
+import httpx
 
 from ..domain.interfaces.i_email_sender_gateway import (
     IEmailSenderGateway,
@@ -20,23 +20,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+RESEND_EMAILS_URL = os.getenv("RESEND_API_URL", "https://api.resend.com") + "/emails"
+RESEND_MAX_ATTEMPTS = 4  # first try + 3 backoff retries on 429
+# Resend's default API quota is 2 requests/second per team
+RESEND_MAX_PER_SECOND = float(os.getenv("RESEND_MAX_PER_SECOND", "2"))
+
 
 class EmailSenderAdapter(IEmailSenderGateway):
     """
     Adapter that sends information-review emails using the Resend API.
+
+    Sends go through an async httpx client so they never block the event loop
+    and reuse pooled keep-alive connections to api.resend.com. The Container
+    injects its shared client; a private one is created when none is given.
+    Requests are paced to `max_per_second` across every concurrent caller of
+    this adapter, so a batch with any worker count stays inside Resend's quota;
+    429s that slip through are retried with exponential backoff (honouring
+    Retry-After).
     """
 
-    def __init__(self, api_key: str = None, from_email: str = "rolodex@robbylinson.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        from_email: str = "rolodex@robbylinson.dev",
+        http: Optional[httpx.AsyncClient] = None,
+        max_per_second: float = RESEND_MAX_PER_SECOND,
+    ):
         self.api_key = api_key or os.getenv("RESEND_API_KEY")
         self.from_email = from_email
-
-        if self.api_key:
-            resend.api_key = self.api_key
+        self._http = http or httpx.AsyncClient(http2=True, timeout=30.0)
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._interval = 1.0 / max_per_second
+        self._next_slot = 0.0  # event-loop time of the next free request slot
 
     async def send_confirmation(self, contact: "Contact") -> SendEmailResult:
-        # Rate-limit: half-second delay between sends
-        await asyncio.sleep(0.5)
-
         if not contact.email:
             return SendEmailResult(
                 success=False,
@@ -57,17 +74,25 @@ class EmailSenderAdapter(IEmailSenderGateway):
         try:
             logger.info(f"[EmailSender] Sending info-review email via Resend to {contact.email}")
 
-            response = resend.Emails.send({
+            response = await self._post_email({
                 "from": self.from_email,
                 "to": [contact.email],
                 "reply_to": "Rolodex-AI.r0xxak@zapiermail.com",
                 "subject": "Please review the information we have on file for you",
                 "html": html_content,
             })
+            if response.status_code != 200:
+                # Gateway errors come back as HTML/plain text, not Resend's JSON
+                if response.headers.get("content-type", "").startswith("application/json"):
+                    message = response.json().get("message", "Unknown error")
+                else:
+                    message = response.text or "Unknown error"
+                raise RuntimeError(f"Resend {response.status_code}: {message}")
+            body = response.json()
 
             logger.info(
                 f"[EmailSender] Successfully sent to {contact.email}. "
-                f"Resend ID: {response.get('id')}"
+                f"Resend ID: {body.get('id')}"
             )
             return SendEmailResult(success=True, email=contact.email)
 
@@ -81,6 +106,29 @@ class EmailSenderAdapter(IEmailSenderGateway):
 
     # ── Private helpers ───────────────────────────────────────────────────
 
+    async def _pace(self) -> None:
+        """Wait for this request's slot. Claiming it has no await, so it's race-free."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _post_email(self, payload: dict) -> httpx.Response:
+        """POST to Resend, backing off 1s, 2s, 4s on 429 (or its Retry-After)."""
+        for attempt in range(RESEND_MAX_ATTEMPTS):
+            await self._pace()
+            response = await self._http.post(RESEND_EMAILS_URL, json=payload, headers=self._headers)
+            if response.status_code != 429 or attempt == RESEND_MAX_ATTEMPTS - 1:
+                return response
+            try:
+                delay = float(response.headers.get("retry-after", 2 ** attempt))
+            except ValueError:
+                delay = 2 ** attempt
+            logger.warning(f"[EmailSender] Resend rate-limited — retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return response
+
     @staticmethod
     def _build_html(contact: "Contact", first_name: str) -> str:
         def _row(label: str, value: Optional[str]) -> str:
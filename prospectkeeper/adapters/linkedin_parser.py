@@ -0,0 +1,143 @@
+"""
+LinkedIn profile HTML parsing for NoDriverAdapter.
+Pure functions from raw page HTML to plain dicts/lists — no browser, no I/O —
+so they can run in worker processes and be tested against fixture HTML.
+
+DOM structure (verified Feb 2025):
+  Name:       h1.t-24.v-align-middle.break-words
+  Headline:   div.text-body-medium.break-words[data-generated-suggestion-target]
+  Location:   span.text-body-small.t-black--light.break-words
+  Sections:   <section> containing <div id="experience|education|skills">
+  Entries:    li.artdeco-list__item within each section
+  Title:      div.hoverable-link-text.t-bold span[aria-hidden=true]
+  Company:    span.t-14.t-normal:not(.t-black--light) span[aria-hidden=true]
+  Date:       span.pvs-entity__caption-wrapper[aria-hidden=true]
+  Desc:       div[class*=inline-show-more-text] span[aria-hidden=true]
+"""
+
+import re
+from typing import Optional, Union
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+_RE_PRESENT = re.compile(r"\bpresent\b", re.IGNORECASE)
+
+_ENTRY = "li.artdeco-list__item"
+_ENTRY_TITLE = "div.hoverable-link-text.t-bold span[aria-hidden='true']"
+_ENTRY_SUBTITLE = "span.t-14.t-normal:not(.t-black--light) span[aria-hidden='true']"
+_ENTRY_DATES = "span.pvs-entity__caption-wrapper[aria-hidden='true']"
+_ENTRY_DESCRIPTION = "div[class*='inline-show-more-text'] span[aria-hidden='true']"
+
+Root = Union[LexborHTMLParser, LexborNode]
+
+
+def parse_profile(html: str) -> dict:
+    """
+    Extract all profile data from the main profile page HTML.
+
+    Education and skills are the truncated 2–3 item previews; `detailLinks`
+    holds the hrefs of the /details/ pages that carry the complete lists.
+    """
+    tree = LexborHTMLParser(html)
+
+    exp_sec = _section(tree, "experience")
+    edu_sec = _section(tree, "education")
+    skills_sec = _section(tree, "skills")
+
+    return {
+        "name": _text(tree, "h1.t-24.v-align-middle.break-words"),
+        "headline": _text(tree, "div.text-body-medium.break-words[data-generated-suggestion-target]"),
+        "location": _text(tree, "span.text-body-small.t-black--light.break-words"),
+        "experience": _experience_entries(exp_sec) if exp_sec else [],
+        "education": _education_entries(edu_sec) if edu_sec else [],
+        "skills": _skill_names(skills_sec, "skill_card_skill_topic") if skills_sec else [],
+        "detailLinks": _detail_links(tree),
+    }
+
+
+def parse_education_details(html: str) -> list[dict]:
+    """Parse a /details/education page into entry dicts."""
+    tree = LexborHTMLParser(html)
+    return _education_entries(_section(tree, "education") or tree)
+
+
+def parse_skills_details(html: str) -> list[str]:
+    """Parse a /details/skills page into unique skill names."""
+    return _skill_names(LexborHTMLParser(html), "skill_page_skill_topic")
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+
+def _text(root: Root, sel: str) -> str:
+    el = root.css_first(sel)
+    return el.text(strip=True) if el else ""
+
+
+def _section(tree: LexborHTMLParser, section_id: str) -> Optional[LexborNode]:
+    """Return the <section> enclosing the div#<section_id> anchor, or None."""
+    node = tree.css_first(f"div#{section_id}")
+    while node is not None and node.tag != "section":
+        node = node.parent
+    return node
+
+
+def _experience_entries(root: Root) -> list[dict]:
+    entries = []
+    for li in root.css(_ENTRY):
+        title = _text(li, _ENTRY_TITLE)
+        company = _text(li, _ENTRY_SUBTITLE)
+        if title or company:
+            date_range = _text(li, _ENTRY_DATES)
+            entries.append({
+                "title": title, "company": company,
+                "dateRange": date_range,
+                "isCurrent": _RE_PRESENT.search(date_range) is not None,
+                "description": _text(li, _ENTRY_DESCRIPTION),
+            })
+    return entries
+
+
+def _education_entries(root: Root) -> list[dict]:
+    """Education entries under `root` (main-page section or detail page)."""
+    entries = []
+    for li in root.css(_ENTRY):
+        institution = _text(li, _ENTRY_TITLE)
+        date_range = _text(li, _ENTRY_DATES)
+        if institution and date_range:
+            entries.append({
+                "institution": institution,
+                "degree": _text(li, _ENTRY_SUBTITLE),
+                "dateRange": date_range,
+            })
+    return entries
+
+
+def _skill_names(root: Root, data_field: str) -> list[str]:
+    """Unique skill names under `root`, in page order.
+
+    `data_field` is the anchor's data-field — skill_card_skill_topic on the
+    main page, skill_page_skill_topic on /details/skills.
+    """
+    seen: set[str] = set()
+    names = []
+    for el in root.css(
+        f'a[data-field="{data_field}"] div.hoverable-link-text.t-bold span[aria-hidden="true"]'
+    ):
+        name = el.text(strip=True)
+        if name and name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def _detail_links(tree: LexborHTMLParser) -> dict[str, str]:
+    links = {}
+    for a in tree.css("a[href*='details/']"):
+        href = a.attributes.get("href") or ""
+        label = a.text(strip=True).lower()
+        if "education" in label or "details/education" in href:
+            links["education"] = href
+        if "skill" in label or "details/skills" in href:
+            links["skills"] = href
+    return links
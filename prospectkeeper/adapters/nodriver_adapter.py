@@ -5,40 +5,182 @@ nodriver is a modern asynchronous undetectable browser automation framework.
 """
 
 import asyncio
+import datetime
 import json
 import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
 from ..domain.interfaces.i_linkedin_gateway import ILinkedInGateway, LinkedInResult
+from .linkedin_parser import parse_education_details, parse_profile, parse_skills_details
 
 logger = logging.getLogger(__name__)
 
 LINKEDIN_TIMEOUT_SECONDS = 60
 
+# Hot-path patterns compiled once — the match loops run per entry.
+_AUTH_WALL_MARKERS = ("authwall", "checkpoint", "login", "uas/authenticate")
+_RE_YEAR = re.compile(r"\b((?:19|20)\d{2})\b")
+_RE_HEADLINE_TITLE = re.compile(r"^(.+?)\s+at\s+.+$", re.IGNORECASE)
+
+# Evaluated in the page instead of DOM.getDocument(depth=-1), which ships the
+# whole node tree over CDP and materialises it as Python objects. The readiness
+# probe returns one boolean; the capture returns only <main> — the nav, footer
+# and multi-MB <code> JSON blobs LinkedIn embeds in <body> are never copied,
+# pickled into the parse pool, or built into a DOM there.
+_JS_PROFILE_READY = "document.querySelector('li.artdeco-list__item') !== null"
+_JS_MAIN_HTML = "(document.querySelector('main') || document.documentElement).outerHTML"
+
+# HTML parsing is CPU-bound — run it in worker processes so a multi-MB profile
+# parse never stalls the event loop (or other requests) behind the GIL.
+_parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+async def _done(value):
+    """Awaitable that resolves to `value` — a no-op slot in an asyncio.gather."""
+    return value
+
+
+class _PooledBrowser:
+    """A pooled browser and the number of scrapes it has served."""
+
+    __slots__ = ("browser", "uses")
+
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.uses = 0
+
 
 class NoDriverAdapter(ILinkedInGateway):
     """
     Tier 2 LinkedIn verification via nodriver browser.
 
-    Requires: pip install nodriver beautifulsoup4
+    Requires: pip install nodriver selectolax
     Optional: place a JSON cookie export as linkedincookie.json in the project root
               (or set LINKEDIN_COOKIES_FILE env var) for authenticated access.
               Falls back to LINKEDIN_COOKIES_STRING (semicolon-separated name=value pairs).
 
     Architecture: browser is used only to load pages and capture raw HTML.
-    All parsing is done in Python with BeautifulSoup — no complex JS evaluation
-    that can fail due to CDP context invalidation from LinkedIn's SPA routing.
+    All parsing is done in Python with selectolax (lexbor C parser), in
+    linkedin_parser, off the event loop in worker processes — no complex
+    JS evaluation that can fail due to CDP context invalidation from LinkedIn's
+    SPA routing.
+
+    Browser lifecycle: call `start_pool(size)` once (e.g. at app startup) to
+    keep `size` warm Chrome processes whose session cookies are injected a
+    single time. Each scrape checks one out of the pool for its exclusive use
+    and returns it afterwards; a browser is replaced in the background after
+    `recycle_after` scrapes (or a failed one) so leaked memory and wedged
+    sessions don't accumulate. Without a pool, every scrape launches and stops
+    its own Chrome as before.
     """
 
+    def __init__(self, recycle_after: int = 100) -> None:
+        self._recycle_after = recycle_after
+        self._pool: Optional[asyncio.Queue] = None
+        self._pool_size = 0
+        self._recycled = 0
+        self._recycle_tasks: set = set()
+        self._cookies: Optional[list] = None  # parsed once, reused per browser launch
+
+    async def start_pool(self, size: int = 1) -> None:
+        """Launch `size` browsers concurrently and park them in the pool."""
+        import nodriver as uc
+
+        if self._pool is not None:
+            return
+        launched = await asyncio.gather(
+            *(self._launch_browser(uc) for _ in range(size)), return_exceptions=True
+        )
+        pool: asyncio.Queue = asyncio.Queue()
+        for browser in launched:
+            if isinstance(browser, BaseException):
+                logger.warning(f"[Tier2] Pool browser failed to start: {browser}")
+            else:
+                pool.put_nowait(_PooledBrowser(browser))
+        if pool.empty():
+            raise RuntimeError("No pool browser could be started")
+        self._pool = pool
+        self._pool_size = pool.qsize()
+        logger.info(f"[Tier2] Browser pool started ({self._pool_size} browsers)")
+
+    async def stop_pool(self) -> None:
+        """Stop every pooled browser, including any still being recycled."""
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        for task in list(self._recycle_tasks):
+            task.cancel()
+        await asyncio.gather(*self._recycle_tasks, return_exceptions=True)
+        while not pool.empty():
+            entry = pool.get_nowait()
+            if entry.browser is not None:
+                entry.browser.stop()
+        self._pool_size = 0
+        logger.info("[Tier2] Browser pool stopped")
+
+    def pool_stats(self) -> dict:
+        """Pool gauges for the /metrics route."""
+        return {
+            "size": self._pool_size,
+            "available": self._pool.qsize() if self._pool is not None else 0,
+            "recycled": self._recycled,
+            "recycle_after": self._recycle_after,
+        }
+
+    async def _launch_browser(self, uc):
+        """Start a browser with the LinkedIn session cookies already set."""
+        browser = await uc.start(headless=False)
+        try:
+            await self._inject_cookies(uc, browser)
+        except Exception:
+            browser.stop()
+            raise
+        return browser
+
+    def _release(self, entry: "_PooledBrowser", failed: bool) -> None:
+        """Return a checked-out browser to the pool, recycling it if it is due."""
+        pool = self._pool
+        if pool is None:  # pool stopped while this scrape was running
+            if entry.browser is not None:
+                entry.browser.stop()
+            return
+        entry.uses += 1
+        if not failed and entry.uses < self._recycle_after:
+            pool.put_nowait(entry)
+            return
+        task = asyncio.create_task(self._recycle(pool, entry))
+        self._recycle_tasks.add(task)
+        task.add_done_callback(self._recycle_tasks.discard)
+
+    async def _recycle(self, pool: asyncio.Queue, entry: "_PooledBrowser") -> None:
+        import nodriver as uc
+
+        if entry.browser is not None:
+            entry.browser.stop()
+        try:
+            browser = await self._launch_browser(uc)
+        except Exception as e:
+            # Keep the pool at full size: the empty slot goes back in and the
+            # next scrape that checks it out retries the launch.
+            logger.warning(f"[Tier2] Pool browser relaunch failed: {e}")
+            browser = None
+        if pool is not self._pool:
+            if browser is not None:
+                browser.stop()
+            return
+        self._recycled += 1
+        pool.put_nowait(_PooledBrowser(browser))
+        logger.info(f"[Tier2] Recycled pool browser after {entry.uses} scrapes")
+
     async def verify_employment(
         self,
         contact_name: str,
         organization: str,
         linkedin_url: Optional[str] = None,
+        full_profile: bool = True,
     ) -> LinkedInResult:
         if not linkedin_url:
             logger.info(f"[Tier2] No LinkedIn URL stored for {contact_name} — skipping tier")
@@ -46,7 +188,7 @@ class NoDriverAdapter(ILinkedInGateway):
 
         try:
             return await asyncio.wait_for(
-                self._scrape_linkedin(contact_name, organization, linkedin_url),
+                self._scrape_linkedin(contact_name, organization, linkedin_url, full_profile),
                 timeout=LINKEDIN_TIMEOUT_SECONDS,
             )
         except asyncio.TimeoutError:
@@ -64,34 +206,42 @@ class NoDriverAdapter(ILinkedInGateway):
         contact_name: str,
         organization: str,
         linkedin_url: str,
+        full_profile: bool = True,
     ) -> LinkedInResult:
         import nodriver as uc
 
-        logger.info(f"[Tier2] Starting nodriver for {contact_name}")
-        # Using headless=False as requested/implied by "tab is opening"
-        # Removing no_sandbox=True as it's often problematic on macOS
-        try:
-            browser = await uc.start(headless=False)
-        except Exception as startup_err:
-            logger.error(f"[Tier2] Failed to start browser: {startup_err}")
-            return LinkedInResult(success=False, error=f"Browser startup failed: {startup_err}")
+        entry = await self._pool.get() if self._pool is not None else None
+        if entry is not None:
+            if entry.browser is None:  # an earlier relaunch failed
+                try:
+                    entry.browser = await self._launch_browser(uc)
+                except Exception as startup_err:
+                    self._release(entry, failed=True)
+                    return LinkedInResult(success=False, error=f"Browser startup failed: {startup_err}")
+                except BaseException:
+                    # Cancelled mid-launch (e.g. the scrape timeout) — the slot
+                    # still goes back, or the pool shrinks for good.
+                    self._release(entry, failed=True)
+                    raise
+            browser = entry.browser
+        else:
+            logger.info(f"[Tier2] Starting nodriver for {contact_name}")
+            # Using headless=False as requested/implied by "tab is opening"
+            # Removing no_sandbox=True as it's often problematic on macOS
+            try:
+                browser = await uc.start(headless=False)
+            except Exception as startup_err:
+                logger.error(f"[Tier2] Failed to start browser: {startup_err}")
+                return LinkedInResult(success=False, error=f"Browser startup failed: {startup_err}")
 
+        failed = False
         try:
-            # ── 1. Inject cookies ─────────────────────────────────────────────
-            # Navigate to a blank page first to set cookies for the domain
-            page = await browser.get("https://www.linkedin.com/robots.txt")
-            await page.sleep(1.0)
-            
-            cookies = self._build_cookies(uc)
-            if cookies:
-                await page.send(uc.cdp.network.set_cookies(cookies=cookies))
-                logger.debug(f"[Tier2] Injected {len(cookies)} cookies")
+            # ── 1. Inject cookies (already done once for a pooled browser) ────
+            if entry is None:
+                await self._inject_cookies(uc, browser)
 
             # ── 2. Navigate to profile ────────────────────────────────────────
             logger.info(f"[Tier2] Navigating to {linkedin_url}")
-            # Use the existing page/tab instead of opening a new one if possible
-            # browser.get() usually creates a new tab if no tab is active, 
-            # or uses the existing one.
             page = await browser.get(linkedin_url)
 
             # Wait for LinkedIn SPA to finish rendering — poll until the
@@ -100,14 +250,13 @@ class NoDriverAdapter(ILinkedInGateway):
                 await asyncio.sleep(1.5)
                 current_url = page.target.url or ""
                 # Stop early if we hit an auth wall
-                if any(kw in current_url for kw in ("authwall", "checkpoint", "login", "uas/authenticate")):
+                if any(kw in current_url for kw in _AUTH_WALL_MARKERS):
                     break
                 try:
-                    html_check = await page.get_content()
                     # Wait until actual list items are rendered — artdeco-card alone can be
                     # skeleton loaders (pvs-loader), so we require artdeco-list__item which
                     # only appears once the experience/education sections have fully loaded.
-                    if html_check and 'artdeco-list__item' in html_check:
+                    if await page.evaluate(_JS_PROFILE_READY, return_by_value=True) is True:
                         logger.info("[Tier2] Profile content detected — proceeding")
                         break
                 except Exception:
@@ -117,8 +266,12 @@ class NoDriverAdapter(ILinkedInGateway):
             current_url = page.target.url or ""
             logger.debug(f"[Tier2] Current URL: {current_url}")
 
-            if any(kw in current_url for kw in ("authwall", "checkpoint", "login", "uas/authenticate")):
+            if any(kw in current_url for kw in _AUTH_WALL_MARKERS):
                 logger.warning("[Tier2] Auth wall detected")
+                # Session likely expired: re-read the cookie file on the next
+                # launch, and have the pool replace this browser with one.
+                self._cookies = None
+                failed = True
                 await page.save_screenshot("debug_linkedin_authwall.png")
                 return LinkedInResult(success=False, blocked=True, error="Auth wall")
 
@@ -135,12 +288,20 @@ class NoDriverAdapter(ILinkedInGateway):
                 f.write(html)
             logger.info(f"[Tier2] Captured {len(html):,} bytes of HTML")
 
-            # ── 5. Parse main profile ─────────────────────────────────────────
-            soup = BeautifulSoup(html, "html.parser")
-            profile = self._parse_main_profile(soup)
+            # ── 5. Parse main profile (off the event loop) ────────────────────
+            loop = asyncio.get_running_loop()
+            profile = await loop.run_in_executor(_parse_pool, parse_profile, html)
 
             # ── 6. Fetch detail pages ─────────────────────────────────────────
             detail_links = profile.pop("detailLinks", {})
+            if not full_profile and organization:
+                # More education entries can only add matches, never remove
+                # one — a confirmed match needs neither detail page.
+                result = self._build_result(profile, contact_name, organization, current_url)
+                if result.still_at_organization:
+                    logger.info("[Tier2] Employment confirmed on main page — skipping detail pages")
+                    result.education = result.skills = None
+                    return result
             if detail_links:
                 profile["education"], profile["skills"] = await self._fetch_detail_pages(
                     browser, detail_links,
@@ -151,20 +312,44 @@ class NoDriverAdapter(ILinkedInGateway):
             return self._build_result(profile, contact_name, organization, current_url)
 
         except Exception as e:
+            failed = True
             logger.exception(f"[Tier2] Unexpected error during scraping: {e}")
             raise
+        except BaseException:
+            # Cancelled (e.g. the verify_employment timeout) with a tab possibly
+            # mid-navigation: replace the browser rather than pooling it again.
+            failed = True
+            raise
         finally:
-            browser.stop()
+            if entry is None:
+                browser.stop()
+            else:
+                self._release(entry, failed)
+
+    async def _inject_cookies(self, uc, browser) -> None:
+        """Set the LinkedIn session cookies on `browser`."""
+        # Navigate to a blank page first to set cookies for the domain
+        page = await browser.get("https://www.linkedin.com/robots.txt")
+        await page.sleep(1.0)
+
+        if self._cookies is None:
+            self._cookies = self._build_cookies(uc)
+        cookies = self._cookies
+        if cookies:
+            await page.send(uc.cdp.network.set_cookies(cookies=cookies))
+            logger.debug(f"[Tier2] Injected {len(cookies)} cookies")
 
     # ── HTML capture ──────────────────────────────────────────────────────────
 
     @staticmethod
     async def _get_html(page, retries: int = 3) -> str:
-        """Get page HTML via CDP using backend_node_id (stable across SPA navigation)."""
+        """Get the page's <main> HTML (whole document if there is no <main>)."""
         for attempt in range(retries):
             try:
-                html = await page.get_content()
-                return html or ""
+                html = await page.evaluate(_JS_MAIN_HTML, return_by_value=True)
+                if not isinstance(html, str):
+                    raise RuntimeError(f"outerHTML evaluation returned {type(html).__name__}")
+                return html
             except Exception as e:
                 if attempt < retries - 1:
                     logger.debug(f"[Tier2] HTML capture attempt {attempt + 1} failed: {e} — retrying")
@@ -173,158 +358,63 @@ class NoDriverAdapter(ILinkedInGateway):
                     logger.warning(f"[Tier2] HTML capture failed after {retries} attempts: {e}")
                     return ""
 
-    # ── BeautifulSoup parsing ─────────────────────────────────────────────────
-
-    @staticmethod
-    def _parse_main_profile(soup: BeautifulSoup) -> dict:
-        """
-        Extract all profile data from the main profile page HTML.
-
-        DOM structure (verified Feb 2025):
-          Name:       h1.t-24.v-align-middle.break-words
-          Headline:   div.text-body-medium.break-words[data-generated-suggestion-target]
-          Location:   span.text-body-small.t-black--light.break-words
-          Sections:   <section> containing <div id="experience|education|skills">
-          Entries:    li.artdeco-list__item within each section
-          Title:      div.hoverable-link-text.t-bold span[aria-hidden=true]
-          Company:    span.t-14.t-normal:not(.t-black--light) span[aria-hidden=true]
-          Date:       span.pvs-entity__caption-wrapper[aria-hidden=true]
-          Desc:       div[class*=inline-show-more-text] span[aria-hidden=true]
-        """
-        def txt(root, sel):
-            el = root.select_one(sel)
-            return el.get_text(strip=True) if el else ""
-
-        # ── Top card ──────────────────────────────────────────────────────────
-        name = txt(soup, "h1.t-24.v-align-middle.break-words")
-        headline = txt(soup, "div.text-body-medium.break-words[data-generated-suggestion-target]")
-        location = txt(soup, "span.text-body-small.t-black--light.break-words")
-
-        # ── Section helper ────────────────────────────────────────────────────
-        def get_section(section_id):
-            anchor = soup.find("div", id=section_id)
-            return anchor.find_parent("section") if anchor else None
-
-        # ── Experience ────────────────────────────────────────────────────────
-        experience = []
-        exp_sec = get_section("experience")
-        if exp_sec:
-            for li in exp_sec.find_all("li", class_="artdeco-list__item"):
-                title     = txt(li, "div.hoverable-link-text.t-bold span[aria-hidden='true']")
-                company   = txt(li, "span.t-14.t-normal:not(.t-black--light) span[aria-hidden='true']")
-                date_range = txt(li, "span.pvs-entity__caption-wrapper[aria-hidden='true']")
-                desc_el   = li.select_one("div[class*='inline-show-more-text'] span[aria-hidden='true']")
-                desc      = desc_el.get_text(strip=True) if desc_el else ""
-                is_current = bool(re.search(r"\bpresent\b", date_range, re.IGNORECASE))
-                if title or company:
-                    experience.append({
-                        "title": title, "company": company,
-                        "dateRange": date_range, "isCurrent": is_current,
-                        "description": desc,
-                    })
-
-        # ── Education (truncated on main page — full list via detail page) ────
-        education = []
-        edu_sec = get_section("education")
-        if edu_sec:
-            for li in edu_sec.find_all("li", class_="artdeco-list__item"):
-                institution = txt(li, "div.hoverable-link-text.t-bold span[aria-hidden='true']")
-                degree      = txt(li, "span.t-14.t-normal:not(.t-black--light) span[aria-hidden='true']")
-                date_range  = txt(li, "span.pvs-entity__caption-wrapper[aria-hidden='true']")
-                if institution and date_range:
-                    education.append({"institution": institution, "degree": degree, "dateRange": date_range})
-
-        # ── Skills (truncated on main page — full list via detail page) ───────
-        skills = []
-        skills_sec = get_section("skills")
-        if skills_sec:
-            seen = set()
-            for el in skills_sec.select(
-                'a[data-field="skill_card_skill_topic"] div.hoverable-link-text.t-bold span[aria-hidden="true"]'
-            ):
-                name_s = el.get_text(strip=True)
-                if name_s and name_s not in seen:
-                    seen.add(name_s)
-                    skills.append(name_s)
-
-        # ── Detail page links ─────────────────────────────────────────────────
-        detail_links = {}
-        for a in soup.select("a[href*='details/']"):
-            h = a.get("href", "")
-            t = a.get_text(strip=True).lower()
-            if "education" in t or "details/education" in h:
-                detail_links["education"] = h
-            if "skill" in t or "details/skills" in h:
-                detail_links["skills"] = h
-
-        return {
-            "name": name, "headline": headline, "location": location,
-            "experience": experience, "education": education, "skills": skills,
-            "detailLinks": detail_links,
-        }
-
     # ── Detail page fetchers ───────────────────────────────────────────────────
 
     async def _fetch_detail_pages(
         self, browser, detail_links: dict,
         education: list, skills: list,
     ) -> tuple:
-        """Fetch /details/education and /details/skills for the complete lists."""
+        """Fetch /details/education and /details/skills concurrently for the complete lists.
+
+        Each detail page loads in its own tab of the scrape's (already
+        authenticated) browser, so the two navigations and settle waits overlap.
+        """
         edu_url = detail_links.get("education")
         skills_url = detail_links.get("skills")
-
-        if edu_url:
-            try:
-                edu_page = await browser.get(edu_url)
-                await edu_page.sleep(2.5)
-                html = await self._get_html(edu_page)
-                if html:
-                    soup = BeautifulSoup(html, "html.parser")
-                    anchor = soup.find("div", id="education")
-                    sec = anchor.find_parent("section") if anchor else soup
-                    fetched = []
-                    for li in sec.find_all("li", class_="artdeco-list__item"):
-                        institution = NoDriverAdapter._t(li, "div.hoverable-link-text.t-bold span[aria-hidden='true']")
-                        degree      = NoDriverAdapter._t(li, "span.t-14.t-normal:not(.t-black--light) span[aria-hidden='true']")
-                        date_range  = NoDriverAdapter._t(li, "span.pvs-entity__caption-wrapper[aria-hidden='true']")
-                        if institution and date_range:
-                            fetched.append({"institution": institution, "degree": degree, "dateRange": date_range})
-                    if fetched:
-                        logger.debug(f"[Tier2] Education detail: {len(fetched)} entries")
-                        education = fetched
-            except Exception as e:
-                logger.debug(f"[Tier2] Education detail failed: {e}")
-
-        if skills_url:
+        return tuple(await asyncio.gather(
+            self._fetch_education(browser, edu_url, education) if edu_url else _done(education),
+            self._fetch_skills(browser, skills_url, skills) if skills_url else _done(skills),
+        ))
+
+    async def _fetch_detail_html(self, browser, url: str) -> Optional[str]:
+        """Load `url` in a new tab and return its settled HTML."""
+        tab = await browser.get(url, new_tab=True)
+        try:
+            await tab.sleep(2.5)
+            return await self._get_html(tab)
+        finally:
             try:
-                sk_page = await browser.get(skills_url)
-                await sk_page.sleep(2.5)
-                html = await self._get_html(sk_page)
-                if html:
-                    with open("debug_linkedin_skills.html", "w", encoding="utf-8") as f:
-                        f.write(html)
-                    soup = BeautifulSoup(html, "html.parser")
-                    seen, fetched = set(), []
-                    for el in soup.select(
-                        'a[data-field="skill_page_skill_topic"] '
-                        'div.hoverable-link-text.t-bold span[aria-hidden="true"]'
-                    ):
-                        name = el.get_text(strip=True)
-                        if name and name not in seen:
-                            seen.add(name)
-                            fetched.append(name)
-                    if fetched:
-                        logger.debug(f"[Tier2] Skills detail: {len(fetched)} skills")
-                        skills = fetched
+                await tab.close()
             except Exception as e:
-                logger.debug(f"[Tier2] Skills detail failed: {e}")
+                logger.debug(f"[Tier2] Failed to close detail tab: {e}")
 
-        return education, skills
+    async def _fetch_education(self, browser, url: str, education: list) -> list:
+        try:
+            html = await self._fetch_detail_html(browser, url)
+            if html:
+                loop = asyncio.get_running_loop()
+                fetched = await loop.run_in_executor(_parse_pool, parse_education_details, html)
+                if fetched:
+                    logger.debug(f"[Tier2] Education detail: {len(fetched)} entries")
+                    education = fetched
+        except Exception as e:
+            logger.debug(f"[Tier2] Education detail failed: {e}")
+        return education
 
-    @staticmethod
-    def _t(root, sel: str) -> str:
-        el = root.select_one(sel)
-        return el.get_text(strip=True) if el else ""
+    async def _fetch_skills(self, browser, url: str, skills: list) -> list:
+        try:
+            html = await self._fetch_detail_html(browser, url)
+            if html:
+                with open("debug_linkedin_skills.html", "w", encoding="utf-8") as f:
+                    f.write(html)
+                loop = asyncio.get_running_loop()
+                fetched = await loop.run_in_executor(_parse_pool, parse_skills_details, html)
+                if fetched:
+                    logger.debug(f"[Tier2] Skills detail: {len(fetched)} skills")
+                    skills = fetched
+        except Exception as e:
+            logger.debug(f"[Tier2] Skills detail failed: {e}")
+        return skills
 
     # ── Result builder ────────────────────────────────────────────────────────
 
@@ -368,7 +458,6 @@ class NoDriverAdapter(ILinkedInGateway):
         # Check education section — covers students whose org is a university.
         # An education entry is "current" if it contains "present" OR its end year is
         # in the future (e.g. "Sep 2025 - Jul 2029" → end year 2029 > current year).
-        import datetime
         _current_year = datetime.datetime.now().year
 
         def _edu_is_current(e: dict) -> bool:
@@ -378,7 +467,7 @@ class NoDriverAdapter(ILinkedInGateway):
             if "present" in dr:
                 return True
             # Extract all 4-digit years; the last one is the end year
-            years = re.findall(r"\b((?:19|20)\d{2})\b", dr)
+            years = _RE_YEAR.findall(dr)
             if years:
                 end_year = int(years[-1])
                 return end_year >= _current_year
@@ -407,7 +496,7 @@ class NoDriverAdapter(ILinkedInGateway):
             # No org supplied — just return the most recent current role.
             current_title = current_entries[0].get("title") or None
         elif headline_match:
-            m = re.match(r"^(.+?)\s+at\s+.+$", headline, re.IGNORECASE)
+            m = _RE_HEADLINE_TITLE.match(headline)
             current_title = m.group(1).strip() if m else headline
 
         logger.info(
@@ -4,12 +4,15 @@ Uses the supabase-py client to read/write contact records via PostgREST.
 Follows Supabase best practices: typed queries, RLS-aware, connection pooling via env.
 """
 
+import asyncio
 import logging
 import uuid
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 
-from supabase import create_client, Client
+import httpx
+from supabase import ClientOptions, create_client, Client
 
 from ..domain.entities.contact import Contact, ContactStatus
 from ..domain.entities.verification_result import VerificationResult
@@ -18,6 +21,13 @@ from ..domain.interfaces.i_data_repository import IDataRepository
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent PostgREST requests per adapter — the HTTP pool and
+# the worker threads that run the (blocking) supabase-py calls share it.
+POOL_MAX_CONNECTIONS = 20
+POOL_MAX_KEEPALIVE = 10
+# Rows per PostgREST request when streaming contacts with iter_contacts()
+ITER_PAGE_SIZE = 500
+
 
 def _parse_iso(date_str: Optional[str]) -> datetime:
     if not date_str:
@@ -76,35 +86,100 @@ class SupabaseAdapter(IDataRepository):
     """
 
     def __init__(self, url: str, key: str):
-        self.client: Client = create_client(url, key)
+        # supabase-py's sync client blocks on every execute(), so queries run
+        # on a bounded thread pool over one keep-alive HTTP/2 connection pool —
+        # a burst of repository calls queues for a slot instead of stalling
+        # the event loop or opening unbounded connections.
+        self._http = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=POOL_MAX_KEEPALIVE,
+            ),
+            timeout=30.0,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=POOL_MAX_CONNECTIONS, thread_name_prefix="supabase"
+        )
+        self.client: Client = create_client(url, key, options=ClientOptions(httpx_client=self._http))
+
+    async def _execute(self, query):
+        """Run a built PostgREST query off the event loop and return its response."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, query.execute)
+
+    def close(self) -> None:
+        """Release pooled connections and worker threads. Call once on shutdown."""
+        self._executor.shutdown(wait=False)
+        self._http.close()
 
     async def get_all_contacts(self) -> List[Contact]:
-        response = self.client.table("contacts").select("*").neq("status", "opted_out").execute()
+        response = await self._execute(
+            self.client.table("contacts").select("*").neq("status", "opted_out")
+        )
+        return [_row_to_contact(r) for r in response.data]
+
+    async def get_contacts(
+        self, status: Optional[str] = None, limit: int = 50, with_email: bool = False
+    ) -> List[Contact]:
+        query = self.client.table("contacts").select("*").neq("status", "opted_out")
+        if status:
+            query = query.eq("status", status)
+        if with_email:
+            # email <> '' is NULL (so excluded) for NULL emails as well
+            query = query.neq("email", "")
+        response = await self._execute(query.limit(limit))
         return [_row_to_contact(r) for r in response.data]
 
+    async def iter_contacts(
+        self,
+        status: Optional[str] = None,
+        with_email: bool = False,
+        needs_review: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Contact]:
+        def page(start: int, end: int):
+            # postgrest builders mutate in place, so each page gets a fresh one
+            query = self.client.table("contacts").select("*").neq("status", "opted_out")
+            if status:
+                query = query.eq("status", status)
+            if with_email:
+                query = query.neq("email", "")
+            if needs_review is not None:
+                query = query.eq("needs_human_review", needs_review)
+            # Stable order so offset pages neither skip nor repeat rows
+            return query.order("id").range(start, end - 1)
+
+        start = 0
+        while limit is None or start < limit:
+            end = start + ITER_PAGE_SIZE if limit is None else min(start + ITER_PAGE_SIZE, limit)
+            response = await self._execute(page(start, end))
+            for row in response.data:
+                yield _row_to_contact(row)
+            if len(response.data) < end - start:
+                return
+            start = end
+
     async def get_contacts_for_verification(self, limit: int = 50) -> List[Contact]:
-        response = (
+        response = await self._execute(
             self.client.table("contacts")
             .select("*")
             .neq("status", "opted_out")
             .eq("needs_human_review", False)
             .limit(limit)
-            .execute()
         )
         return [_row_to_contact(r) for r in response.data]
 
     async def get_contacts_needing_review(self) -> List[Contact]:
-        response = (
+        response = await self._execute(
             self.client.table("contacts")
             .select("*")
             .eq("needs_human_review", True)
-            .execute()
         )
         return [_row_to_contact(r) for r in response.data]
 
     async def get_contact_by_id(self, contact_id: str) -> Optional[Contact]:
-        response = (
-            self.client.table("contacts").select("*").eq("id", contact_id).execute()
+        response = await self._execute(
+            self.client.table("contacts").select("*").eq("id", contact_id)
         )
         if response.data:
             return _row_to_contact(response.data[0])
@@ -112,7 +187,7 @@ class SupabaseAdapter(IDataRepository):
 
     async def save_contact(self, contact: Contact) -> Contact:
         row = _contact_to_row(contact)
-        self.client.table("contacts").upsert(row).execute()
+        await self._execute(self.client.table("contacts").upsert(row))
         return contact
 
     async def save_verification_result(self, result: VerificationResult) -> None:
@@ -132,35 +207,42 @@ class SupabaseAdapter(IDataRepository):
             "highest_tier_used": result.economics.highest_tier_used,
             "verified_at": datetime.utcnow().isoformat(),
         }
-        self.client.table("verification_results").insert(row).execute()
+        await self._execute(self.client.table("verification_results").insert(row))
 
     async def bulk_update_contacts(self, contacts: List[Contact]) -> None:
         rows = [_contact_to_row(c) for c in contacts]
-        self.client.table("contacts").upsert(rows).execute()
+        await self._execute(self.client.table("contacts").upsert(rows))
 
     async def insert_contact(self, contact: Contact) -> Contact:
         row = _contact_to_row(contact)
         row["created_at"] = contact.created_at.isoformat()
-        self.client.table("contacts").insert(row).execute()
+        await self._execute(self.client.table("contacts").insert(row))
         return contact
 
+    async def bulk_insert_contacts(self, contacts: List[Contact]) -> None:
+        rows = []
+        for contact in contacts:
+            row = _contact_to_row(contact)
+            row["created_at"] = contact.created_at.isoformat()
+            rows.append(row)
+        # One multi-row INSERT (one request, one transaction) for the whole chunk
+        await self._execute(self.client.table("contacts").insert(rows))
+
     async def delete_contact(self, contact_id: str) -> bool:
         """Delete a contact by ID. Returns True if a row was deleted."""
-        response = (
+        response = await self._execute(
             self.client.table("contacts")
             .delete()
             .eq("id", contact_id)
-            .execute()
         )
         return bool(response.data)
 
     async def get_contact_by_email(self, email: str) -> Optional[Contact]:
-        response = (
+        response = await self._execute(
             self.client.table("contacts")
             .select("*")
             .ilike("email", email)
             .limit(1)
-            .execute()
         )
         if response.data:
             return _row_to_contact(response.data[0])
@@ -170,28 +252,55 @@ class SupabaseAdapter(IDataRepository):
 
     async def save_linkedin_snapshot(self, snapshot: dict) -> None:
         """Insert a new LinkedIn scrape snapshot row."""
-        self.client.table("linkedin_snapshots").insert(snapshot).execute()
+        await self._execute(self.client.table("linkedin_snapshots").insert(snapshot))
 
     async def get_latest_linkedin_snapshot(self, contact_id: str) -> Optional[dict]:
         """Return the most recent snapshot for hash comparison, or None."""
-        response = (
+        response = await self._execute(
             self.client.table("linkedin_snapshots")
             .select("profile_hash, current_title, current_org, headline, scraped_at")
             .eq("contact_id", contact_id)
             .order("scraped_at", desc=True)
             .limit(1)
-            .execute()
         )
         return response.data[0] if response.data else None
 
     async def get_all_linkedin_freshness(self) -> dict:
         """Return {contact_id: {last_scraped_at, last_changed_at}} for all contacts."""
         try:
-            response = self.client.table("contact_linkedin_freshness").select("*").execute()
+            response = await self._execute(
+                self.client.table("contact_linkedin_freshness").select("*")
+            )
             return {r["contact_id"]: r for r in response.data}
         except Exception:
             return {}
 
+    async def get_all_contacts_with_freshness(self) -> List[tuple[Contact, dict]]:
+        """
+        Return every non-opted-out contact paired with its LinkedIn freshness
+        ({last_scraped_at, last_changed_at}; empty if never scraped).
+
+        One query against the contacts_with_freshness view (migration 004). If
+        the view isn't deployed, falls back to contacts + freshness queries.
+        """
+        try:
+            response = await self._execute(
+                self.client.table("contacts_with_freshness")
+                .select("*")
+                .neq("status", "opted_out")
+            )
+        except Exception as e:
+            logger.warning(f"[SupabaseAdapter] contacts_with_freshness unavailable ({e}) — using two queries")
+            freshness = await self.get_all_linkedin_freshness()
+            return [(c, freshness.get(c.id, {})) for c in await self.get_all_contacts()]
+        return [
+            (
+                _row_to_contact(r),
+                {"last_scraped_at": r.get("last_scraped_at"), "last_changed_at": r.get("last_changed_at")},
+            )
+            for r in response.data
+        ]
+
     async def save_batch_receipt(self, receipt: ValueProofReceipt) -> None:
         """Persist the Value-Proof Receipt for a completed batch run."""
         row = {
@@ -211,18 +320,25 @@ class SupabaseAdapter(IDataRepository):
             "run_at": receipt.run_at.isoformat(),
         }
         logger.info(f"[SupabaseAdapter] Saving batch receipt: batch_id={receipt.batch_id} processed={receipt.contacts_processed}")
-        self.client.table("batch_receipts").insert(row).execute()
+        await self._execute(self.client.table("batch_receipts").insert(row))
         logger.info(f"[SupabaseAdapter] Batch receipt saved OK")
 
+    async def get_batch_receipts(self, limit: int = 10, non_empty_only: bool = False) -> List[dict]:
+        """Return the most recent batch receipt rows, newest first."""
+        query = self.client.table("batch_receipts").select("*")
+        if non_empty_only:
+            query = query.gt("contacts_processed", 0)
+        response = await self._execute(query.order("run_at", desc=True).limit(limit))
+        return response.data
+
     async def get_latest_change_summary(self, contact_id: str) -> Optional[dict]:
         """Return the most recent snapshot row where data actually changed."""
-        response = (
+        response = await self._execute(
             self.client.table("linkedin_snapshots")
             .select("change_summary, scraped_at, current_title, current_org, headline")
             .eq("contact_id", contact_id)
             .eq("data_changed", True)
             .order("scraped_at", desc=True)
             .limit(1)
-            .execute()
         )
         return response.data[0] if response.data else None
@@ -1,6 +1,10 @@
 """
 Webhook adapter — receives inbound email replies via Zapier POST.
-Run alongside Streamlit on a separate port (8502).
+
+`router` carries the endpoint and is mounted on linkedin_api's app, so the
+webhook shares that server's event loop and DI container. `app` wraps the same
+router for standalone deploys (e.g. Railway: `uvicorn
+prospectkeeper.adapters.webhook_adapter:app`, or `start()` on port 8502).
 
 On receipt, delegates to ProcessInboundEmailUseCase which:
   1. Parses the reply body with Claude 3.5 Haiku (cheapest model)
@@ -10,26 +14,26 @@ On receipt, delegates to ProcessInboundEmailUseCase which:
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import FastAPI, Request
-import uvicorn
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from ..use_cases.process_inbound_email import (
-    ProcessInboundEmailUseCase,
-    ContactUpdateResult,
-)
+if TYPE_CHECKING:
+    from ..use_cases.process_inbound_email import (
+        ProcessInboundEmailUseCase,
+        ContactUpdateResult,
+    )
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+router = APIRouter()
 
 # Holds the use-case instance; set by `configure()` before server starts
-_inbound_email_use_case: Optional[ProcessInboundEmailUseCase] = None
+_inbound_email_use_case: Optional["ProcessInboundEmailUseCase"] = None
 
 
-def configure(use_case: ProcessInboundEmailUseCase) -> None:
+def configure(use_case: "ProcessInboundEmailUseCase") -> None:
     """Inject the fully-wired use case into the webhook module."""
     global _inbound_email_use_case
     _inbound_email_use_case = use_case
@@ -41,8 +45,6 @@ def _auto_configure() -> None:
     if _inbound_email_use_case is not None:
         return
     try:
-        from dotenv import load_dotenv
-        load_dotenv()
         from ..infrastructure.config import Config
         from ..infrastructure.container import Container
 
@@ -54,20 +56,7 @@ def _auto_configure() -> None:
         logger.error(f"[Webhook] Auto-configure failed: {e}")
 
 
-@app.on_event("startup")
-async def on_startup():
-    _auto_configure()
-
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-@app.post("/webhooks/inbound-email")
+@router.post("/webhooks/inbound-email")
 async def handle_inbound_email(request: Request):
     data = await request.json()
 
@@ -91,7 +80,7 @@ async def handle_inbound_email(request: Request):
             "from": sender,
         }
 
-    result: ContactUpdateResult = await _inbound_email_use_case.execute(
+    result: "ContactUpdateResult" = await _inbound_email_use_case.execute(
         sender_email=sender,
         email_body=body,
         subject=subject,
@@ -120,13 +109,33 @@ async def handle_inbound_email(request: Request):
     }
 
 
+# ── Standalone app ────────────────────────────────────────────────────────────
+
+app = FastAPI()
+app.include_router(router)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+@app.on_event("startup")
+async def on_startup():
+    _auto_configure()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "parser": "claude-3.5-haiku"}
 
 
 def start():
-    uvicorn.run(app, host="0.0.0.0", port=8502)
+    import uvicorn
+
+    uvicorn.run(app, host="0.0.0.0", port=8502, loop="uvloop", http="httptools")
 
 
 if __name__ == "__main__":
@@ -25,6 +25,9 @@ class AIResearchResult:
     tokens_input: int = 0
     tokens_output: int = 0
     cost_usd: float = 0.0
+    # Prompt-cache breakdown of tokens_input (read from / written to the cache)
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     evidence_urls: List[str] = field(default_factory=list)
     error: Optional[str] = None
 
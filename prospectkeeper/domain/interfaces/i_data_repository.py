@@ -4,7 +4,7 @@ The domain doesn't know about Supabase, PostgreSQL, or any ORM.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from ..entities.contact import Contact
 from ..entities.verification_result import VerificationResult
@@ -19,6 +19,26 @@ class IDataRepository(ABC):
         """Retrieve all contacts from the data store."""
         pass
 
+    @abstractmethod
+    async def get_contacts(
+        self, status: Optional[str] = None, limit: int = 50, with_email: bool = False
+    ) -> List[Contact]:
+        """Retrieve up to `limit` non-opted-out contacts, optionally with the given status
+        and (when `with_email`) only those that have an email address."""
+        pass
+
+    @abstractmethod
+    def iter_contacts(
+        self,
+        status: Optional[str] = None,
+        with_email: bool = False,
+        needs_review: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Contact]:
+        """Yield non-opted-out contacts matching the filters, fetched a page at a
+        time so callers never hold the whole table; stops after `limit` if given."""
+        pass
+
     @abstractmethod
     async def get_contacts_for_verification(self, limit: int = 50) -> List[Contact]:
         """Retrieve contacts that need verification (not opted-out)."""
@@ -53,6 +73,11 @@ class IDataRepository(ABC):
         """Insert a brand new replacement contact."""
         pass
 
+    @abstractmethod
+    async def bulk_insert_contacts(self, contacts: List[Contact]) -> None:
+        """Insert many new contacts in a single round-trip."""
+        pass
+
     @abstractmethod
     async def get_contact_by_email(self, email: str) -> Optional[Contact]:
         """Look up a contact by their email address."""
@@ -36,9 +36,14 @@ class ILinkedInGateway(ABC):
         contact_name: str,
         organization: str,
         linkedin_url: Optional[str] = None,
+        full_profile: bool = True,
     ) -> LinkedInResult:
         """
         Attempts to verify current employment via LinkedIn profile scraping.
         Uses CamoUFox to avoid bot detection.
+
+        With full_profile=False, implementations may stop as soon as the main
+        profile confirms employment at `organization`, leaving `education` and
+        `skills` as None instead of fetching the complete lists.
         """
         pass
@@ -1,6 +1,6 @@
 """
 IScraperGateway - Port: Tier 1 web scraping interface.
-Implementations use BeautifulSoup / HTTPX against public district websites.
+Implementations use HTTPX + an HTML parser against public district websites.
 Cost: $0.00
 """
 
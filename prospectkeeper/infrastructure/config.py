@@ -3,6 +3,7 @@ Configuration — reads all settings from environment variables.
 Never hardcodes credentials. Uses python-dotenv for local dev.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 
@@ -29,7 +30,15 @@ class Config:
     batch_concurrency: int = 5
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "Config":
+        """
+        Build the config from the environment, once per process.
+
+        The frozen result is memoised, so every entry point shares one parse;
+        call `Config.from_env.cache_clear()` after changing the environment.
+        Failures are not cached.
+        """
         missing = []
         required = [
             "SUPABASE_URL",
@@ -5,6 +5,8 @@ This is the ONLY place that knows about concrete implementations.
 The domain and use case layers remain framework-agnostic.
 """
 
+import httpx
+
 from .config import Config
 from ..adapters.supabase_adapter import SupabaseAdapter
 from ..adapters.bs4_scraper_adapter import BS4ScraperAdapter
@@ -26,6 +28,18 @@ class Container:
     def __init__(self, config: Config):
         self.config = config
 
+        # One pooled HTTP/2 client shared by the HTTP-API adapters, so sends
+        # reuse TLS sessions and keep-alive connections instead of reconnecting.
+        # Transport retries cover connect failures; close it with aclose().
+        self.http = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            timeout=30.0,
+        )
+
         # ── Adapters (Ports & Adapters layer) ─────────────────────────────
         self.repository = SupabaseAdapter(
             url=config.supabase_url,
@@ -33,7 +47,7 @@ class Container:
         )
         self.scraper = BS4ScraperAdapter()
         self.linkedin = NoDriverAdapter()
-        self.email_sender = EmailSenderAdapter()
+        self.email_sender = EmailSenderAdapter(http=self.http)
         self.ai = ClaudeAdapter(
             anthropic_api_key=config.anthropic_api_key,
         )
@@ -54,3 +68,10 @@ class Container:
             repository=self.repository,
             anthropic_api_key=config.anthropic_api_key,
         )
+
+    async def aclose(self) -> None:
+        """Release pooled connections. Call once on shutdown."""
+        await self.http.aclose()
+        await self.scraper.aclose()
+        await self.ai.aclose()
+        self.repository.close()
@@ -108,7 +108,11 @@ class ProcessBatchUseCase:
             })
 
         # ── Bounded concurrent verification ────────────────────────────────
-        semaphore = asyncio.Semaphore(request.concurrency)
+        # `concurrency` workers drain a queue of contacts, so only that many
+        # verification coroutines exist at once rather than one per contact.
+        todo: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(contacts):
+            todo.put_nowait(item)
         results: List[VerificationResult] = []
         errors: List[str] = []
         completed_count = 0
@@ -116,91 +120,95 @@ class ProcessBatchUseCase:
 
         async def verify_one(contact: Contact, idx: int) -> None:
             nonlocal completed_count
-            async with semaphore:
-                agent_wall = time.time()
+            agent_wall = time.time()
+            logger.info(
+                f"[Batch:{batch_id[:8]}] [{idx + 1}/{total}] "
+                f"AGENT STARTING → {contact.name!r} | "
+                f"{contact.title!r} @ {contact.organization!r} | "
+                f"id={contact.id}"
+            )
+
+            await emit({
+                "type": "contact_start",
+                "index": idx + 1,
+                "total": total,
+                "name": contact.name,
+                "org": contact.organization,
+                "title": contact.title or "",
+            })
+
+            try:
+                result = await self.verify.execute(
+                    VerifyContactRequest(contact=contact, tier=request.tier)
+                )
+                results.append(result)
+                await self._apply_result(contact, result)
+
+                elapsed = time.time() - agent_wall
+                async with count_lock:
+                    completed_count += 1
+                    done = completed_count
+
+                replacement_tag = (
+                    f"replacement={result.replacement_name!r}"
+                    if result.has_replacement
+                    else "no-replacement"
+                )
                 logger.info(
-                    f"[Batch:{batch_id[:8]}] [{idx + 1}/{total}] "
-                    f"AGENT STARTING → {contact.name!r} | "
-                    f"{contact.title!r} @ {contact.organization!r} | "
-                    f"id={contact.id}"
+                    f"[Batch:{batch_id[:8]}] [{done}/{total}] "
+                    f"AGENT DONE ✓ → {contact.name!r} | "
+                    f"status={result.status.value} | "
+                    f"{replacement_tag} | "
+                    f"flagged={result.needs_human_review} | "
+                    f"cost=${result.economics.total_api_cost_usd:.5f} | "
+                    f"tokens={result.economics.tokens_used} | "
+                    f"elapsed={elapsed:.2f}s"
                 )
 
                 await emit({
-                    "type": "contact_start",
-                    "index": idx + 1,
+                    "type": "contact_done",
+                    "index": done,
                     "total": total,
                     "name": contact.name,
                     "org": contact.organization,
-                    "title": contact.title or "",
+                    "status": result.status.value,
+                    "cost_usd": result.economics.total_api_cost_usd,
+                    "elapsed": round(elapsed, 2),
+                    "has_replacement": result.has_replacement,
+                    "replacement_name": result.replacement_name,
+                    "flagged": result.needs_human_review,
                 })
 
-                try:
-                    result = await self.verify.execute(
-                        VerifyContactRequest(contact=contact, tier=request.tier)
-                    )
-                    results.append(result)
-                    await self._apply_result(contact, result)
-
-                    elapsed = time.time() - agent_wall
-                    async with count_lock:
-                        completed_count += 1
-                        done = completed_count
-
-                    replacement_tag = (
-                        f"replacement={result.replacement_name!r}"
-                        if result.has_replacement
-                        else "no-replacement"
-                    )
-                    logger.info(
-                        f"[Batch:{batch_id[:8]}] [{done}/{total}] "
-                        f"AGENT DONE ✓ → {contact.name!r} | "
-                        f"status={result.status.value} | "
-                        f"{replacement_tag} | "
-                        f"flagged={result.needs_human_review} | "
-                        f"cost=${result.economics.total_api_cost_usd:.5f} | "
-                        f"tokens={result.economics.tokens_used} | "
-                        f"elapsed={elapsed:.2f}s"
-                    )
-
-                    await emit({
-                        "type": "contact_done",
-                        "index": done,
-                        "total": total,
-                        "name": contact.name,
-                        "org": contact.organization,
-                        "status": result.status.value,
-                        "cost_usd": result.economics.total_api_cost_usd,
-                        "elapsed": round(elapsed, 2),
-                        "has_replacement": result.has_replacement,
-                        "replacement_name": result.replacement_name,
-                        "flagged": result.needs_human_review,
-                    })
-
-                except Exception as exc:
-                    elapsed = time.time() - agent_wall
-                    async with count_lock:
-                        completed_count += 1
-                        done = completed_count
-
-                    logger.error(
-                        f"[Batch:{batch_id[:8]}] [{done}/{total}] "
-                        f"AGENT ERROR ✗ → {contact.name!r} @ {contact.organization!r} | "
-                        f"error={exc!r} | elapsed={elapsed:.2f}s",
-                        exc_info=True,
-                    )
-                    errors.append(f"{contact.id} ({contact.name}): {exc}")
-
-                    await emit({
-                        "type": "contact_error",
-                        "index": done,
-                        "total": total,
-                        "name": contact.name,
-                        "org": contact.organization,
-                        "error": str(exc),
-                        "elapsed": round(elapsed, 2),
-                    })
-
-        await asyncio.gather(*[verify_one(c, i) for i, c in enumerate(contacts)])
+            except Exception as exc:
+                elapsed = time.time() - agent_wall
+                async with count_lock:
+                    completed_count += 1
+                    done = completed_count
+
+                logger.error(
+                    f"[Batch:{batch_id[:8]}] [{done}/{total}] "
+                    f"AGENT ERROR ✗ → {contact.name!r} @ {contact.organization!r} | "
+                    f"error={exc!r} | elapsed={elapsed:.2f}s",
+                    exc_info=True,
+                )
+                errors.append(f"{contact.id} ({contact.name}): {exc}")
+
+                await emit({
+                    "type": "contact_error",
+                    "index": done,
+                    "total": total,
+                    "name": contact.name,
+                    "org": contact.organization,
+                    "error": str(exc),
+                    "elapsed": round(elapsed, 2),
+                })
+
+        async def worker() -> None:
+            while not todo.empty():
+                idx, contact = todo.get_nowait()
+                await verify_one(contact, idx)
+
+        await asyncio.gather(*[worker() for _ in range(min(request.concurrency, total))])
 
         # ── Generate Value-Proof Receipt ───────────────────────────────────
         economics_list = [r.economics for r in results]
@@ -80,7 +80,9 @@ class ProcessInboundEmailUseCase:
         anthropic_api_key: str,
     ):
         self.repository = repository
-        self.client = anthropic.Anthropic(api_key=anthropic_api_key)
+        # Async client — /inbound-email runs on the API's event loop, which a
+        # sync Claude round-trip would stall for every other request
+        self.client = anthropic.AsyncAnthropic(api_key=anthropic_api_key)
 
     async def execute(
         self,
@@ -172,7 +174,7 @@ class ProcessInboundEmailUseCase:
         )
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=HAIKU_MODEL,
                 max_tokens=512,
                 system=EMAIL_PARSE_SYSTEM_PROMPT,
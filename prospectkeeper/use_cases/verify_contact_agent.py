@@ -7,9 +7,11 @@ yielding real-time SSE event dicts for streaming to the frontend.
 
 import json
 import logging
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 import anthropic
+from anthropic.types import ContentBlock
+from pydantic import TypeAdapter
 
 from ..domain.entities.contact import ContactStatus
 from ..domain.interfaces.i_data_repository import IDataRepository
@@ -22,6 +24,9 @@ logger = logging.getLogger(__name__)
 MODEL = "claude-sonnet-4-6"
 MAX_ITERATIONS = 10
 
+# Dumps a whole response.content list in one pydantic-core pass.
+_CONTENT_BLOCKS = TypeAdapter(list[ContentBlock])
+
 SYSTEM_PROMPT = """You are an autonomous B2B contact verification agent for ProspectKeeper CRM.
 Your job: determine if a contact is still in their current role at their organization, then update the record.
 
@@ -186,12 +191,14 @@ class VerifyContactAgentUseCase:
         scraper: IScraperGateway,
         linkedin: ILinkedInGateway,
         email_sender: IEmailSenderGateway,
+        client: Optional[anthropic.AsyncAnthropic] = None,
     ):
         self.repository = repository
         self.scraper = scraper
         self.linkedin = linkedin
         self.email_sender = email_sender
-        self.client = anthropic.AsyncAnthropic()
+        # Callers serving many requests pass a shared client to reuse its connection pool
+        self.client = client or anthropic.AsyncAnthropic()
 
     async def execute(self, contact_id: str) -> AsyncGenerator[dict, None]:
         """Run agentic tool_use loop, yielding SSE event dicts."""
@@ -255,7 +262,7 @@ class VerifyContactAgentUseCase:
                     messages.append(
                         {
                             "role": "assistant",
-                            "content": [b.model_dump() for b in response.content],
+                            "content": _CONTENT_BLOCKS.dump_python(response.content),
                         }
                     )
 
@@ -344,6 +351,7 @@ class VerifyContactAgentUseCase:
                 contact_name=inputs["contact_name"],
                 organization=inputs["organization"],
                 linkedin_url=inputs.get("linkedin_url"),
+                full_profile=False,  # only the employment fields are returned below
             )
             # Compute a confidence score from the result fields
             if not result.success or result.blocked:
@@ -54,9 +54,8 @@ async def seed_data():
         ),
     ]
 
-    for contact in contacts:
-        await container.repository.insert_contact(contact)
-        logger.info(f"Inserted: {contact.name}")
+    await container.repository.bulk_insert_contacts(contacts)
+    logger.info(f"Inserted {len(contacts)} contacts.")
 
     logger.info("Done seeding data.")
 
@@ -0,0 +1,14 @@
+-- ProspectKeeper: Contacts with LinkedIn freshness
+-- Serves the contact list and its freshness timestamps in one query, instead of
+-- reading contacts and contact_linkedin_freshness separately and merging them
+-- in the API layer.
+
+-- ── contacts_with_freshness (view) ─────────────────────────────────────────
+-- One row per contact; the freshness columns are NULL when never scraped.
+CREATE OR REPLACE VIEW contacts_with_freshness AS
+SELECT
+    c.*,
+    f.last_scraped_at,
+    f.last_changed_at
+FROM contacts c
+LEFT JOIN contact_linkedin_freshness f ON f.contact_id = c.id;
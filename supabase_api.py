@@ -5,7 +5,8 @@ Wraps SupabaseAdapter as an HTTP API so any service can interact with the
 database without importing the adapter directly or using supabase-py.
 
 Start:
-    uvicorn supabase_api:app --reload --port 8002
+    uvicorn supabase_api:app --reload --port 8002     # development
+    python supabase_api.py                            # production (uvloop + httptools)
 
 Authentication:
     Pass the API key in the X-API-Key header.
@@ -13,6 +14,7 @@ Authentication:
     "dev-key" when unset).
 """
 
+import hmac
 import logging
 import os
 import sys
@@ -21,7 +23,7 @@ from datetime import datetime
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Header, HTTPException, status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ── Bootstrap ──────────────────────────────────────────────────────────────
 load_dotenv()
@@ -43,9 +45,11 @@ logger = logging.getLogger(__name__)
 
 # ── API key guard ──────────────────────────────────────────────────────────
 _API_KEY = os.environ.get("SUPABASE_API_KEY", "dev-key")
+_API_KEY_BYTES = _API_KEY.encode()
 
 def _require_api_key(x_api_key: str = Header(..., description="Service API key")) -> None:
-    if x_api_key != _API_KEY:
+    # Constant-time compare so response timing doesn't leak the key prefix
+    if not hmac.compare_digest(x_api_key.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing API key.",
@@ -72,6 +76,8 @@ else:
 # ── Pydantic Schemas ───────────────────────────────────────────────────────
 
 class ContactSchema(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: str
     name: str
     email: str = ""
@@ -108,8 +114,10 @@ class ContactSchema(BaseModel):
         )
 
     @classmethod
-    def from_domain(cls, contact: Contact) -> "ContactSchema":
-        return cls(
+    def from_domain(cls, contact: Contact, freshness: Optional[dict] = None) -> "ContactSchema":
+        # Built from our own entity, so skip validation with model_construct
+        freshness = freshness or {}
+        return cls.model_construct(
             id=contact.id,
             name=contact.name,
             email=contact.email,
@@ -123,9 +131,13 @@ class ContactSchema(BaseModel):
             email_hash=contact.email_hash,
             created_at=contact.created_at,
             updated_at=contact.updated_at,
+            last_scraped_at=freshness.get("last_scraped_at"),
+            last_changed_at=freshness.get("last_changed_at"),
         )
 
 class AgentEconomicsSchema(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     contact_id: str
     zerobounce_cost_usd: float = 0.0
     claude_cost_usd: float = 0.0
@@ -148,6 +160,8 @@ class AgentEconomicsSchema(BaseModel):
         )
 
 class VerificationResultSchema(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     contact_id: str
     status: str
     economics: AgentEconomicsSchema
@@ -185,15 +199,7 @@ async def get_all_contacts(x_api_key: str = Header(...)):
     _require_api_key(x_api_key)
     contacts = await _adapter.get_all_contacts()
     freshness = await _adapter.get_all_linkedin_freshness()
-    result = []
-    for c in contacts:
-        schema = ContactSchema.from_domain(c)
-        f = freshness.get(c.id)
-        if f:
-            schema.last_scraped_at = f.get("last_scraped_at")
-            schema.last_changed_at = f.get("last_changed_at")
-        result.append(schema)
-    return result
+    return [ContactSchema.from_domain(c, freshness.get(c.id)) for c in contacts]
 
 @app.get("/contacts/verify", response_model=List[ContactSchema], tags=["Contacts"])
 async def get_contacts_for_verification(limit: int = 50, x_api_key: str = Header(...)):
@@ -260,11 +266,10 @@ async def save_verification_result(result: VerificationResultSchema, x_api_key:
 @app.get("/batch-receipts", tags=["Receipts"])
 async def get_batch_receipts(limit: int = 10, x_api_key: str = Header(...)):
     _require_api_key(x_api_key)
-    response = (
-        _adapter.client.table("batch_receipts")
-        .select("*")
-        .order("run_at", desc=True)
-        .limit(limit)
-        .execute()
-    )
-    return response.data
+    return await _adapter.get_batch_receipts(limit)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("supabase_api:app", host="0.0.0.0", port=8002, loop="uvloop", http="httptools")
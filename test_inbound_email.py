@@ -59,6 +59,25 @@ class FakeRepository(IDataRepository):
     async def get_all_contacts(self) -> List[Contact]:
         return list(self.contacts.values())
 
+    async def get_contacts(
+        self, status: Optional[str] = None, limit: int = 50, with_email: bool = False
+    ) -> List[Contact]:
+        return [
+            c for c in self.contacts.values()
+            if (not status or c.status.value == status) and (not with_email or c.email)
+        ][:limit]
+
+    async def iter_contacts(
+        self,
+        status: Optional[str] = None,
+        with_email: bool = False,
+        needs_review: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ):
+        for c in (await self.get_contacts(status, limit or len(self.contacts), with_email)):
+            if needs_review is None or c.needs_human_review == needs_review:
+                yield c
+
     async def get_contacts_for_verification(self, limit: int = 50) -> List[Contact]:
         return []
 
@@ -79,6 +98,10 @@ class FakeRepository(IDataRepository):
         self.contacts[contact.id] = contact
         return contact
 
+    async def bulk_insert_contacts(self, contacts: List[Contact]) -> None:
+        for c in contacts:
+            self.contacts[c.id] = c
+
 
 # ── Test scenarios ────────────────────────────────────────────────────────────
 
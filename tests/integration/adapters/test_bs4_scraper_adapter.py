@@ -1,14 +1,16 @@
 """
 Tests for BS4ScraperAdapter.
 
-External HTTP calls are mocked at the httpx.AsyncClient level.
+External HTTP calls are mocked by injecting a fake httpx.AsyncClient.
 _parse_staff_page is tested directly as a pure unit since it has no I/O.
 """
 
+import asyncio
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
-from prospectkeeper.adapters.bs4_scraper_adapter import BS4ScraperAdapter
+from prospectkeeper.adapters.bs4_scraper_adapter import STAFF_PATHS, BS4ScraperAdapter
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -24,18 +26,39 @@ def make_http_response(status_code: int = 200, text: str = "") -> MagicMock:
     return resp
 
 
+def probe_then_fetch(probe_result, page_result):
+    """
+    client.get side effect for "candidate probes, then the staff page GET".
+
+    _guess_staff_url probes every candidate concurrently, so calls can't be
+    matched by order: the first GET of a URL is its probe (probe_result), a
+    second GET of the same URL is the page fetch (page_result). Exceptions
+    are raised instead of returned.
+    """
+    probed = set()
+
+    async def get(url, **kwargs):
+        result = page_result if url in probed else probe_result
+        probed.add(url)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return get
+
+
 def make_async_client_mock(staff_url_response=None, page_response=None):
     """
-    Builds a mock httpx.AsyncClient context manager.
+    Builds a mock httpx.AsyncClient to inject into the adapter.
     staff_url_response: response returned by _guess_staff_url candidate GETs
     page_response: response returned by the staff page GET
     """
     client_mock = AsyncMock()
 
     if staff_url_response is not None and page_response is not None:
-        # _guess_staff_url tries candidates; first 200 returns staff URL
+        # _guess_staff_url probes candidates; first 200 (in order) is the staff URL
         # page GET returns page_response
-        client_mock.get.side_effect = [staff_url_response, page_response]
+        client_mock.get.side_effect = probe_then_fetch(staff_url_response, page_response)
     elif staff_url_response is not None:
         client_mock.get.return_value = staff_url_response
     else:
@@ -46,14 +69,6 @@ def make_async_client_mock(staff_url_response=None, page_response=None):
     return client_mock
 
 
-def patch_async_client(client_mock):
-    """Context manager that patches httpx.AsyncClient to return client_mock."""
-    cm = MagicMock()
-    cm.__aenter__ = AsyncMock(return_value=client_mock)
-    cm.__aexit__ = AsyncMock(return_value=False)
-    return cm
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # find_contact_on_district_site
 # ─────────────────────────────────────────────────────────────────────────────
@@ -71,19 +86,14 @@ class TestFindContactOnDistrictSite:
 
     async def test_returns_failure_when_staff_url_not_found(self):
         """All URL candidates return 404 → no staff URL found."""
-        adapter = BS4ScraperAdapter()
         client_mock = make_async_client_mock()  # all 404s
-        async_client_cm = patch_async_client(client_mock)
-
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        adapter = BS4ScraperAdapter(http=client_mock)
+
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.success is False
         assert "Could not locate" in result.error
@@ -98,23 +108,18 @@ class TestFindContactOnDistrictSite:
         """
         import httpx
 
-        adapter = BS4ScraperAdapter()
         client_mock = AsyncMock()
-        client_mock.get.side_effect = [
+        client_mock.get.side_effect = probe_then_fetch(
             make_http_response(200),              # candidate probe → staff URL found
             httpx.TimeoutException("timed out"),  # page fetch → timeout
-        ]
-        async_client_cm = patch_async_client(client_mock)
-
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        )
+        adapter = BS4ScraperAdapter(http=client_mock)
+
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.success is False
         assert result.error == "Timeout"
@@ -127,23 +132,18 @@ class TestFindContactOnDistrictSite:
         succeeds.  The second client.get() (page fetch) raises ConnectionError, which
         reaches the outer except Exception handler.
         """
-        adapter = BS4ScraperAdapter()
         client_mock = AsyncMock()
-        client_mock.get.side_effect = [
+        client_mock.get.side_effect = probe_then_fetch(
             make_http_response(200),    # candidate probe → staff URL found
             ConnectionError("refused"), # page fetch → generic error
-        ]
-        async_client_cm = patch_async_client(client_mock)
-
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        )
+        adapter = BS4ScraperAdapter(http=client_mock)
+
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.success is False
         assert "refused" in result.error
@@ -154,18 +154,13 @@ class TestFindContactOnDistrictSite:
         staff_resp = make_http_response(200)
         page_resp = make_http_response(200, text=html)
         client_mock = make_async_client_mock(staff_resp, page_resp)
-        async_client_cm = patch_async_client(client_mock)
+        adapter = BS4ScraperAdapter(http=client_mock)
 
-        adapter = BS4ScraperAdapter()
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice Johnson",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice Johnson",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.success is True
         assert result.person_found is True
@@ -176,18 +171,13 @@ class TestFindContactOnDistrictSite:
         staff_resp = make_http_response(200)
         page_resp = make_http_response(200, text=html)
         client_mock = make_async_client_mock(staff_resp, page_resp)
-        async_client_cm = patch_async_client(client_mock)
+        adapter = BS4ScraperAdapter(http=client_mock)
 
-        adapter = BS4ScraperAdapter()
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice Johnson",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice Johnson",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.success is True
         assert result.person_found is False
@@ -197,24 +187,75 @@ class TestFindContactOnDistrictSite:
         staff_resp = make_http_response(200)
         page_resp = make_http_response(200, text=html)
         client_mock = AsyncMock()
-        # First candidate GET returns 200 (first candidate = /team)
-        client_mock.get.side_effect = [staff_resp, page_resp]
-        async_client_cm = patch_async_client(client_mock)
+        # Every candidate returns 200; the first (/team) is picked
+        client_mock.get.side_effect = probe_then_fetch(staff_resp, page_resp)
+        adapter = BS4ScraperAdapter(http=client_mock)
 
-        adapter = BS4ScraperAdapter()
-        with patch(
-            "prospectkeeper.adapters.bs4_scraper_adapter.httpx.AsyncClient",
-            return_value=async_client_cm,
-        ):
-            result = await adapter.find_contact_on_district_site(
-                contact_name="Alice Johnson",
-                organization="Org A",
-                district_website="https://org-a.com",
-            )
+        result = await adapter.find_contact_on_district_site(
+            contact_name="Alice Johnson",
+            organization="Org A",
+            district_website="https://org-a.com",
+        )
 
         assert result.evidence_url is not None
         assert "org-a.com" in result.evidence_url
 
+    async def test_one_client_serves_every_lookup_until_aclose(self):
+        client_mock = make_async_client_mock()  # all 404s
+        adapter = BS4ScraperAdapter(http=client_mock)
+
+        for site in ("https://org-a.com", "https://org-b.com"):
+            await adapter.find_contact_on_district_site(
+                contact_name="Alice", organization="Org", district_website=site
+            )
+        assert client_mock.get.await_count == 2 * len(STAFF_PATHS)
+        client_mock.aclose.assert_not_awaited()
+
+        await adapter.aclose()
+        client_mock.aclose.assert_awaited_once()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _guess_staff_url
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestGuessStaffUrl:
+    async def test_probes_all_candidates_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_http_response(404)
+
+        client_mock = AsyncMock()
+        client_mock.get.side_effect = get
+
+        assert await BS4ScraperAdapter(http=client_mock)._guess_staff_url("https://org-a.com/") is None
+        assert peak == len(STAFF_PATHS)
+
+    async def test_earliest_candidate_wins_over_faster_later_one(self):
+        """/staff answers first, but /team comes earlier in STAFF_PATHS."""
+        async def get(url, **kwargs):
+            if url.endswith("/team"):
+                await asyncio.sleep(0.01)
+                return make_http_response(200)
+            if url.endswith("/staff"):
+                return make_http_response(200)
+            return make_http_response(404)
+
+        client_mock = AsyncMock()
+        client_mock.get.side_effect = get
+
+        url = await BS4ScraperAdapter(http=client_mock)._guess_staff_url("https://org-a.com")
+        assert url == "https://org-a.com/team"
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # _parse_staff_page — pure unit tests (no HTTP)
@@ -277,6 +318,11 @@ class TestParseStaffPage:
         assert result.person_found is True
         assert result.current_title is None
 
+    def test_title_is_keyword_nearest_the_name(self):
+        html = "<p>Bob Jones Director. Jane Smith Lead Engineer</p>"
+        result = self.adapter._parse_staff_page(html, "Jane Smith", "https://org.com")
+        assert result.current_title == "Lead"
+
     def test_person_not_found_raw_text_is_truncated_snippet(self):
         long_text = "x " * 300
         html = f"<p>Bob Jones{long_text}</p>"
@@ -285,6 +331,13 @@ class TestParseStaffPage:
         # raw_text[:500] slice applied
         assert len(result.raw_text) <= 500
 
+    def test_name_with_regex_metacharacters_matched_literally(self):
+        html = "<p>J. Smith (Jr.) Director</p>"
+        result = self.adapter._parse_staff_page(html, "J. Smith (Jr.)", "https://org.com")
+        assert result.person_found is True
+        result = self.adapter._parse_staff_page(html, "J? Smith", "https://org.com")
+        assert result.person_found is False
+
     def test_strips_html_tags_before_search(self):
         html = "<h2>Jane <em>Smith</em></h2><p>Director</p>"
         result = self.adapter._parse_staff_page(html, "Jane Smith", "https://org.com")
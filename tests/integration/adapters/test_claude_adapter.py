@@ -1,16 +1,25 @@
 """
 Tests for ClaudeAdapter.
 
-The Anthropic client is a synchronous SDK client stored on self.client.
-We mock self.client.messages.create directly.
+The Anthropic client is an AsyncAnthropic SDK client stored on self.client.
+We mock self.client.messages.create directly with an AsyncMock.
 All JSON parsing and cost/token tracking is tested without real API calls.
 """
 
+import asyncio
 import json
+
+import anthropic
+import httpx
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from prospectkeeper.adapters.claude_adapter import ClaudeAdapter
+from prospectkeeper.adapters.claude_adapter import (
+    CLAUDE_MAX_ATTEMPTS,
+    RESEARCH_BATCH_SIZE,
+    ClaudeAdapter,
+)
+from tests.conftest import make_contact
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -20,13 +29,20 @@ from prospectkeeper.adapters.claude_adapter import ClaudeAdapter
 
 def make_adapter() -> ClaudeAdapter:
     """Create a ClaudeAdapter with a fully mocked Anthropic client."""
-    with patch("prospectkeeper.adapters.claude_adapter.anthropic.Anthropic"):
+    with patch("prospectkeeper.adapters.claude_adapter.anthropic.AsyncAnthropic"):
         adapter = ClaudeAdapter(
             anthropic_api_key="sk-ant-test",
         )
+    adapter.client.messages.create = AsyncMock()
     return adapter
 
 
+def make_status_error(cls, status_code: int, headers=None):
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return cls("throttled", response=response, body=None)
+
+
 def make_api_response(content_text: str, input_tokens: int = 200, output_tokens: int = 100):
     """Build a mock Anthropic API response object."""
     response = MagicMock()
@@ -35,6 +51,8 @@ def make_api_response(content_text: str, input_tokens: int = 200, output_tokens:
     response.usage = MagicMock()
     response.usage.input_tokens = input_tokens
     response.usage.output_tokens = output_tokens
+    response.usage.cache_read_input_tokens = 0
+    response.usage.cache_creation_input_tokens = 0
     return response
 
 
@@ -246,6 +264,29 @@ class TestResearchContact:
         expected_cost = (1000 * 3.0 + 500 * 15.0) / 1_000_000
         assert result.cost_usd == pytest.approx(expected_cost)
 
+    async def test_system_prompt_carries_cache_breakpoint(self):
+        adapter = make_adapter()
+        adapter.client.messages.create.return_value = make_api_response(active_json())
+
+        await adapter.research_contact("Alice", "Acme", "Director")
+        system = adapter.client.messages.create.call_args.kwargs["system"]
+        assert system[-1]["cache_control"] == {"type": "ephemeral"}
+
+    async def test_cache_tokens_priced_at_cache_rates(self):
+        adapter = make_adapter()
+        api_resp = make_api_response(active_json(), input_tokens=100, output_tokens=50)
+        api_resp.usage.cache_read_input_tokens = 1000
+        api_resp.usage.cache_creation_input_tokens = 200
+        adapter.client.messages.create.return_value = api_resp
+
+        result = await adapter.research_contact("Alice", "Acme", "Director")
+        assert result.tokens_input == 1300
+        assert result.cache_read_tokens == 1000
+        assert result.cache_write_tokens == 200
+        assert result.cost_usd == pytest.approx(
+            (100 * 3.0 + 200 * 3.75 + 1000 * 0.30 + 50 * 15.0) / 1_000_000
+        )
+
     async def test_api_exception_returns_failure(self):
         adapter = make_adapter()
         adapter.client.messages.create.side_effect = Exception("API unreachable")
@@ -263,6 +304,13 @@ class TestResearchContact:
         assert result.tokens_output == 0
         assert result.cost_usd == 0.0
 
+    async def test_api_call_is_awaited(self):
+        adapter = make_adapter()
+        adapter.client.messages.create.return_value = make_api_response(active_json())
+
+        await adapter.research_contact("Alice", "Acme", "Director")
+        adapter.client.messages.create.assert_awaited_once()
+
     async def test_langfuse_headers_present_in_api_call(self):
         adapter = make_adapter()
         # Verify the custom init headers are passed to the client inside the adapter.
@@ -291,3 +339,195 @@ class TestResearchContact:
         assert result.contact_still_active is False
         assert result.replacement_name == "Bob New"
         assert result.replacement_email == "bob.new@acme.com"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# research_contacts_batch — many contacts per Claude message
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestResearchContactsBatch:
+    async def test_one_call_returns_results_in_order(self):
+        adapter = make_adapter()
+        contacts = [make_contact(name="Alice"), make_contact(name="Bob")]
+        content = "[" + active_json() + "," + inactive_with_replacement_json() + "]"
+        adapter.client.messages.create.return_value = make_api_response(content, 301, 100)
+
+        results = await adapter.research_contacts_batch(contacts)
+
+        adapter.client.messages.create.assert_awaited_once()
+        assert [r.contact_still_active for r in results] == [True, False]
+        assert [r.tokens_input for r in results] == [151, 150]
+        assert sum(r.cost_usd for r in results) == pytest.approx(
+            (301 * 3.0 + 100 * 15.0) / 1_000_000
+        )
+
+    async def test_contacts_missing_from_response_fail(self):
+        adapter = make_adapter()
+        contacts = [make_contact(name="Alice"), make_contact(name="Bob")]
+        adapter.client.messages.create.return_value = make_api_response("[" + active_json() + "]")
+
+        results = await adapter.research_contacts_batch(contacts)
+
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "Missing" in results[1].error
+
+    async def test_large_batches_split_into_groups(self):
+        adapter = make_adapter()
+        contacts = [make_contact(name=f"C{i}") for i in range(RESEARCH_BATCH_SIZE + 1)]
+
+        async def create(**kwargs):
+            n = kwargs["messages"][0]["content"].count("| Organization:")
+            return make_api_response("[" + ",".join([active_json()] * n) + "]")
+
+        adapter.client.messages.create.side_effect = create
+        results = await adapter.research_contacts_batch(contacts)
+
+        assert adapter.client.messages.create.await_count == 2
+        assert len(results) == RESEARCH_BATCH_SIZE + 1
+        assert all(r.success for r in results)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Message Batches API — offline research
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def make_batch_entry(custom_id: str, message=None, result_type: str = "succeeded"):
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    entry.result.type = result_type
+    entry.result.message = message
+    return entry
+
+
+async def aiter_of(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+class TestResearchBatchApi:
+    async def test_submit_sends_one_request_per_contact_keyed_by_id(self):
+        adapter = make_adapter()
+        adapter.client.messages.batches.create = AsyncMock(return_value=MagicMock(id="batch-1"))
+        contacts = [make_contact(contact_id="c-1"), make_contact(contact_id="c-2")]
+
+        batch_id = await adapter.submit_research_batch(contacts)
+
+        assert batch_id == "batch-1"
+        requests = adapter.client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["c-1", "c-2"]
+
+    async def test_poll_waits_for_end_and_maps_results_by_contact_id(self):
+        adapter = make_adapter()
+        adapter.client.messages.batches.retrieve = AsyncMock(side_effect=[
+            MagicMock(processing_status="in_progress"),
+            MagicMock(processing_status="ended"),
+        ])
+        message = make_api_response(active_json(), input_tokens=1000, output_tokens=100)
+        adapter.client.messages.batches.results = AsyncMock(return_value=aiter_of([
+            make_batch_entry("c-1", message),
+            make_batch_entry("c-2", result_type="expired"),
+        ]))
+
+        with patch("prospectkeeper.adapters.claude_adapter.asyncio.sleep", new=AsyncMock()):
+            results = await adapter.poll_research_batch("batch-1")
+
+        assert results["c-1"].contact_still_active is True
+        assert results["c-1"].cost_usd == pytest.approx(
+            0.5 * (1000 * 3.0 + 100 * 15.0) / 1_000_000
+        )
+        assert results["c-2"].success is False
+        assert "expired" in results["c-2"].error
+
+    async def test_poll_retries_transient_errors(self):
+        adapter = make_adapter()
+        adapter.client.messages.batches.retrieve = AsyncMock(side_effect=[
+            make_status_error(anthropic.OverloadedError, 529),
+            MagicMock(processing_status="ended"),
+        ])
+        adapter.client.messages.batches.results = AsyncMock(return_value=aiter_of([]))
+
+        with patch("prospectkeeper.adapters.claude_adapter.asyncio.sleep", new=AsyncMock()):
+            results = await adapter.poll_research_batch("batch-1")
+
+        assert results == {}
+        assert adapter.client.messages.batches.retrieve.await_count == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Rate limiting — bounded concurrency + backoff
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestRateLimiting:
+    async def test_rate_limited_call_is_retried(self):
+        adapter = make_adapter()
+        adapter.client.messages.create.side_effect = [
+            make_status_error(anthropic.RateLimitError, 429, {"retry-after": "3"}),
+            make_api_response(active_json()),
+        ]
+
+        with patch("prospectkeeper.adapters.claude_adapter.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await adapter.research_contact("Alice", "Acme", "Director")
+
+        assert result.success is True
+        sleep.assert_awaited_once_with(3.0)
+
+    async def test_gives_up_after_max_attempts(self):
+        adapter = make_adapter()
+        adapter.client.messages.create.side_effect = make_status_error(
+            anthropic.OverloadedError, 529
+        )
+
+        with patch("prospectkeeper.adapters.claude_adapter.asyncio.sleep", new=AsyncMock()):
+            result = await adapter.research_contact("Alice", "Acme", "Director")
+
+        assert result.success is False
+        assert adapter.client.messages.create.await_count == CLAUDE_MAX_ATTEMPTS
+
+    async def test_connection_error_is_retried(self):
+        adapter = make_adapter()
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        adapter.client.messages.create.side_effect = [
+            anthropic.APIConnectionError(request=request),
+            make_api_response(active_json()),
+        ]
+
+        with patch("prospectkeeper.adapters.claude_adapter.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await adapter.research_contact("Alice", "Acme", "Director")
+
+        assert result.success is True
+        sleep.assert_awaited_once_with(1)
+
+    async def test_client_error_is_not_retried(self):
+        adapter = make_adapter()
+        adapter.client.messages.create.side_effect = make_status_error(
+            anthropic.BadRequestError, 400
+        )
+
+        result = await adapter.research_contact("Alice", "Acme", "Director")
+
+        assert result.success is False
+        assert adapter.client.messages.create.await_count == 1
+
+    async def test_concurrent_calls_capped_at_max_concurrent(self):
+        with patch("prospectkeeper.adapters.claude_adapter.anthropic.AsyncAnthropic"):
+            adapter = ClaudeAdapter(anthropic_api_key="sk-ant-test", max_concurrent=2)
+        in_flight = peak = 0
+
+        async def create(**_):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_api_response(active_json())
+
+        adapter.client.messages.create = AsyncMock(side_effect=create)
+        await asyncio.gather(*(adapter.research_contact("Alice", "Acme", "Director") for _ in range(6)))
+        assert peak == 2
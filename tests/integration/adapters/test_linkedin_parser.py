@@ -0,0 +1,138 @@
+"""
+Tests for linkedin_parser.
+
+Pure HTML → dict functions, exercised against small fixture pages that mirror
+LinkedIn's profile markup. No browser or network involved.
+"""
+
+from prospectkeeper.adapters.linkedin_parser import (
+    parse_education_details,
+    parse_profile,
+    parse_skills_details,
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def entry(title: str, subtitle: str = "", dates: str = "", desc: str = "") -> str:
+    html = (
+        '<li class="artdeco-list__item">'
+        f'<div class="hoverable-link-text t-bold"><span aria-hidden="true">{title}</span></div>'
+        '<span class="t-14 t-normal t-black--light"><span aria-hidden="true">Muted</span></span>'
+    )
+    if subtitle:
+        html += f'<span class="t-14 t-normal"><span aria-hidden="true">{subtitle}</span></span>'
+    if dates:
+        html += f'<span class="pvs-entity__caption-wrapper" aria-hidden="true">{dates}</span>'
+    if desc:
+        html += f'<div class="inline-show-more-text--is-collapsed"><span aria-hidden="true">{desc}</span></div>'
+    return html + "</li>"
+
+
+def section(section_id: str, body: str) -> str:
+    return f'<section><div id="{section_id}"></div><ul>{body}</ul></section>'
+
+
+def skill(name: str, field: str = "skill_card_skill_topic") -> str:
+    return (
+        f'<a data-field="{field}"><div class="hoverable-link-text t-bold">'
+        f'<span aria-hidden="true">{name}</span></div></a>'
+    )
+
+
+PROFILE_HTML = (
+    "<html><body>"
+    '<h1 class="t-24 v-align-middle break-words">Jane Smith</h1>'
+    '<div class="text-body-medium break-words" data-generated-suggestion-target="x">VP Ops at Acme</div>'
+    '<span class="text-body-small t-black--light break-words">London</span>'
+    + section("experience",
+              entry("VP Ops", "Acme · Full-time", "Jan 2020 - Present · 5 yrs", "Runs ops")
+              + entry("Manager", "Beta Ltd", "Jan 2015 - Dec 2019"))
+    + section("education", entry("Oxford", "BA", "2010 - 2013") + entry("No Dates School", "MSc"))
+    + '<section><div id="skills"></div>' + skill("Python") + skill("Python") + skill("SQL") + "</section>"
+    + '<a href="/in/jane/details/education/">Show all 3 educations</a>'
+    + '<a href="/in/jane/details/skills/">Show all 20 skills</a>'
+    + "</body></html>"
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# parse_profile
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestParseProfile:
+    def setup_method(self):
+        self.profile = parse_profile(PROFILE_HTML)
+
+    def test_top_card_fields(self):
+        assert self.profile["name"] == "Jane Smith"
+        assert self.profile["headline"] == "VP Ops at Acme"
+        assert self.profile["location"] == "London"
+
+    def test_experience_entries_in_page_order(self):
+        titles = [e["title"] for e in self.profile["experience"]]
+        assert titles == ["VP Ops", "Manager"]
+
+    def test_experience_company_skips_muted_subtitle(self):
+        assert self.profile["experience"][1]["company"] == "Beta Ltd"
+
+    def test_present_date_range_marks_current(self):
+        current, past = self.profile["experience"]
+        assert current["isCurrent"] is True
+        assert past["isCurrent"] is False
+
+    def test_experience_description(self):
+        assert self.profile["experience"][0]["description"] == "Runs ops"
+        assert self.profile["experience"][1]["description"] == ""
+
+    def test_education_requires_date_range(self):
+        assert self.profile["education"] == [
+            {"institution": "Oxford", "degree": "BA", "dateRange": "2010 - 2013"}
+        ]
+
+    def test_skills_are_deduplicated(self):
+        assert self.profile["skills"] == ["Python", "SQL"]
+
+    def test_detail_links(self):
+        assert self.profile["detailLinks"] == {
+            "education": "/in/jane/details/education/",
+            "skills": "/in/jane/details/skills/",
+        }
+
+    def test_missing_sections_yield_empty_lists(self):
+        profile = parse_profile("<html><body><h1 class='t-24 v-align-middle break-words'>X</h1></body></html>")
+        assert profile["name"] == "X"
+        assert profile["experience"] == []
+        assert profile["education"] == []
+        assert profile["skills"] == []
+        assert profile["detailLinks"] == {}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Detail pages
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestParseDetailPages:
+    def test_education_details_from_section(self):
+        html = section("education", entry("MIT", "PhD", "2014 - 2018") + entry("Oxford", "BA", "2010 - 2013"))
+        assert [e["institution"] for e in parse_education_details(html)] == ["MIT", "Oxford"]
+
+    def test_education_details_without_section_anchor(self):
+        html = "<ul>" + entry("MIT", "PhD", "2014 - 2018") + "</ul>"
+        assert parse_education_details(html) == [
+            {"institution": "MIT", "degree": "PhD", "dateRange": "2014 - 2018"}
+        ]
+
+    def test_skills_details_use_page_data_field(self):
+        html = (
+            skill("Go", "skill_page_skill_topic")
+            + skill("Rust", "skill_page_skill_topic")
+            + skill("Go", "skill_page_skill_topic")
+            + skill("Ignored", "skill_card_skill_topic")
+        )
+        assert parse_skills_details(html) == ["Go", "Rust"]
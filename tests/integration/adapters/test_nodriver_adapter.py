@@ -0,0 +1,89 @@
+"""
+Tests for NoDriverAdapter's browser pool.
+
+nodriver is replaced by a MagicMock module, so no Chrome is launched; the
+tests cover only how checked-out browsers are released back to the pool.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from prospectkeeper.adapters.nodriver_adapter import NoDriverAdapter, _PooledBrowser
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def make_pooled_adapter(browser) -> NoDriverAdapter:
+    """Adapter with a one-browser pool holding `browser` (None = empty slot)."""
+    adapter = NoDriverAdapter()
+    pool: asyncio.Queue = asyncio.Queue()
+    pool.put_nowait(_PooledBrowser(browser))
+    adapter._pool = pool
+    adapter._pool_size = 1
+    return adapter
+
+
+def hang_once(then=None):
+    """Side effect that blocks forever on its first call, returning `then` after.
+
+    The returned function's `started` event is set once the first call blocks.
+    """
+    started = asyncio.Event()
+
+    async def call(*args, **kwargs):
+        if not started.is_set():
+            started.set()
+            await asyncio.Event().wait()
+        return then
+
+    call.started = started
+    return call
+
+
+async def cancel_scrape(adapter: NoDriverAdapter, started: asyncio.Event) -> None:
+    """Start a scrape, cancel it once it blocks, and wait for the pool to settle."""
+    task = asyncio.create_task(
+        adapter.verify_employment("Alice", "Acme", "https://linkedin.com/in/alice")
+    )
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.gather(*adapter._recycle_tasks)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cancellation
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestCancelledScrape:
+    async def test_cancelled_scrape_recycles_its_browser(self):
+        browser = MagicMock()
+        browser.get = AsyncMock(side_effect=hang_once())
+        adapter = make_pooled_adapter(browser)
+        adapter._launch_browser = AsyncMock(return_value=MagicMock())
+
+        with patch.dict("sys.modules", {"nodriver": MagicMock()}):
+            await cancel_scrape(adapter, browser.get.side_effect.started)
+
+        browser.stop.assert_called_once()
+        assert adapter._pool.qsize() == 1
+        assert adapter._pool.get_nowait().browser is not browser
+
+    async def test_cancel_during_relaunch_keeps_the_slot(self):
+        adapter = make_pooled_adapter(None)
+        relaunched = MagicMock()
+        adapter._launch_browser = AsyncMock(side_effect=hang_once(then=relaunched))
+
+        with patch.dict("sys.modules", {"nodriver": MagicMock()}):
+            await cancel_scrape(adapter, adapter._launch_browser.side_effect.started)
+
+        assert adapter._pool.qsize() == 1
+        assert adapter._pool.get_nowait().browser is relaunched
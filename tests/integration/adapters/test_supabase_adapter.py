@@ -9,10 +9,11 @@ We test that:
 """
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 import pytest
 
 from prospectkeeper.adapters.supabase_adapter import (
+    ITER_PAGE_SIZE,
     SupabaseAdapter,
     _contact_to_row,
     _row_to_contact,
@@ -79,6 +80,8 @@ def chained_execute(return_data: list) -> MagicMock:
     chain.neq.return_value = chain
     chain.eq.return_value = chain
     chain.limit.return_value = chain
+    chain.order.return_value = chain
+    chain.range.return_value = chain
     chain.upsert.return_value = chain
     chain.insert.return_value = chain
 
@@ -281,6 +284,149 @@ class TestGetAllContacts:
         chain.neq.assert_called_once_with("status", "opted_out")
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# get_all_contacts_with_freshness
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestGetAllContactsWithFreshness:
+    async def test_reads_contacts_and_freshness_from_the_view(self):
+        adapter, client = make_adapter()
+        row = {**make_db_row(), "last_scraped_at": "2025-02-01T00:00:00+00:00", "last_changed_at": None}
+        chain = chained_execute([row])
+        client.table.return_value = chain
+
+        rows = await adapter.get_all_contacts_with_freshness()
+
+        client.table.assert_called_once_with("contacts_with_freshness")
+        chain.neq.assert_called_once_with("status", "opted_out")
+        contact, freshness = rows[0]
+        assert contact.name == "Jane Smith"
+        assert freshness == {"last_scraped_at": "2025-02-01T00:00:00+00:00", "last_changed_at": None}
+
+    async def test_falls_back_to_two_queries_without_the_view(self):
+        adapter, client = make_adapter()
+        view = MagicMock()
+        view.select.return_value.neq.return_value.execute.side_effect = Exception("relation does not exist")
+        freshness_row = {"contact_id": "id-001", "last_scraped_at": "2025-02-01T00:00:00+00:00"}
+        tables = {
+            "contacts_with_freshness": view,
+            "contacts": chained_execute([make_db_row(), make_db_row(contact_id="id-002")]),
+            "contact_linkedin_freshness": chained_execute([freshness_row]),
+        }
+        client.table.side_effect = tables.__getitem__
+
+        rows = await adapter.get_all_contacts_with_freshness()
+
+        assert [(c.id, f.get("last_scraped_at")) for c, f in rows] == [
+            ("id-001", "2025-02-01T00:00:00+00:00"),
+            ("id-002", None),
+        ]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# get_contacts
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestGetContacts:
+    async def test_applies_limit(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.get_contacts(limit=25)
+        chain.limit.assert_called_once_with(25)
+
+    async def test_excludes_opted_out(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.get_contacts()
+        chain.neq.assert_called_once_with("status", "opted_out")
+
+    async def test_filters_on_status_when_given(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.get_contacts(status="active")
+        chain.eq.assert_called_once_with("status", "active")
+
+    async def test_no_status_filter_by_default(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.get_contacts()
+        chain.eq.assert_not_called()
+
+    async def test_with_email_excludes_blank_emails(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.get_contacts(with_email=True)
+        chain.neq.assert_any_call("email", "")
+
+    async def test_maps_returned_rows(self):
+        adapter, client = make_adapter()
+        rows = [make_db_row(contact_id=f"id-{i}") for i in range(3)]
+        chain = chained_execute(rows)
+        client.table.return_value = chain
+
+        contacts = await adapter.get_contacts()
+        assert len(contacts) == 3
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# iter_contacts
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestIterContacts:
+    async def test_pages_until_a_short_page(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        full = MagicMock(data=[make_db_row(contact_id=f"id-{i}") for i in range(ITER_PAGE_SIZE)])
+        short = MagicMock(data=[make_db_row(contact_id="last")])
+        chain.execute.side_effect = [full, short]
+        client.table.return_value = chain
+
+        contacts = [c async for c in adapter.iter_contacts()]
+
+        assert len(contacts) == ITER_PAGE_SIZE + 1
+        assert chain.range.call_args_list == [
+            call(0, ITER_PAGE_SIZE - 1),
+            call(ITER_PAGE_SIZE, 2 * ITER_PAGE_SIZE - 1),
+        ]
+
+    async def test_limit_caps_the_last_page(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([make_db_row(contact_id=f"id-{i}") for i in range(25)])
+        client.table.return_value = chain
+
+        contacts = [c async for c in adapter.iter_contacts(limit=25)]
+
+        assert len(contacts) == 25
+        chain.range.assert_called_once_with(0, 24)
+
+    async def test_applies_filters_in_the_query(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        [c async for c in adapter.iter_contacts(with_email=True, needs_review=True)]
+
+        chain.neq.assert_any_call("status", "opted_out")
+        chain.neq.assert_any_call("email", "")
+        chain.eq.assert_called_once_with("needs_human_review", True)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # get_contacts_for_verification
 # ─────────────────────────────────────────────────────────────────────────────
@@ -558,3 +704,34 @@ class TestInsertContact:
         inserted_row = chain.insert.call_args[0][0]
         assert "created_at" in inserted_row
         datetime.fromisoformat(inserted_row["created_at"])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# bulk_insert_contacts
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestBulkInsertContacts:
+    async def test_calls_insert_once_with_list_of_rows(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        contacts = [make_contact(contact_id=f"id-{i}", name=f"C{i}") for i in range(3)]
+        await adapter.bulk_insert_contacts(contacts)
+
+        client.table.assert_called_with("contacts")
+        chain.insert.assert_called_once()
+        rows = chain.insert.call_args[0][0]
+        assert [r["id"] for r in rows] == ["id-0", "id-1", "id-2"]
+
+    async def test_every_row_includes_created_at(self):
+        adapter, client = make_adapter()
+        chain = chained_execute([])
+        client.table.return_value = chain
+
+        await adapter.bulk_insert_contacts([make_contact(name=f"C{i}") for i in range(2)])
+
+        for row in chain.insert.call_args[0][0]:
+            datetime.fromisoformat(row["created_at"])
@@ -21,6 +21,14 @@ REQUIRED_ENV = {
 }
 
 
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """from_env() is memoised — drop the cached Config around each test."""
+    Config.from_env.cache_clear()
+    yield
+    Config.from_env.cache_clear()
+
+
 def set_required_env(monkeypatch):
     """Set all required environment variables."""
     for key, val in REQUIRED_ENV.items():
@@ -73,6 +81,14 @@ class TestConfigFromEnvSuccess:
         with pytest.raises(Exception):  # FrozenInstanceError is a subclass of AttributeError
             config.supabase_url = "something-else"  # type: ignore
 
+    def test_repeated_calls_return_the_cached_config(self, monkeypatch):
+        set_required_env(monkeypatch)
+        config = Config.from_env()
+        monkeypatch.setenv("BATCH_LIMIT", "99")
+        assert Config.from_env() is config
+        Config.from_env.cache_clear()
+        assert Config.from_env().batch_limit == 99
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Missing required variables
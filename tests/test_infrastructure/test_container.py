@@ -92,3 +92,8 @@ class TestContainerWiring:
     def test_verify_use_case_uses_same_ai(self):
         container = make_container()
         assert container.verify_use_case.ai is container.ai
+
+    def test_email_sender_uses_shared_http_client(self):
+        """Resend sends go through the container's pooled client, not a private one."""
+        container = make_container()
+        assert container.email_sender._http is container.http
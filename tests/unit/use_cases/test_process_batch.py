@@ -12,6 +12,8 @@ Verifies:
 - Concurrency limits honoured
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
@@ -448,3 +450,32 @@ class TestReceiptGeneration:
         ]
         response = await batch_use_case.execute(ProcessBatchRequest())
         assert response.receipt.contacts_processed == 2
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Concurrency
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+class TestConcurrency:
+    async def test_never_more_than_concurrency_verifications_in_flight(
+        self, batch_use_case, mock_repository, mock_verify_use_case
+    ):
+        contacts = [make_contact(name=f"C{i}") for i in range(10)]
+        mock_repository.get_contacts_for_verification.return_value = contacts
+        in_flight = peak = 0
+
+        async def side_effect(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_active_result(request.contact)
+
+        mock_verify_use_case.execute.side_effect = side_effect
+
+        response = await batch_use_case.execute(ProcessBatchRequest(concurrency=3))
+        assert peak == 3
+        assert len(response.results) == 10